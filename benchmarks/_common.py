@@ -0,0 +1,112 @@
+"""
+Helpers shared by the benchmarks: timing, memory measurement and the command line.
+
+Importing this module adds the repository to `sys.path`, so the benchmarks import the package from the checkout.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+
+__all__ = ['ROOT', 'LAYOUTS', 'best', 'best_loop', 'allocated', 'peak_memory', 'report', 'write_results',
+           'command_line']
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Instance layouts as dataclass keyword arguments
+LAYOUTS = {'dict': {}}
+if sys.version_info >= (3, 10):  # slots=True and storage='compact' require Python 3.10
+    LAYOUTS.update({'slots': {'slots': True}, 'compact': {'storage': 'compact'}})
+
+
+def best(func, number=1, repeat=5):
+    """Call `func()` `number` times per repeat and return the best time per call in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def best_loop(func, number, repeat=5):
+    """Return the best time per loop in seconds of `func(number)`, which runs its own loop `number` times.
+
+    The loop in `func` avoids timing an extra function call for every operation.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(number)
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def allocated(func):
+    """Return the result of func and the number of bytes it allocated (and kept)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def peak_memory(func):
+    """Return the peak number of bytes allocated while func runs."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(benchmark, results):
+    """Return the JSON data of a benchmark run."""
+    return {'meta': {'python': sys.version, 'benchmark': benchmark}, 'results': results}
+
+
+def write_results(data, filename):
+    """Write the JSON data of a benchmark run if a filename is given."""
+    if filename:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def command_line(run, doc, argv=None, choices=None, **options):
+    """Run a benchmark from the command line and return the exit code.
+
+    Every option becomes a command line argument `--<name>` with the type of its default. Lists take one or more
+    values. The values are passed to `run` in order with `verbose=True` and the results are written to `--output`.
+
+    Args:
+        run (function): Run the benchmark and return its JSON data.
+        doc (str): Module docstring. The first line is the description.
+        argv (list)[None]: Command line arguments.
+        choices (dict)[None]: {option name: allowed values}.
+        **options: {option name: default}.
+    """
+    choices = choices or {}
+    parser = argparse.ArgumentParser(description=doc.strip().splitlines()[0])
+    parser.add_argument('--output', '-o', default=None)
+    for name, default in options.items():
+        if isinstance(default, (list, tuple)):
+            parser.add_argument('--' + name, type=type(default[0]), nargs='+', default=list(default),
+                                choices=choices.get(name, None))
+        else:
+            parser.add_argument('--' + name, type=type(default), default=default, choices=choices.get(name, None))
+    args = parser.parse_args(argv)
+
+    data = run(*(getattr(args, name) for name in options), verbose=True)
+    write_results(data, args.output)
+    return 0
@@ -0,0 +1,84 @@
+"""
+Benchmark DataclassArray against a list of instances.
+
+Measures the memory for the records (with tracemalloc), summing a column, filtering, assigning a validated column
+and converting back to instances.
+
+Usage:
+    python benchmarks/bench_array.py --output results.json
+"""
+import sys
+
+from _common import allocated, best, report, command_line
+from dataclass_property import dataclass, field_property, DataclassArray
+
+
+__all__ = ['Point', 'bench_size', 'run', 'main']
+
+
+@dataclass
+class Point:
+    x: int = 0
+
+    @field_property(default=0.0)
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        if value < 0:
+            raise ValueError('y must be positive')
+        self._y = float(value)
+
+    @y.vectorized
+    def y(self, values):
+        if min(values, default=0) < 0:
+            raise ValueError('y must be positive')
+        self._y = [float(value) for value in values]
+
+
+def bench_size(size, repeat=3, backend='array'):
+    instances, list_bytes = allocated(lambda: [Point(i, i / 2) for i in range(size)])
+    points, array_bytes = allocated(lambda: DataclassArray[Point](instances, backend=backend))
+    values = [float(i) for i in range(size)]
+
+    def set_list():
+        for p, value in zip(instances, values):
+            p.y = value
+
+    return {
+        'size': size,
+        'backend': backend,
+        'bytes': {'list': list_bytes, 'array': array_bytes},
+        'sum': {'list': best(lambda: sum(p.y for p in instances), repeat=repeat),
+                'array': best(lambda: sum(points.column('_y')), repeat=repeat)},
+        'filter': {'list': best(lambda: [p for p in instances if p.x % 2], repeat=repeat),
+                   'array': best(lambda: points.filter([x % 2 for x in points.column('x')]), repeat=repeat)},
+        'set_column': {'list': best(set_list, repeat=repeat),
+                       'array': best(lambda: points.set_column('y', values), repeat=repeat)},
+        'to_instances': {'list': best(lambda: [Point(p.x, p.y) for p in instances], repeat=repeat),
+                         'array': best(points.to_instances, repeat=repeat)},
+        }
+
+
+def run(sizes=(10000, 100000), repeat=3, backend='array', verbose=False):
+    results = []
+    for size in sizes:
+        item = bench_size(size, repeat, backend)
+        results.append(item)
+        if verbose:
+            print('{} records: {:.1f} MB as instances, {:.1f} MB as columns'.format(
+                size, item['bytes']['list'] / 1e6, item['bytes']['array'] / 1e6))
+            for name in ('sum', 'filter', 'set_column', 'to_instances'):
+                print('    {:<14} list {:9.2f} ms, array {:9.2f} ms'.format(
+                    name, item[name]['list'] * 1e3, item[name]['array'] * 1e3))
+    return report('array', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, choices={'backend': ('array', 'numpy')},
+                        sizes=[10000, 100000], repeat=3, backend='array')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark the generated `_asdict`/`_astuple` methods against `dataclasses.asdict`/`astuple`.
+
+A flat record with property fields and a nested record (a list of flat records and a dict) are converted with
+every mode.
+
+Usage:
+    python benchmarks/bench_asdict.py --output results.json
+"""
+import sys
+
+from _common import best, report, command_line
+from dataclass_property import dataclass, field_property, field, asdict, astuple
+
+
+__all__ = ['Point', 'Shape', 'make_objects', 'run', 'main']
+
+
+@dataclass(convert=True)
+class Point:
+    x: int = 0
+    name: str = ''
+
+    @field_property(default=0.0)
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = float(value)
+
+
+@dataclass(convert=True)
+class Shape:
+    name: str = ''
+    points: list = field(default_factory=list)
+    attrs: dict = field(default_factory=dict)
+
+
+def make_objects():
+    point = Point(1, 'a', 2.0)
+    shape = Shape('triangle', [Point(i, str(i), i / 2) for i in range(3)], {'color': 'red', 'size': 3})
+    return {'flat': point, 'nested': shape}
+
+
+def run(number=10000, repeat=5, verbose=False):
+    results = []
+    for name, obj in make_objects().items():
+        item = {'object': name,
+                'dataclasses.asdict': best(lambda: asdict(obj), number, repeat),
+                'dataclasses.astuple': best(lambda: astuple(obj), number, repeat),
+                }
+        for mode in ('shallow', 'storage', 'recursive'):
+            item['_asdict_' + mode] = best(lambda: obj._asdict(mode), number, repeat)
+            item['_astuple_' + mode] = best(lambda: obj._astuple(mode), number, repeat)
+        results.append(item)
+        if verbose:
+            print('{}:'.format(name))
+            for key, value in item.items():
+                if key != 'object':
+                    print('    {:<22} {:7.2f} us'.format(key, value * 1e6))
+    return report('asdict', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, number=10000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark walking packed records with DataclassBuffer row views.
+
+The views read the values in place, so the memory does not grow with the number of records. They are compared with
+decoding every record (`iter_unpack`) and with unpickling a list of instances. The peak memory is measured with
+tracemalloc (the packed buffer itself is not counted).
+
+Usage:
+    python benchmarks/bench_buffer.py --output results.json
+"""
+import sys
+import pickle
+
+from _common import best, peak_memory, report, command_line
+import dataclass_property
+from dataclass_property import DataclassBuffer
+
+
+__all__ = ['make_class', 'METHODS', 'bench_records', 'run', 'main']
+
+
+def make_class(**kwargs):
+    @dataclass_property.dataclass(codec=True, **kwargs)
+    class Reading:
+        timestamp: int = 0
+        ok: bool = True
+
+        @dataclass_property.field_property(default=0.0)
+        def value(self) -> float:
+            return self._value
+
+        @value.setter
+        def value(self, value):
+            if value < 0:
+                raise ValueError('value must be positive')
+            self._value = float(value)
+
+    # Pickle finds the class by name in this module
+    Reading.__qualname__ = Reading.__name__
+    Reading.__module__ = __name__
+    globals()['Reading'] = Reading
+    return Reading
+
+
+def walk_views(cls, data, pickled):
+    return sum(r.value for r in DataclassBuffer[cls](data))
+
+
+def walk_unpacked(cls, data, pickled):
+    return sum(r.value for r in cls.iter_unpack(data, validate=False))
+
+
+def walk_unpickled(cls, data, pickled):
+    return sum(r.value for r in pickle.loads(pickled))
+
+
+METHODS = {
+    'views': walk_views,
+    'iter_unpack': walk_unpacked,
+    'pickle': walk_unpickled,
+    }
+
+
+def bench_records(n, number=1, repeat=3):
+    kwargs = {'slots': True} if sys.version_info >= (3, 10) else {}
+    cls = make_class(**kwargs)
+    records = [cls(i, True, i * 0.5) for i in range(n)]
+    data = cls.pack_many(records)
+    pickled = pickle.dumps(records, pickle.HIGHEST_PROTOCOL)
+    del records
+
+    results = {}
+    expected = None
+    for name, method in METHODS.items():
+        total = method(cls, data, pickled)
+        assert expected is None or total == expected
+        expected = total
+        results[name] = {'time': best(lambda: method(cls, data, pickled), number, repeat),
+                         'peak_memory': peak_memory(lambda: method(cls, data, pickled))}
+    return results
+
+
+def run(counts=(100000,), number=1, repeat=3, verbose=False):
+    results = []
+    for n in counts:
+        for name, item in bench_records(n, number, repeat).items():
+            item.update({'records': n, 'method': name})
+            results.append(item)
+            if verbose:
+                print('{:>9} records {:<12} {:9.2f} ms, peak memory {:10.1f} KiB'.format(
+                    n, name, item['time'] * 1e3, item['peak_memory'] / 1024))
+    return report('buffer', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, records=[100000, 1000000], number=1, repeat=3)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Benchmark the bulk constructors (`from_records`, `from_columns`) against calling the class for every row.
+
+Compares `[cls(**row) for row in dicts]`, `[cls(*row) for row in tuples]`, `cls.from_records(...)` and
+`cls.from_columns(...)` with and without a vectorized setter.
+
+Usage:
+    python benchmarks/bench_bulk.py --output results.json
+"""
+import sys
+
+from _common import best, report, command_line
+from dataclass_property import dataclass, field_property
+
+
+__all__ = ['Point', 'VectorPoint', 'bench_size', 'run', 'main']
+
+
+@dataclass(bulk=True)
+class Point:
+    x: int = 0
+    z: float = field_property(default=0.0, passthrough=True)
+
+    @field_property(default=0.0)
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        if value < 0:
+            raise ValueError('y must be positive')
+        self._y = float(value)
+
+
+@dataclass
+class VectorPoint(Point):
+    @field_property(default=0.0)
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        if value < 0:
+            raise ValueError('y must be positive')
+        self._y = float(value)
+
+    @y.vectorized
+    def y(self, values):
+        if min(values, default=0) < 0:
+            raise ValueError('y must be positive')
+        self._y = [float(value) for value in values]
+
+
+def bench_size(size, repeat=5):
+    dicts = [{'x': i, 'z': i / 2, 'y': i / 4} for i in range(size)]
+    tuples = [(row['x'], row['z'], row['y']) for row in dicts]
+    columns = {name: [row[name] for row in dicts] for name in ('x', 'z', 'y')}
+
+    return {
+        'size': size,
+        'init_dicts': best(lambda: [Point(**row) for row in dicts], repeat=repeat),
+        'init_tuples': best(lambda: [Point(*row) for row in tuples], repeat=repeat),
+        'from_records_dicts': best(lambda: Point.from_records(dicts), repeat=repeat),
+        'from_records_tuples': best(lambda: Point.from_records(tuples), repeat=repeat),
+        'from_columns': best(lambda: Point.from_columns(**columns), repeat=repeat),
+        'from_columns_vectorized': best(lambda: VectorPoint.from_columns(**columns), repeat=repeat),
+        }
+
+
+def run(sizes=(1000, 100000), repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        item = bench_size(size, repeat)
+        results.append(item)
+        if verbose:
+            print('{} rows:'.format(size))
+            for name, value in item.items():
+                if name != 'size':
+                    print('    {:<24} {:9.2f} ms'.format(name, value * 1e3))
+    return report('bulk', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[1000, 100000], repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Benchmark the generated binary codec against asdict and JSON for numeric telemetry records.
+
+The records are encoded with `pack_many` and decoded with `iter_unpack` (with and without running the property
+setters). JSON encodes `asdict` of every record and decodes with `from_dict`.
+
+Usage:
+    python benchmarks/bench_codec.py --output results.json
+"""
+import sys
+import json
+
+from _common import LAYOUTS as STORAGE, best, report, command_line
+import dataclass_property
+
+
+__all__ = ['STORAGE', 'make_class', 'make_records', 'bench_size', 'run', 'main']
+
+
+def class_source(size):
+    lines = ['class Telemetry:',
+             '    timestamp: int = 0',
+             '    ok: bool = True']
+    for i in range(size):
+        lines.extend([
+            '    @field_property(default=0.0)',
+            '    def f{0}(self) -> float:'.format(i),
+            '        return self._f{0}'.format(i),
+            '    @f{0}.setter'.format(i),
+            '    def f{0}(self, value):'.format(i),
+            '        self._f{0} = float(value)'.format(i),
+            ])
+    return '\n'.join(lines)
+
+
+def make_class(size, **kwargs):
+    ns = {'field_property': dataclass_property.field_property}
+    exec(class_source(size), ns)
+    return dataclass_property.dataclass(decode=True, codec=True, **kwargs)(ns['Telemetry'])
+
+
+def make_records(cls, size, n):
+    return [cls(timestamp=i, **{'f{}'.format(j): i * 0.25 + j for j in range(size)}) for i in range(n)]
+
+
+def bench_size(size, storage='dict', n=1000, number=5, repeat=5):
+    cls = make_class(size, **STORAGE[storage])
+    records = make_records(cls, size, n)
+    asdict = dataclass_property.asdict
+
+    def json_dumps():
+        return json.dumps([asdict(r) for r in records])
+
+    def json_loads(text):
+        return [cls.from_dict(d) for d in json.loads(text)]
+
+    text = json_dumps()
+    data = cls.pack_many(records)
+    assert json_loads(text) == records == list(cls.iter_unpack(data))
+    return {'json_bytes': len(text.encode()),
+            'packed_bytes': len(data),
+            'json_encode': best(json_dumps, number, repeat),
+            'json_decode': best(lambda: json_loads(text), number, repeat),
+            'pack_many': best(lambda: cls.pack_many(records), number, repeat),
+            'iter_unpack': best(lambda: list(cls.iter_unpack(data)), number, repeat),
+            'iter_unpack_trusted': best(lambda: list(cls.iter_unpack(data, validate=False)), number, repeat),
+            }
+
+
+def run(sizes=(10, 50), n=1000, number=5, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        for storage in STORAGE:
+            item = {'size': size, 'storage': storage, 'records': n}
+            item.update(bench_size(size, storage, n, number, repeat))
+            results.append(item)
+            if verbose:
+                print('{:>4} fields {:<8} json {:>8} bytes, encode {:8.2f} ms, decode {:8.2f} ms | '
+                      'packed {:>8} bytes, encode {:8.2f} ms, decode {:8.2f} ms ({:.2f} ms trusted)'.format(
+                        size, storage, item['json_bytes'], item['json_encode'] * 1e3, item['json_decode'] * 1e3,
+                        item['packed_bytes'], item['pack_many'] * 1e3, item['iter_unpack'] * 1e3,
+                        item['iter_unpack_trusted'] * 1e3))
+    return report('codec', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[10, 50], records=1000, number=5, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Benchmark compact instance storage (`dataclass(storage='compact')`) against `__dict__` and slots instances.
+
+Measures the memory per instance (with tracemalloc) and the time of `__init__`, `__eq__`, `__hash__` and
+`_astuple`/`astuple` for classes with property fields.
+
+Usage:
+    python benchmarks/bench_compact.py --output results.json
+"""
+import sys
+
+from _common import LAYOUTS, allocated, best_loop, report, command_line
+import dataclass_property
+
+
+__all__ = ['LAYOUTS', 'make_class', 'measure_memory', 'bench_layout', 'run', 'main']
+
+
+def class_source(size):
+    lines = ['class Record:']
+    for i in range(size):
+        if i % 2:
+            lines.append('    f{0}: int = 0'.format(i))
+        else:
+            lines.extend([
+                '    @field_property(default=0)',
+                '    def f{0}(self) -> int:'.format(i),
+                '        return self._f{0}'.format(i),
+                '    @f{0}.setter'.format(i),
+                '    def f{0}(self, value):'.format(i),
+                '        self._f{0} = value'.format(i),
+                ])
+    return '\n'.join(lines)
+
+
+def make_class(layout, size):
+    ns = {'field_property': dataclass_property.field_property}
+    exec(class_source(size), ns)
+    return dataclass_property.dataclass(unsafe_hash=True, convert=True, **LAYOUTS[layout])(ns['Record'])
+
+
+def measure_memory(cls, args, count=10000):
+    """Return the average number of bytes allocated per instance."""
+    _, size = allocated(lambda: [cls(*args) for _ in range(count)])
+    return size / count
+
+
+def bench_layout(layout, size, number=10000, repeat=5):
+    cls = make_class(layout, size)
+    args = tuple(range(1000, 1000 + size))  # Not cached small ints
+    obj, other = cls(*args), cls(*args)
+    astuple = getattr(cls, '_astuple', None) or dataclass_property.astuple
+
+    def construct(n):
+        for _ in range(n):
+            cls(*args)
+
+    def eq(n):
+        for _ in range(n):
+            obj == other
+
+    def hash_(n):
+        for _ in range(n):
+            hash(obj)
+
+    def to_tuple(n):
+        for _ in range(n):
+            astuple(obj)
+
+    return {'bytes': measure_memory(cls, args),
+            'init': best_loop(construct, number, repeat),
+            'eq': best_loop(eq, number, repeat),
+            'hash': best_loop(hash_, number, repeat),
+            'astuple': best_loop(to_tuple, number, repeat)}
+
+
+def run(sizes=(4, 16), number=10000, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        for layout in LAYOUTS:
+            item = {'size': size, 'layout': layout}
+            item.update(bench_layout(layout, size, number, repeat))
+            results.append(item)
+            if verbose:
+                print('{:>4} fields {:<8} {:8.1f} bytes, init {:6.2f} us, eq {:6.2f} us, hash {:6.2f} us, '
+                      'astuple {:6.2f} us'.format(size, layout, item['bytes'], item['init'] * 1e6, item['eq'] * 1e6,
+                                                  item['hash'] * 1e6, item['astuple'] * 1e6))
+    return report('compact', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[4, 16], number=10000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
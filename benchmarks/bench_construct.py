@@ -0,0 +1,79 @@
+"""
+Benchmark the trusted `_construct(**values)` classmethod against the normal constructor.
+
+The record class has validating property setters. `_construct` writes the values to the backing attributes
+without running the setters. Each layout (`__dict__`, slots, compact) is measured. The setters only do a type check,
+so the difference is small (0.9-1.5x): `_construct` skips validation, it is not a faster constructor.
+
+Usage:
+    python benchmarks/bench_construct.py --output results.json
+"""
+import sys
+
+from _common import LAYOUTS, best_loop, report, command_line
+import dataclass_property
+
+
+__all__ = ['LAYOUTS', 'make_class', 'bench_layout', 'run', 'main']
+
+
+def class_source(size):
+    lines = ['class Record:']
+    for i in range(size):
+        if i % 2:
+            lines.append('    f{0}: int = 0'.format(i))
+        else:
+            lines.extend([
+                '    @field_property(default=0)',
+                '    def f{0}(self) -> int:'.format(i),
+                '        return self._f{0}'.format(i),
+                '    @f{0}.setter'.format(i),
+                '    def f{0}(self, value):'.format(i),
+                '        if not isinstance(value, int) or value < 0:',
+                '            raise ValueError("f{0} must be a positive int")'.format(i),
+                '        self._f{0} = value'.format(i),
+                ])
+    return '\n'.join(lines)
+
+
+def make_class(layout, size):
+    ns = {'field_property': dataclass_property.field_property}
+    exec(class_source(size), ns)
+    return dataclass_property.dataclass(construct=True, **LAYOUTS[layout])(ns['Record'])
+
+
+def bench_layout(layout, size, number=10000, repeat=5):
+    cls = make_class(layout, size)
+    values = {'f{}'.format(i): 1000 + i for i in range(size)}
+    construct = cls._construct
+
+    def init(n):
+        for _ in range(n):
+            cls(**values)
+
+    def trusted(n):
+        for _ in range(n):
+            construct(**values)
+
+    return {'init': best_loop(init, number, repeat), '_construct': best_loop(trusted, number, repeat)}
+
+
+def run(sizes=(4, 16), number=10000, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        for layout in LAYOUTS:
+            item = {'size': size, 'layout': layout}
+            item.update(bench_layout(layout, size, number, repeat))
+            results.append(item)
+            if verbose:
+                print('{:>4} fields {:<8} init {:6.2f} us, _construct {:6.2f} us ({:.1f}x)'.format(
+                    size, layout, item['init'] * 1e6, item['_construct'] * 1e6, item['init'] / item['_construct']))
+    return report('construct', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[4, 16], number=10000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+Benchmark dataclass_property against the standard library dataclasses.
+
+Measures the decorator (class creation) time and the runtime cost of the generated methods for classes with
+5 to 500 fields. Results are written as JSON so two runs can be compared to catch regressions between releases.
+
+Usage:
+    python benchmarks/bench_dataclass.py --output results.json
+    python benchmarks/bench_dataclass.py --quick --compare baseline.json results.json
+"""
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import dataclasses
+
+from _common import write_results
+import dataclass_property
+
+
+__all__ = ['SIZES', 'KINDS', 'VARIANTS', 'IMPLEMENTATIONS', 'make_class', 'bench_case', 'run', 'compare', 'main']
+
+
+SIZES = (5, 20, 100, 500)
+KINDS = ('plain', 'field_property')
+VARIANTS = ('default', 'slots', 'frozen', 'inheritance', 'lazy')
+IMPLEMENTATIONS = {
+    'dataclasses': dataclasses.dataclass,
+    'dataclass_property': dataclass_property.dataclass,
+    }
+
+
+def is_supported(impl, kind, variant):
+    """Return if the implementation can build the given kind of class."""
+    if impl == 'dataclasses' and kind == 'field_property':
+        return False  # Properties are not fields for the standard library
+    if impl == 'dataclasses' and variant == 'lazy':
+        return False  # lazy_methods is only an option of dataclass_property
+    if variant == 'slots' and sys.version_info < (3, 10):
+        return False  # slots=True requires Python 3.10
+    return True
+
+
+def class_source(name, start, stop, kind, frozen=False, base=None):
+    """Return the source code for an undecorated class with the fields f<start> to f<stop - 1>."""
+    lines = ['class {}({}):'.format(name, base or 'object')]
+    for i in range(start, stop):
+        if kind == 'plain':
+            lines.append('    f{0}: int = {0}'.format(i))
+        else:
+            if frozen:
+                assign = "object.__setattr__(self, '_f{0}', value)".format(i)
+            else:
+                assign = 'self._f{0} = value'.format(i)
+            lines.extend([
+                '    @field_property(default={0})'.format(i),
+                '    def f{0}(self) -> int:'.format(i),
+                '        return self._f{0}'.format(i),
+                '    @f{0}.setter'.format(i),
+                '    def f{0}(self, value: int):'.format(i),
+                '        {}'.format(assign),
+                ])
+    if start == stop:
+        lines.append('    pass')
+    return '\n'.join(lines)
+
+
+def make_class(impl, kind, variant, size, decorate=True):
+    """Create a class with `size` fields.
+
+    Args:
+        impl (str): Name of the implementation in IMPLEMENTATIONS.
+        kind (str): 'plain' for annotated attributes or 'field_property' for properties with a getter and setter.
+        variant (str): 'default', 'slots', 'frozen', 'inheritance' or 'lazy'.
+        size (int): Total number of fields.
+        decorate (bool)[True]: If False return the undecorated class and the decorator keyword arguments.
+
+    Returns:
+        cls (type): The decorated class or (cls, decorator, kwargs) if decorate is False.
+    """
+    decorator = IMPLEMENTATIONS[impl]
+    kwargs = {}
+    if variant == 'slots':
+        kwargs['slots'] = True
+    elif variant == 'frozen':
+        kwargs['frozen'] = True
+    elif variant == 'lazy':
+        kwargs['lazy_methods'] = True
+
+    ns = {'field_property': dataclass_property.field_property}
+    start = 0
+    base = None
+    if variant == 'inheritance':
+        start = size // 2
+        exec(class_source('Base', 0, start, kind), ns)
+        ns['Base'] = decorator(ns['Base'])
+        base = 'Base'
+    exec(class_source('Bench{}'.format(size), start, size, kind, frozen=kwargs.get('frozen', False), base=base), ns)
+    cls = ns['Bench{}'.format(size)]
+    if not decorate:
+        return cls, decorator, kwargs
+    return decorator(**kwargs)(cls)
+
+
+def _best(timer, number, repeat):
+    """Return the best time per operation in seconds."""
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bench_case(impl, kind, variant, size, repeat=5, number=None):
+    """Run every benchmark for one class configuration.
+
+    Returns:
+        results (dict): Mapping of benchmark name to the best seconds per operation.
+    """
+    if number is None:
+        number = max(10, 20000 // size)
+    results = {}
+
+    # Decorator time. Each decoration needs a fresh class, so only time the decorator call.
+    timings = []
+    for _ in range(repeat):
+        classes = [make_class(impl, kind, variant, size, decorate=False) for _ in range(max(1, number // 50))]
+        start = time.perf_counter()
+        for cls, decorator, kwargs in classes:
+            decorator(**kwargs)(cls)
+        timings.append((time.perf_counter() - start) / len(classes))
+    results['decorate'] = min(timings)
+
+    cls = make_class(impl, kind, variant, size)
+    obj = cls()
+    other = cls()
+    args = tuple(range(size))
+    ns = {'cls': cls, 'obj': obj, 'other': other, 'args': args, 'dataclasses': dataclasses}
+
+    def timer(stmt):
+        return _best(timeit.Timer(stmt, globals=ns), number, repeat)
+
+    results['init_defaults'] = timer('cls()')
+    results['init_args'] = timer('cls(*args)')
+    results['getattr'] = timer('obj.f0')
+    if variant != 'frozen':
+        results['setattr'] = timer('obj.f0 = 1')
+    results['asdict'] = timer('dataclasses.asdict(obj)')
+    results['astuple'] = timer('dataclasses.astuple(obj)')
+    results['replace'] = timer('dataclasses.replace(obj, f0=1)')
+    results['eq'] = timer('obj == other')
+    results['repr'] = timer('repr(obj)')
+    return results
+
+
+def run(sizes=SIZES, kinds=KINDS, variants=VARIANTS, impls=tuple(IMPLEMENTATIONS), repeat=5, number=None,
+        verbose=False):
+    """Run the benchmark matrix.
+
+    Returns:
+        data (dict): JSON serializable dictionary with a "meta" and "results" key.
+    """
+    results = []
+    for size in sizes:
+        for kind in kinds:
+            for variant in variants:
+                for impl in impls:
+                    if not is_supported(impl, kind, variant):
+                        continue
+                    case = bench_case(impl, kind, variant, size, repeat=repeat, number=number)
+                    for bench, seconds in case.items():
+                        results.append({'impl': impl, 'kind': kind, 'variant': variant, 'size': size,
+                                        'benchmark': bench, 'seconds': seconds})
+                        if verbose:
+                            print('{:>20} {:>15} {:>12} {:>4} {:>14} {:10.3f} us'.format(
+                                impl, kind, variant, size, bench, seconds * 1e6))
+    return {'meta': {'python': sys.version,
+                     'implementation': platform.python_implementation(),
+                     'platform': platform.platform(),
+                     'dataclass_property': dataclass_property.__version__,
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'results': results}
+
+
+def _result_key(item):
+    return item['impl'], item['kind'], item['variant'], item['size'], item['benchmark']
+
+
+def compare(baseline, current, threshold=0.2):
+    """Compare two result dictionaries.
+
+    Args:
+        baseline (dict): Results from a previous run.
+        current (dict): Results from this run.
+        threshold (float)[0.2]: Relative slow down that counts as a regression.
+
+    Returns:
+        regressions (list): List of (key, baseline seconds, current seconds, ratio) that got slower than threshold.
+    """
+    old = {_result_key(item): item['seconds'] for item in baseline['results']}
+    regressions = []
+    for item in current['results']:
+        key = _result_key(item)
+        if key in old and old[key] > 0:
+            ratio = item['seconds'] / old[key]
+            if ratio > 1 + threshold:
+                regressions.append((key, old[key], item['seconds'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', '-o', default=None, help='JSON file to write the results to.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--kinds', nargs='+', default=list(KINDS), choices=KINDS)
+    parser.add_argument('--variants', nargs='+', default=list(VARIANTS), choices=VARIANTS)
+    parser.add_argument('--impls', nargs='+', default=list(IMPLEMENTATIONS), choices=list(IMPLEMENTATIONS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=None, help='Loops per timing (default scales with size).')
+    parser.add_argument('--quick', action='store_true', help='Small sizes and few repeats.')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), default=None,
+                        help='Compare two result files instead of running the benchmarks.')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Relative slow down counted as a regression.')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for key, old, new, ratio in regressions:
+            print('{}: {:.3f} us -> {:.3f} us ({:.2f}x)'.format('/'.join(map(str, key)), old * 1e6, new * 1e6, ratio))
+        return 1 if regressions else 0
+
+    if args.quick:
+        args.sizes = [s for s in args.sizes if s <= 20] or [5]
+        args.repeat = min(args.repeat, 3)
+
+    data = run(args.sizes, args.kinds, args.variants, args.impls, repeat=args.repeat, number=args.number,
+               verbose=True)
+    write_results(data, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
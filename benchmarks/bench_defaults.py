@@ -0,0 +1,74 @@
+"""
+Benchmark creating instances that use the defaults of their property fields.
+
+Compares property defaults from an annotation factory (`-> int`, now a constant default) and `validate_defaults=False`
+(the default is stored without running the setter) with a mutable factory that is still called for every instance.
+
+Usage:
+    python benchmarks/bench_defaults.py --output results.json
+"""
+import sys
+
+from _common import best_loop, report, command_line
+import dataclass_property
+
+
+__all__ = ['VARIANTS', 'make_class', 'bench_variant', 'run', 'main']
+
+
+# name: (annotation, dataclass keyword arguments)
+VARIANTS = {
+    'factory': ('list', {}),
+    'constant': ('int', {}),
+    'no_validate': ('int', {'validate_defaults': False}),
+    }
+
+
+def class_source(size, annotation):
+    lines = ['class Record:']
+    for i in range(size):
+        lines.extend([
+            '    @field_property',
+            '    def f{0}(self) -> {1}:'.format(i, annotation),
+            '        return self._f{0}'.format(i),
+            '    @f{0}.setter'.format(i),
+            '    def f{0}(self, value):'.format(i),
+            '        self._f{0} = value'.format(i),
+            ])
+    return '\n'.join(lines)
+
+
+def make_class(variant, size):
+    annotation, kwargs = VARIANTS[variant]
+    ns = {'field_property': dataclass_property.field_property}
+    exec(class_source(size, annotation), ns)
+    return dataclass_property.dataclass(**kwargs)(ns['Record'])
+
+
+def bench_variant(variant, size, number=10000, repeat=5):
+    cls = make_class(variant, size)
+
+    def construct(n):
+        for _ in range(n):
+            cls()
+
+    return best_loop(construct, number, repeat)
+
+
+def run(sizes=(4, 16), number=10000, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        for variant in VARIANTS:
+            item = {'size': size, 'variant': variant, 'init': bench_variant(variant, size, number, repeat)}
+            results.append(item)
+            if verbose:
+                print('{:>4} fields {:<12} init {:6.2f} us'.format(size, variant, item['init'] * 1e6))
+    return report('defaults', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[4, 16], number=10000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
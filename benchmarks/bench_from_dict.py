@@ -0,0 +1,94 @@
+"""
+Benchmark decoding nested dicts with the compiled `from_dict` against a generic decoder.
+
+The generic decoder resolves the annotations with `typing.get_type_hints` and checks the type of every field for
+every object (like hand written code that rebuilds nested models). A payload of records that contain a list of
+points is decoded with both and with `validate=False` (the setters are skipped).
+
+Usage:
+    python benchmarks/bench_from_dict.py --output results.json
+"""
+import sys
+import typing
+import dataclasses
+
+from _common import best, report, command_line
+from dataclass_property import dataclass, field_property, field, asdict
+
+
+__all__ = ['Point', 'Record', 'make_payload', 'generic_from_dict', 'run', 'main']
+
+
+@dataclass(construct=True)
+class Point:
+    x: int = 0
+
+    @field_property(default=0.0)
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = float(value)
+
+
+@dataclass(construct=True, decode=True)
+class Record:
+    name: str = ''
+    points: typing.List[Point] = field(default_factory=list)
+    center: typing.Optional[Point] = None
+    attrs: typing.Dict[str, int] = field(default_factory=dict)
+
+
+def make_payload(size, points=4):
+    return [asdict(Record(str(i), [Point(j, j / 2) for j in range(points)], Point(i), {'a': i}))
+            for i in range(size)]
+
+
+def generic_from_dict(cls, data):
+    """Decode a nested dict by resolving the annotations for every object."""
+    hints = typing.get_type_hints(cls)
+    kwargs = {}
+    for f in dataclasses.fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        tp = hints[f.name]
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if origin is typing.Union and type(None) in args and value is not None:
+            tp = args[0]
+            origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if dataclasses.is_dataclass(tp) and isinstance(value, dict):
+            value = generic_from_dict(tp, value)
+        elif origin is list and args and dataclasses.is_dataclass(args[0]):
+            value = [generic_from_dict(args[0], item) for item in value]
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def run(sizes=(1000, 10000), repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        payload = make_payload(size)
+        expected = [Record.from_dict(data) for data in payload]
+        assert [generic_from_dict(Record, data) for data in payload] == expected
+
+        item = {'size': size,
+                'generic': best(lambda: [generic_from_dict(Record, data) for data in payload], repeat=repeat),
+                'from_dict': best(lambda: [Record.from_dict(data) for data in payload], repeat=repeat),
+                'from_dict_no_validate': best(lambda: [Record.from_dict(data, False) for data in payload],
+                                              repeat=repeat),
+                }
+        results.append(item)
+        if verbose:
+            print('{:>7} records: generic {:7.2f} ms, from_dict {:7.2f} ms, validate=False {:7.2f} ms'.format(
+                size, item['generic'] * 1e3, item['from_dict'] * 1e3, item['from_dict_no_validate'] * 1e3))
+    return report('from_dict', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[1000, 10000], repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
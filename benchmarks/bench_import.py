@@ -0,0 +1,143 @@
+"""
+Benchmark the import time of dataclass_property with `python -X importtime`.
+
+The extra time of importing the package (everything it imports besides `dataclasses`) is compared with the time
+to import `dataclasses`, which dataclass_property always needs. The median over the repeats must stay within
+`BUDGET_RATIO`, which is generous because timings are noisy. tests/test_import_time.py enforces the stable proxy:
+the number of modules imported besides `dataclasses` must stay within `MODULE_BUDGET` and the modules which are only
+needed to build classes (or by optional tools) must not be imported.
+
+Usage:
+    python benchmarks/bench_import.py --output results.json
+"""
+import os
+import sys
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from _common import ROOT, write_results
+
+
+__all__ = ['BUDGET_RATIO', 'MODULE_BUDGET', 'FORBIDDEN_MODULES', 'import_times', 'imported_modules',
+           'package_modules', 'forbidden_modules', 'measure', 'main']
+
+
+# Limit for the extra import time as a fraction of the time needed to import dataclasses (median of the repeats).
+BUDGET_RATIO = 0.5
+
+# Limit for the number of modules that "import dataclass_property" imports besides dataclasses (and its imports).
+# The package modules, __future__ and threading.
+MODULE_BUDGET = 10
+
+# Modules that must not be imported by "import dataclass_property". They are imported when the first class is
+# built or when an optional tool is used.
+FORBIDDEN_MODULES = ('dataclass_property.profiler', 'dataclass_property.decode', 'dataclass_property.convert',
+                     'dataclass_property.state', 'dataclass_property.array', 'dataclass_property.buffer',
+                     'dataclass_property.views', 'dataclass_property.shared', 'dataclass_property.parallel',
+                     'dataclass_property.record_file',
+                     'array', 'struct', 'typing', 'tempfile', 'hashlib')
+
+
+def import_times(module='dataclass_property', env=None):
+    """Import the module in a new interpreter and return {module name: (self us, cumulative us)}."""
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                         cwd=ROOT, env=env, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL, check=True)
+    times = {}
+    for line in out.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def imported_modules(module='dataclass_property', statement='', base=()):
+    """Import the module (and run the statement) in a new interpreter and return the names of the new modules.
+
+    Modules that the base modules import are not included.
+    """
+    code = ('import sys; {}; before = set(sys.modules); import {}; {}; '
+            'print(*sorted(set(sys.modules) - before), sep=chr(10))').format(
+        '; '.join('import ' + name for name in base) or 'pass', module, statement or 'pass')
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, stdout=subprocess.PIPE, check=True)
+    return out.stdout.decode().split()
+
+
+def package_modules(module='dataclass_property'):
+    """Return the names of the modules that the module imports besides dataclasses (and its imports)."""
+    return imported_modules(module, base=('dataclasses',))
+
+
+def forbidden_modules(modules):
+    """Return the imported modules that "import dataclass_property" should not import."""
+    forbidden = list(FORBIDDEN_MODULES)
+    if sys.version_info >= (3, 10):
+        forbidden.append('dataclass_property.internals_old')
+    else:
+        forbidden.append('dataclass_property.internals_310')
+    return [name for name in forbidden if name in modules]
+
+
+def measure(repeat=7):
+    """Measure the import time.
+
+    Byte code is written to a temporary PYTHONPYCACHEPREFIX and the first run is discarded, so the measured
+    runs do not include compiling the source.
+
+    Returns:
+        data (dict): {'package_us': median import time of the package without dataclasses,
+                      'dataclasses_us': median cumulative time of dataclasses, 'ratio': ..., 'modules': [...]}
+    """
+    with tempfile.TemporaryDirectory() as prefix:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=prefix)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        import_times(env=env)  # Warm up and write the byte code
+
+        package, base, modules = [], [], set()
+        for _ in range(repeat):
+            times = import_times(env=env)
+            modules.update(times)
+            base.append(times.get('dataclasses', (0, 0))[1])
+            package.append(times['dataclass_property'][1] - base[-1])
+
+    package_us = statistics.median(package)
+    dataclasses_us = statistics.median(base)
+    return {'package_us': package_us,
+            'dataclasses_us': dataclasses_us,
+            'ratio': package_us / dataclasses_us if dataclasses_us else 0.0,
+            'budget_ratio': BUDGET_RATIO,
+            'modules': sorted(modules),
+            'package_modules': package_modules(),
+            'module_budget': MODULE_BUDGET}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', '-o', default=None)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    data = measure(args.repeat)
+    data['python'] = sys.version
+    print('dataclass_property extra:    {:8.0f} us'.format(data['package_us']))
+    print('dataclasses:                {:8.0f} us'.format(data['dataclasses_us']))
+    print('ratio: {:.2f} (budget {:.2f})'.format(data['ratio'], BUDGET_RATIO))
+    print('modules: {} (budget {})'.format(len(data['package_modules']), MODULE_BUDGET))
+    failed = forbidden = forbidden_modules(data['modules'])
+    if forbidden:
+        print('Unexpected imports:', ', '.join(forbidden))
+    if len(data['package_modules']) > MODULE_BUDGET:
+        failed = True
+        print('Too many modules:', ', '.join(data['package_modules']))
+    if data['ratio'] > BUDGET_RATIO:
+        failed = True
+        print('Import time is over budget')
+
+    write_results(data, args.output)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
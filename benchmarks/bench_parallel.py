@@ -0,0 +1,100 @@
+"""
+Benchmark building instances with expensive validating setters in worker pools.
+
+The setter of the record parses a code with a regular expression and checks a checksum. `build_many` with process
+and thread workers is compared with building in this process (`from_records`). Process workers are only faster with
+several CPUs, and threads only on free-threaded builds.
+
+Usage:
+    python benchmarks/bench_parallel.py --output results.json
+"""
+import os
+import re
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from _common import best, report, command_line
+import dataclass_property
+from dataclass_property import build_many
+
+
+__all__ = ['Item', 'make_records', 'METHODS', 'bench_records', 'run', 'main']
+
+
+CODE = re.compile(r'(?P<prefix>[A-Z]{3})-(?P<number>\d{6})-(?P<check>[0-9a-f]{8})')
+
+
+@dataclass_property.dataclass(bulk=True, state=True)
+class Item:
+    id: int = 0
+    rounds: int = 20
+
+    @dataclass_property.field_property(default='')
+    def code(self) -> str:
+        return self._code
+
+    @code.setter
+    def code(self, value):
+        match = CODE.fullmatch(value)
+        if match is None:
+            raise ValueError('invalid code {!r}'.format(value))
+        data = match.group('prefix', 'number')[1].encode()
+        checksum = 0
+        for _ in range(self.rounds):  # Expensive validation
+            checksum = zlib.crc32(data, checksum)
+        if '{:08x}'.format(checksum) != match.group('check'):
+            raise ValueError('invalid checksum of {!r}'.format(value))
+        self._code = value
+
+
+def make_code(number, rounds=20):
+    data = '{:06d}'.format(number).encode()
+    checksum = 0
+    for _ in range(rounds):
+        checksum = zlib.crc32(data, checksum)
+    return 'ABC-{:06d}-{:08x}'.format(number, checksum)
+
+
+def make_records(n):
+    return [{'id': i, 'code': make_code(i)} for i in range(n)]
+
+
+METHODS = ('from_records', 'processes', 'threads')
+
+
+def bench_records(n, workers=4, repeat=3):
+    records = make_records(n)
+    expected = Item.from_records(records)
+    chunksize = max(1, n // (workers * 4))
+    results = {}
+    with ProcessPoolExecutor(workers) as processes, ThreadPoolExecutor(workers) as threads:
+        funcs = {
+            'from_records': lambda: Item.from_records(records),
+            'processes': lambda: build_many(Item, records, executor=processes, chunksize=chunksize),
+            'threads': lambda: build_many(Item, records, executor=threads, chunksize=chunksize),
+            }
+        for name in METHODS:
+            assert funcs[name]() == expected
+            results[name] = best(funcs[name], repeat=repeat)
+    return results
+
+
+def run(counts=(20000,), workers=4, repeat=3, verbose=False):
+    results = []
+    for n in counts:
+        item = {'records': n, 'workers': workers, 'cpus': os.cpu_count()}
+        item.update(bench_records(n, workers, repeat))
+        results.append(item)
+        if verbose:
+            print('{:>8} records {} workers ({} CPUs): '.format(n, workers, os.cpu_count()) +
+                  ', '.join('{} {:.2f} ms'.format(name, item[name] * 1e3) for name in METHODS))
+    return report('parallel', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, records=[20000, 100000], workers=4, repeat=3)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
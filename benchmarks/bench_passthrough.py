@@ -0,0 +1,95 @@
+"""
+Benchmark pass-through properties (`field_property(passthrough=True)`) against normal properties.
+
+Measures creating instances and reading/writing the fields for a plain dataclass, properties with a Python getter
+and setter, and pass-through properties.
+
+Usage:
+    python benchmarks/bench_passthrough.py --output results.json
+"""
+import sys
+
+from _common import best_loop, report, command_line
+import dataclass_property
+
+
+__all__ = ['KINDS', 'make_class', 'bench_kind', 'run', 'main']
+
+
+KINDS = ('plain', 'property', 'passthrough')
+
+
+def class_source(kind, size):
+    lines = ['class Record:']
+    for i in range(size):
+        if kind == 'plain':
+            lines.append('    f{0}: int = 0'.format(i))
+            continue
+
+        if kind == 'passthrough':  # The setter is generated (a custom setter would run in __init__)
+            lines.append('    f{0}: int = field_property(default=0, passthrough=True)'.format(i))
+            continue
+        lines.extend([
+            '    @field_property(default=0)',
+            '    def f{0}(self) -> int:'.format(i),
+            '        return self._f{0}'.format(i),
+            '    @f{0}.setter'.format(i),
+            '    def f{0}(self, value):'.format(i),
+            '        self._f{0} = value'.format(i),
+            ])
+    return '\n'.join(lines)
+
+
+def make_class(kind, size):
+    ns = {'field_property': dataclass_property.field_property}
+    exec(class_source(kind, size), ns)
+    return dataclass_property.dataclass(ns['Record'])
+
+
+def bench_kind(kind, size, number=10000, repeat=5):
+    cls = make_class(kind, size)
+    args = tuple(range(size))
+    obj = cls(*args)
+    names = ['f{}'.format(i) for i in range(size)]
+
+    def construct(n):
+        for _ in range(n):
+            cls(*args)
+
+    def access(n):
+        for _ in range(n):
+            for name in names:
+                getattr(obj, name)
+
+    def assign(n):
+        for _ in range(n):
+            for name in names:
+                setattr(obj, name, 1)
+
+    return {'init': best_loop(construct, number, repeat),
+            'getattr': best_loop(access, number, repeat),
+            'setattr': best_loop(assign, number, repeat)}
+
+
+def run(sizes=(5, 20), number=10000, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        timings = {kind: bench_kind(kind, size, number, repeat) for kind in KINDS}
+        for benchmark in ('init', 'getattr', 'setattr'):
+            item = {'size': size, 'benchmark': benchmark}
+            item.update({kind: timings[kind][benchmark] for kind in KINDS})
+            item['speedup'] = item['property'] / item['passthrough']
+            results.append(item)
+            if verbose:
+                print('{:>4} fields {:<8} plain {:8.2f} us, property {:8.2f} us, passthrough {:8.2f} us, '
+                      '{:.2f}x'.format(size, benchmark, item['plain'] * 1e6, item['property'] * 1e6,
+                                       item['passthrough'] * 1e6, item['speedup']))
+    return report('passthrough', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[5, 20], number=10000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
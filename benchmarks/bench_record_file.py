@@ -0,0 +1,112 @@
+"""
+Benchmark writing and reading a record file compared with pickling the list of instances to a file.
+
+Reading the record file decodes the records lazily through a memory map, so the peak memory (tracemalloc) does not
+grow with the number of records. Random access decodes a single record.
+
+Usage:
+    python benchmarks/bench_record_file.py --output results.json
+"""
+import os
+import sys
+import pickle
+import random
+import tempfile
+
+from _common import best, peak_memory, report, command_line
+import dataclass_property
+from dataclass_property import RecordFile
+
+
+__all__ = ['make_class', 'bench_records', 'run', 'main']
+
+
+def make_class():
+    @dataclass_property.dataclass(codec=True)
+    class Reading:
+        timestamp: int = 0
+        ok: bool = True
+
+        @dataclass_property.field_property(default=0.0)
+        def value(self) -> float:
+            return self._value
+
+        @value.setter
+        def value(self, value):
+            if value < 0:
+                raise ValueError('value must be positive')
+            self._value = float(value)
+
+    # Pickle finds the class by name in this module
+    Reading.__qualname__ = Reading.__name__
+    Reading.__module__ = __name__
+    globals()['Reading'] = Reading
+    return Reading
+
+
+def bench_records(n, lookups=1000):
+    cls = make_class()
+    records = [cls(i, True, i * 0.5) for i in range(n)]
+    indices = [random.randrange(n) for _ in range(lookups)]
+    expected = sum(r.value for r in records)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        record_path = os.path.join(tmp, 'readings.rec')
+        pickle_path = os.path.join(tmp, 'readings.pickle')
+
+        def write_records():
+            with RecordFile(cls, record_path, mode='w') as f:
+                f.extend(records)
+
+        def write_pickle():
+            with open(pickle_path, 'wb') as f:
+                pickle.dump(records, f, pickle.HIGHEST_PROTOCOL)
+
+        def read_records():
+            with RecordFile(cls, record_path, mode='r') as f:
+                assert sum(r.value for r in f) == expected
+
+        def read_pickle():
+            with open(pickle_path, 'rb') as f:
+                assert sum(r.value for r in pickle.load(f)) == expected
+
+        def lookup_records():
+            with RecordFile(cls, record_path, mode='r') as f:
+                for i in indices:
+                    f[i]
+
+        def lookup_pickle():
+            with open(pickle_path, 'rb') as f:
+                loaded = pickle.load(f)
+                for i in indices:
+                    loaded[i]
+
+        results = {'record_file': {'write': best(write_records, repeat=1), 'read': best(read_records, repeat=1),
+                                   'lookup': best(lookup_records, repeat=1), 'read_memory': peak_memory(read_records),
+                                   'file_size': os.path.getsize(record_path)},
+                   'pickle': {'write': best(write_pickle, repeat=1), 'read': best(read_pickle, repeat=1),
+                              'lookup': best(lookup_pickle, repeat=1), 'read_memory': peak_memory(read_pickle),
+                              'file_size': os.path.getsize(pickle_path)}}
+    return results
+
+
+def run(counts=(100000,), lookups=1000, verbose=False):
+    results = []
+    for n in counts:
+        for name, item in bench_records(n, lookups).items():
+            item.update({'records': n, 'method': name})
+            results.append(item)
+            if verbose:
+                print('{:>9} records {:<12} write {:8.2f} ms, read {:8.2f} ms, {} lookups {:8.2f} ms, '
+                      'peak memory {:10.1f} KiB, file {:10.1f} KiB'.format(
+                        n, name, item['write'] * 1e3, item['read'] * 1e3, lookups, item['lookup'] * 1e3,
+                        item['read_memory'] / 1024, item['file_size'] / 1024))
+    return report('record_file', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, records=[100000, 1000000], lookups=1000)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Benchmark replacing one field of an instance with many property fields.
+
+`dataclasses.replace` reads every field through its getter and calls `__init__`, so every setter runs again. The
+generated `__replace__` (used by `dataclass_property.replace`) copies the stored values and only runs the setter of
+the changed field.
+
+Usage:
+    python benchmarks/bench_replace.py --output results.json
+"""
+import sys
+import dataclasses
+
+from _common import LAYOUTS as STORAGE, best, report, command_line
+import dataclass_property
+
+
+__all__ = ['STORAGE', 'make_class', 'bench_size', 'run', 'main']
+
+
+def class_source(size):
+    lines = ['class Record:']
+    for i in range(size):
+        lines.extend([
+            '    @field_property(default={})'.format(i),
+            '    def f{0}(self) -> int:'.format(i),
+            '        return self._f{0}'.format(i),
+            '    @f{0}.setter'.format(i),
+            '    def f{0}(self, value):'.format(i),
+            '        self._f{0} = int(value)'.format(i),
+            ])
+    return '\n'.join(lines)
+
+
+def make_class(size, **kwargs):
+    ns = {'field_property': dataclass_property.field_property}
+    exec(class_source(size), ns)
+    return dataclass_property.dataclass(replace=True, **kwargs)(ns['Record'])
+
+
+def bench_size(size, storage='dict', number=10000, repeat=5):
+    obj = make_class(size, **STORAGE[storage])()
+    assert dataclasses.replace(obj, f0=1) == dataclass_property.replace(obj, f0=1)
+    return {'dataclasses.replace': best(lambda: dataclasses.replace(obj, f0=1), number, repeat),
+            'replace': best(lambda: dataclass_property.replace(obj, f0=1), number, repeat),
+            }
+
+
+def run(sizes=(10, 50), number=10000, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        for storage in STORAGE:
+            item = {'size': size, 'storage': storage}
+            item.update(bench_size(size, storage, number, repeat))
+            results.append(item)
+            if verbose:
+                print('{:>4} fields {:<8} dataclasses.replace {:7.2f} us, replace {:7.2f} us'.format(
+                    size, storage, item['dataclasses.replace'] * 1e6, item['replace'] * 1e6))
+    return report('replace', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[10, 50], number=10000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
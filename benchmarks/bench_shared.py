@@ -0,0 +1,97 @@
+"""
+Benchmark updating records in worker processes through shared memory and through pickling.
+
+Each worker runs the validating setter of every record of its chunk. With pickling, the chunks of instances are sent
+to a ProcessPoolExecutor and the updated instances are sent back. With a SharedDataclassBuffer, only the name and
+the range of each chunk are pickled and the workers write the records in place.
+
+Usage:
+    python benchmarks/bench_shared.py --output results.json
+"""
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from _common import best, report, command_line
+import dataclass_property
+from dataclass_property import SharedDataclassBuffer
+
+
+__all__ = ['Reading', 'update_instances', 'update_shared', 'bench_records', 'run', 'main']
+
+
+@dataclass_property.dataclass(codec=True)
+class Reading:
+    timestamp: int = 0
+    ok: bool = True
+
+    @dataclass_property.field_property(default=0.0)
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value < 0:
+            raise ValueError('value must be positive')
+        self._value = float(value)
+
+
+def update_instances(readings):
+    for r in readings:
+        r.value = r.value * 2
+    return readings
+
+
+def update_shared(readings):
+    with readings:
+        for r in readings:
+            r.value = r.value * 2
+    return None
+
+
+def _chunks(length, chunks):
+    size = -(-length // chunks)
+    return [slice(i, i + size) for i in range(0, length, size)]
+
+
+def bench_records(n, executor, chunks, repeat=3):
+    records = [Reading(i, True, i * 0.5) for i in range(n)]
+    slices = _chunks(n, chunks)
+    expected = [r.value * 2 for r in records]
+
+    def with_pickle():
+        updated = []
+        for part in executor.map(update_instances, [records[s] for s in slices]):
+            updated.extend(part)
+        return updated
+
+    def with_shared():
+        with SharedDataclassBuffer[Reading].from_records(records) as readings:
+            list(executor.map(update_shared, [readings[s] for s in slices]))
+            return readings.to_instances()
+
+    results = {}
+    for name, func in (('pickle', with_pickle), ('shared_memory', with_shared)):
+        assert [r.value for r in func()] == expected
+        results[name] = best(func, repeat=repeat)
+    return results
+
+
+def run(counts=(100000,), workers=4, repeat=3, verbose=False):
+    results = []
+    with ProcessPoolExecutor(workers) as executor:
+        for n in counts:
+            item = {'records': n, 'workers': workers}
+            item.update(bench_records(n, executor, workers * 2, repeat))
+            results.append(item)
+            if verbose:
+                print('{:>9} records {} workers  pickle {:8.2f} ms, shared memory {:8.2f} ms'.format(
+                    n, workers, item['pickle'] * 1e3, item['shared_memory'] * 1e3))
+    return report('shared', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, records=[100000, 1000000], workers=4, repeat=3)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
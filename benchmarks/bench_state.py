@@ -0,0 +1,91 @@
+"""
+Benchmark copy.copy, copy.deepcopy and pickling with the generated state methods.
+
+A record with property fields is compared with the same record as a standard library dataclass (plain attributes),
+which uses the generic `object.__reduce_ex__` path.
+
+Usage:
+    python benchmarks/bench_state.py --output results.json
+"""
+import sys
+import copy
+import pickle
+import dataclasses
+
+from _common import LAYOUTS as STORAGE, best, report, command_line
+import dataclass_property
+
+
+__all__ = ['STORAGE', 'make_class', 'make_plain_class', 'OPERATIONS', 'run', 'main']
+
+
+def class_source(size, name):
+    lines = ['class {}:'.format(name)]
+    for i in range(size):
+        lines.extend([
+            '    @field_property(default={})'.format(i),
+            '    def f{0}(self) -> int:'.format(i),
+            '        return self._f{0}'.format(i),
+            '    @f{0}.setter'.format(i),
+            '    def f{0}(self, value):'.format(i),
+            '        self._f{0} = int(value)'.format(i),
+            ])
+    lines.append('    items: list = field(default_factory=lambda: [1.0, 2.0])')
+    return '\n'.join(lines)
+
+
+def _register(cls, name):
+    # Pickle finds the class by name in this module
+    cls.__qualname__ = cls.__name__ = name
+    cls.__module__ = __name__
+    globals()[name] = cls
+    return cls
+
+
+def make_class(size, storage='dict'):
+    name = 'Record_{}_{}'.format(storage, size)
+    ns = {'field_property': dataclass_property.field_property, 'field': dataclass_property.field}
+    exec(class_source(size, name), ns)
+    return _register(dataclass_property.dataclass(state=True, **STORAGE[storage])(ns[name]), name)
+
+
+def make_plain_class(size, storage='dict'):
+    name = 'Plain_{}_{}'.format(storage, size)
+    fields = [('f{}'.format(i), int, i) for i in range(size)]
+    fields.append(('items', list, dataclasses.field(default_factory=lambda: [1.0, 2.0])))
+    slots = storage != 'dict' and sys.version_info >= (3, 10)
+    kwargs = {'slots': True} if slots else {}
+    return _register(dataclasses.make_dataclass(name, fields, **kwargs), name)
+
+
+OPERATIONS = {
+    'copy': copy.copy,
+    'deepcopy': copy.deepcopy,
+    'pickle': lambda obj: pickle.loads(pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)),
+    }
+
+
+def run(sizes=(10, 50), number=2000, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        for storage in STORAGE:
+            obj = make_class(size, storage)()
+            plain = make_plain_class(size, storage)()
+            for op, func in OPERATIONS.items():
+                assert func(obj) == obj
+                item = {'size': size, 'storage': storage, 'operation': op,
+                        'generated': best(lambda: func(obj), number, repeat),
+                        'dataclasses': best(lambda: func(plain), number, repeat)}
+                results.append(item)
+                if verbose:
+                    print('{:>4} fields {:<8} {:<9} dataclasses {:7.2f} us, generated {:7.2f} us'.format(
+                        size, storage, op, item['dataclasses'] * 1e6, item['generated'] * 1e6))
+    return report('state', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[10, 50], number=2000, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
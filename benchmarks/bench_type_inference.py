@@ -0,0 +1,94 @@
+"""
+Benchmark the property type inference used while decorating a class.
+
+Compares the current cached `__annotations__` lookup against the previous implementation which built an
+`inspect.signature` for every getter (twice per property) and called the default factory to find the type.
+
+Usage:
+    python benchmarks/bench_type_inference.py --output results.json
+"""
+import sys
+import time
+import inspect
+
+from _common import report, command_line
+from dataclass_property import DataclassInterface, MISSING
+
+
+__all__ = ['LegacyDataclassInterface', 'legacy_get_return_type', 'legacy_get_return_annotation', 'run', 'main']
+
+
+def legacy_get_return_type(default=MISSING, default_factory=MISSING):
+    """Previous implementation of get_return_type."""
+    return_type = inspect.signature(default_factory).return_annotation
+    if return_type == inspect.Signature.empty:
+        return_type = MISSING
+        if default != MISSING:
+            return_type = type(default)
+        elif default_factory != MISSING:
+            try:
+                return_type = type(default_factory())
+            except (ValueError, TypeError, Exception):
+                pass
+    return return_type
+
+
+def legacy_get_return_annotation(func):
+    """Previous uncached lookup of the getter return annotation in make_field."""
+    annotation = inspect.signature(func).return_annotation
+    return MISSING if annotation is inspect.Signature.empty else annotation
+
+
+class LegacyDataclassInterface(DataclassInterface):
+    get_return_type = staticmethod(legacy_get_return_type)
+    get_return_annotation = staticmethod(legacy_get_return_annotation)
+
+
+def class_source(size):
+    lines = ['class Props:']
+    for i in range(size):
+        lines.extend([
+            '    @property',
+            '    def p{0}(self) -> int:'.format(i),
+            '        return self._p{0}'.format(i),
+            '    @p{0}.setter'.format(i),
+            '    def p{0}(self, value):'.format(i),
+            '        self._p{0} = value'.format(i),
+            ])
+    return '\n'.join(lines)
+
+
+def bench_decorate(interface, size, number, repeat):
+    source = class_source(size)
+    timings = []
+    for _ in range(repeat):
+        classes = []
+        for _ in range(number):
+            ns = {}
+            exec(source, ns)
+            classes.append(ns['Props'])
+        start = time.perf_counter()
+        for cls in classes:
+            interface.dataclass(cls)
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def run(sizes=(5, 20, 100), number=20, repeat=5, verbose=False):
+    results = []
+    for size in sizes:
+        legacy = bench_decorate(LegacyDataclassInterface, size, number, repeat)
+        current = bench_decorate(DataclassInterface, size, number, repeat)
+        results.append({'size': size, 'legacy': legacy, 'current': current, 'speedup': legacy / current})
+        if verbose:
+            print('{:>4} properties: legacy {:10.1f} us, current {:10.1f} us, {:.2f}x'.format(
+                size, legacy * 1e6, current * 1e6, legacy / current))
+    return report('type_inference', results)
+
+
+def main(argv=None):
+    return command_line(run, __doc__, argv, sizes=[5, 20, 100], number=20, repeat=5)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,21 +2,48 @@ from .__meta__ import version as __version__
 import sys
 
 from dataclasses import Field, field, MISSING, FrozenInstanceError, InitVar, fields, asdict, astuple, make_dataclass, \
-    replace, is_dataclass
+    is_dataclass
 
-from .interface import BaseDataclassInterface
-from .field_prop import get_return_type, field_property
-try:
-    from .internals_old import dataclass, DataclassInterface
-except (ImportError, Exception):
-    dataclass = None
-    DataclassInterface = None
+from .interface import BaseDataclassInterface, replace
+from .field_prop import get_return_annotation, get_return_type, field_property
 
-if sys.version_info >= (3, 10) or dataclass is None:
+# Only import the implementation for the running interpreter
+if sys.version_info >= (3, 10):
     from .internals_310 import dataclass, DataclassInterface
+else:
+    from .internals_old import dataclass, DataclassInterface
+
+
+def __getattr__(name):
+    # Import optional tools on first use to keep the package import fast
+    if name in ('DecorationProfiler', 'profile_decoration'):
+        from . import profiler
+        return getattr(profiler, name)
+    if name in ('from_dict', 'FromDictError'):
+        from . import decode
+        return getattr(decode, name)
+    if name == 'DataclassArray':
+        from .array import DataclassArray
+        return DataclassArray
+    if name == 'DataclassBuffer':
+        from .buffer import DataclassBuffer
+        return DataclassBuffer
+    if name == 'SharedDataclassBuffer':
+        from .shared import SharedDataclassBuffer
+        return SharedDataclassBuffer
+    if name in ('build_many', 'BuildError'):
+        from . import parallel
+        return getattr(parallel, name)
+    if name in ('RecordFile', 'RecordSchemaError'):
+        from . import record_file
+        return getattr(record_file, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
-__all__ = ['dataclass', 'DataclassInterface', 'BaseDataclassInterface', 'get_return_type', 'field_property',
+__all__ = ['dataclass', 'DataclassInterface', 'BaseDataclassInterface',
+           'get_return_annotation', 'get_return_type', 'field_property',
+           'DecorationProfiler', 'profile_decoration', 'DataclassArray', 'DataclassBuffer', 'SharedDataclassBuffer',
+           'RecordFile', 'RecordSchemaError', 'build_many', 'BuildError', 'from_dict', 'FromDictError',
            'field',
            'Field',
            'FrozenInstanceError',
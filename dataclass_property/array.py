@@ -0,0 +1,476 @@
+"""
+Struct-of-arrays container for dataclasses.
+
+`DataclassArray[Point]` keeps one column per storage attribute (the field name for normal fields, the backing
+attributes for properties) instead of one object per record. `int` and `float` columns are `array.array`
+('q' and 'd') or NumPy arrays with `backend='numpy'`. Other columns are lists.
+
+Indexing returns a light row view. The view class is a subclass of the dataclass where every storage attribute
+reads and writes the columns, so the `field_property` getters and setters still run.
+
+.. code-block:: python
+
+    points = DataclassArray[Point](Point(i, i * 2) for i in range(1000))
+    points.set_column('x', range(1000))  # Runs the vectorized setter or the setter for every row
+    big = points.filter(lambda p: p.x > 500)
+    instances = big.to_instances()
+"""
+import array
+import operator
+import itertools
+import dataclasses
+
+from .compact import VALUES, UNSET
+from .views import DataclassViews, make_view
+
+
+__all__ = ['TYPECODES', 'NUMPY_DTYPES', 'ColumnAttribute', 'ColumnsProxy', 'DataclassArray']
+
+
+# array.array typecodes and NumPy dtypes for the column types. Other types are stored in lists (object arrays).
+# bool has no array.array typecode, so bool columns are lists with the array backend.
+TYPECODES = {int: 'q', float: 'd'}
+NUMPY_DTYPES = {int: 'int64', float: 'float64', bool: 'bool'}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as err:
+        raise ImportError('The numpy backend requires numpy (pip install numpy)') from err
+    return numpy
+
+
+def _tolist(column):
+    return column if isinstance(column, list) else column.tolist()
+
+
+def _widen(column):
+    """Return a column that can hold any object."""
+    if isinstance(column, array.array):
+        return column.tolist()
+    if isinstance(column, list) or column.dtype == object:
+        return column
+    return column.astype(object)  # NumPy
+
+
+class ColumnAttribute:
+    """Descriptor of a row view which reads and writes the value in a column.
+
+    Values are only stored in a typed column if they have exactly the column type (a bool is not stored in an int
+    column). Other values change the column to an object column.
+
+    Args:
+        name (str): Storage attribute name and column name.
+        type (type)[object]: Type of the values in a typed column.
+    """
+    __slots__ = ('name', 'type')
+
+    def __init__(self, name, type=object):
+        self.name = name
+        self.type = type
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dataclass_columns__[self.name][instance.__dataclass_index__]
+        if value is UNSET:
+            raise AttributeError(self.name)
+        return value
+
+    def __set__(self, instance, value):
+        columns = instance.__dataclass_columns__
+        column = columns[self.name]
+        if type(value) is not self.type and type(column) is not list:
+            column = columns[self.name] = _widen(column)
+        try:
+            column[instance.__dataclass_index__] = value
+        except (TypeError, ValueError, OverflowError):
+            column = columns[self.name] = _widen(column)
+            column[instance.__dataclass_index__] = value
+
+    def __delete__(self, instance):
+        self.__set__(instance, UNSET)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(type(self).__name__, self.name)
+
+
+class ColumnsProxy:
+    """Passed as `self` to the vectorized setters. Attributes are whole storage columns.
+
+    Args:
+        array (DataclassArray): Array to read and write the columns of.
+    """
+    __slots__ = ('_array',)
+
+    def __init__(self, array):
+        object.__setattr__(self, '_array', array)
+
+    def __getattr__(self, name):
+        try:
+            return self._array.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, values):
+        self._array.set_storage(name, values)
+
+    def __len__(self):
+        return len(self._array)
+
+
+class _Layout:
+    """Storage columns and the row view class of a dataclass."""
+    def __init__(self, cls):
+        from . import DataclassInterface
+
+        self.cls = cls
+        self.fields = dataclasses.fields(cls)
+        self.storage = []  # [(name, type)]
+        self.field_storage = {}  # {field name: storage name} for fields whose value is the storage value
+
+        for f in self.fields:
+            prop = getattr(f, 'prop', None)
+            if prop is None:
+                names = (f.name,)
+                self.field_storage[f.name] = f.name
+            else:
+                names = DataclassInterface.property_storage(prop)
+                if f.storage is not None:
+                    self.field_storage[f.name] = f.storage
+
+            tp = DataclassInterface.resolve_type(cls, f.type) if len(names) == 1 else object
+            for name in names:
+                if all(name != n for n, _ in self.storage) and not isinstance(getattr(cls, name, None), property):
+                    self.storage.append((name, tp))
+
+        storage_names = cls.__dict__.get('__dataclass_storage__', None)
+        if storage_names is not None:  # Compact storage. Keep the value list order.
+            types = dict(self.storage)
+            self.storage = [(name, types.get(name, object)) for name in storage_names]
+        self.names = [name for name, _ in self.storage]
+        self.compact = storage_names is not None
+        # Instances keep every storage attribute in their __dict__ (no slots or other descriptors)
+        self.dict_storage = (not self.compact and '__dict__' in dir(cls) and
+                             not any(hasattr(getattr(cls, name, None), '__set__') for name in self.names))
+        self.view = self.make_view()
+        self._build_dicts = None
+
+    def build_dicts(self):
+        """Return a generated function `(cls, columns) -> instances` that fills each instance `__dict__`."""
+        if self._build_dicts is None:
+            values = ', '.join('__dataclass_v{}__'.format(i) for i in range(len(self.names)))
+            lines = ['def __dataclass_build__(cls, columns):',
+                     '    new = object.__new__',
+                     '    instances = []',
+                     '    append = instances.append',
+                     '    for {}, in zip(*columns):'.format(values),
+                     '        obj = new(cls)',
+                     '        d = obj.__dict__']
+            lines.extend('        d[{!r}] = __dataclass_v{}__'.format(name, i) for i, name in enumerate(self.names))
+            lines.append('        append(obj)')
+            lines.append('    return instances')
+            ns = {}
+            exec('\n'.join(lines), ns)
+            self._build_dicts = ns['__dataclass_build__']
+        return self._build_dicts
+
+    def make_view(self):
+        values = None
+        if self.compact:
+            names = self.names
+
+            def values(self):
+                # Snapshot for the generated compact methods (__eq__, __hash__, _astuple).
+                columns, index = self.__dataclass_columns__, self.__dataclass_index__
+                return [columns[name][index] for name in names]
+
+        return make_view(self.cls, self.fields, ('__dataclass_columns__', '__dataclass_index__'),
+                         {name: ColumnAttribute(name, tp) for name, tp in self.storage},
+                         'Row view of {} in a DataclassArray.'.format(self.cls.__qualname__), values)
+
+
+class DataclassArray(DataclassViews):
+    """Store the values of many dataclass instances as one column per storage attribute.
+
+    Use `DataclassArray[Point](records)` or `DataclassArray[Point].from_columns(x=[...], y=[...])`.
+
+    Args:
+        records (iterable)[()]: Instances of the dataclass. Their storage values are copied without running setters.
+        backend (str)['array']: 'array' for array.array and list columns or 'numpy' for NumPy columns.
+    """
+    Layout = _Layout
+    BACKENDS = ('array', 'numpy')
+
+    def __init__(self, records=(), backend='array'):
+        if backend not in self.BACKENDS:
+            raise ValueError('Invalid backend {!r}, expected one of {}'.format(backend, self.BACKENDS))
+        layout = self.layout()
+        self.backend = backend
+        self.columns = {}
+        self._length = 0
+
+        values = {name: [] for name in layout.names}
+        getters = [(values[name].append, name) for name in layout.names]
+        for obj in records:
+            for append, name in getters:
+                append(getattr(obj, name, UNSET))
+            self._length += 1
+        for name, tp in layout.storage:
+            self.columns[name] = self._make_column(values[name], tp)
+
+    @classmethod
+    def from_columns(cls, backend='array', **columns):
+        """Create an array from the field values. Every field is set with `set_column`.
+
+        Fields that are not given use their default or default_factory.
+        """
+        layout = cls.layout()
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('All columns must have the same length')
+        length = lengths.pop() if lengths else 0
+
+        self = cls((), backend)
+        self._length = length
+        for name, tp in layout.storage:
+            self.columns[name] = self._make_column([UNSET] * length, object)
+
+        for f in layout.fields:
+            if f.name in columns:
+                self.set_column(f.name, columns[f.name])
+            elif f.default is not dataclasses.MISSING:
+                self.set_column(f.name, [f.default] * length)
+            elif f.default_factory is not dataclasses.MISSING:
+                self.set_column(f.name, [f.default_factory() for _ in range(length)])
+            elif f.init:
+                raise TypeError('from_columns() missing required column {!r}'.format(f.name))
+
+        # Setters filled object columns. Use typed columns where the values allow it.
+        for name, tp in layout.storage:
+            self.columns[name] = self._make_column(_tolist(self.columns[name]), tp)
+        return self
+
+    def _make_column(self, values, tp):
+        """Return a typed column if every value has exactly the type tp, otherwise an object column."""
+        if self.backend == 'numpy':
+            numpy = _import_numpy()
+            if isinstance(values, numpy.ndarray):
+                return numpy.array(values)  # Copy and keep the dtype
+            dtype = NUMPY_DTYPES.get(tp, None)
+            if dtype is not None and all(type(v) is tp for v in values):
+                try:
+                    return numpy.asarray(values, dtype=dtype)
+                except OverflowError:
+                    pass
+            column = numpy.empty(len(values), dtype=object)
+            for i, value in enumerate(values):  # Never turn sequence values into more dimensions
+                column[i] = value
+            return column
+
+        typecode = TYPECODES.get(tp, None)
+        if isinstance(values, array.array) and values.typecode == typecode:
+            return array.array(typecode, values)
+        if typecode is not None and all(type(v) is tp for v in values):
+            try:
+                return array.array(typecode, values)
+            except OverflowError:
+                pass
+        return list(values)
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return '<{} with {} records>'.format(type(self).__name__, self._length)
+
+    def view(self, index):
+        """Return the row view for the index."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('DataclassArray index out of range')
+        view_cls = self.layout().view
+        view = object.__new__(view_cls)
+        view_cls.__dataclass_columns__.__set__(view, self.columns)
+        view_cls.__dataclass_index__.__set__(view, index)
+        return view
+
+    def __iter__(self):
+        if self._length == 0:
+            return
+        view = self.layout().view
+        set_columns = view.__dataclass_columns__.__set__
+        set_index = view.__dataclass_index__.__set__
+        columns = self.columns
+        for i in range(self._length):
+            row = object.__new__(view)
+            set_columns(row, columns)
+            set_index(row, i)
+            yield row
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self._length)))
+        try:
+            index = operator.index(index)
+        except TypeError:
+            return self.filter(index)  # Boolean mask
+        return self.view(index)
+
+    def __setitem__(self, index, obj):
+        """Copy the storage values of an instance into a row without running setters."""
+        row = self.view(operator.index(index))
+        for name in self.layout().names:
+            setattr(row, name, getattr(obj, name, UNSET))
+
+    def append(self, obj):
+        """Add an instance. Its storage values are copied without running setters."""
+        for name, tp in self.layout().storage:
+            value = getattr(obj, name, UNSET)
+            column = self.columns[name]
+            if type(value) is not tp and type(column) is not list:
+                column = _widen(column)
+            if self.backend == 'numpy':
+                numpy = _import_numpy()
+                extra = numpy.empty(1, dtype=column.dtype)
+                extra[0] = value
+                column = numpy.concatenate([column, extra])
+            else:
+                column.append(value)
+            self.columns[name] = column
+        self._length += 1
+
+    def extend(self, records):
+        for obj in records:
+            self.append(obj)
+
+    def take(self, indices):
+        """Return a new array with the rows at the given indices."""
+        new = type(self)((), self.backend)
+        indices = list(indices)
+        new._length = len(indices)
+        for name, column in self.columns.items():
+            if self.backend == 'numpy':
+                new.columns[name] = column[_import_numpy().asarray(indices, dtype='intp')]
+            elif isinstance(column, array.array):
+                new.columns[name] = array.array(column.typecode, [column[i] for i in indices])
+            else:
+                new.columns[name] = [column[i] for i in indices]
+        return new
+
+    def filter(self, condition):
+        """Return a new array with the rows where the condition is true.
+
+        Args:
+            condition (callable/sequence): Function(row view) -> bool or a boolean mask with one value per row.
+        """
+        if callable(condition):
+            return self.take(i for i, row in enumerate(self) if condition(row))
+        if len(condition) != self._length:
+            raise ValueError('The mask must have one value per row')
+        if self.backend == 'numpy':
+            return self.take(_import_numpy().flatnonzero(condition))
+
+        # Select every column with the mask directly instead of building the indices
+        new = type(self)((), self.backend)
+        new._length = sum(1 for keep in condition if keep)
+        for name, column in self.columns.items():
+            if isinstance(column, array.array):
+                new.columns[name] = array.array(column.typecode, itertools.compress(column, condition))
+            else:
+                new.columns[name] = list(itertools.compress(column, condition))
+        return new
+
+    def column(self, name):
+        """Return the values of a field or storage attribute.
+
+        Fields that store their value directly (normal fields and pass-through properties) return the column
+        itself. Other property fields return a list of the getter values.
+        """
+        layout = self.layout()
+        storage = layout.field_storage.get(name, name)
+        try:
+            return self.columns[storage]
+        except KeyError:
+            pass
+        if not any(f.name == name for f in layout.fields):
+            raise KeyError(name)
+        return [getattr(row, name) for row in self]
+
+    def set_storage(self, name, values):
+        """Replace a whole storage column without running setters."""
+        if name not in self.columns:
+            raise AttributeError('{!r} is not a storage attribute of {}'.format(name, self.dataclass.__qualname__))
+        if len(values) != self._length:
+            raise ValueError('Column {!r} must have {} values'.format(name, self._length))
+        self.columns[name] = self._make_column(values, dict(self.layout().storage)[name])
+
+    def set_column(self, name, values):
+        """Set a field for every row.
+
+        Uses the vectorized setter registered with `field_property.vectorized` if there is one. Normal fields
+        replace the column. Otherwise the property setter runs for every row.
+        """
+        layout = self.layout()
+        f = next((f for f in layout.fields if f.name == name), None)
+        if f is None:
+            raise AttributeError('{!r} is not a field of {}'.format(name, self.dataclass.__qualname__))
+        if len(values) != self._length:
+            raise ValueError('Column {!r} must have {} values'.format(name, self._length))
+
+        prop = getattr(f, 'prop', None)
+        fvec = getattr(prop, 'fvec', None)
+        if fvec is not None:
+            fvec(ColumnsProxy(self), values)
+        elif prop is None:
+            self.set_storage(name, values)
+        elif self._length:
+            row = self.view(0)
+            set_index = type(row).__dataclass_index__.__set__
+            for i, value in enumerate(values):
+                set_index(row, i)
+                setattr(row, name, value)
+
+    def to_instances(self, validate=False):
+        """Return a list of dataclass instances.
+
+        Args:
+            validate (bool)[False]: If True create the instances with `__init__` (setters and __post_init__ run).
+                Otherwise the storage values are copied into new instances directly.
+        """
+        layout = self.layout()
+        cls = self.dataclass
+        if validate:
+            names = [f.name for f in layout.fields if f.init]
+            return [cls(**{name: getattr(row, name) for name in names}) for row in self]
+
+        names = layout.names
+        columns = [_tolist(self.columns[name]) for name in names]
+        new = object.__new__
+        rows = zip(*columns) if columns else ((),) * self._length
+        if layout.compact:
+            set_values = getattr(cls, VALUES).__set__
+            instances = []
+            for values in rows:
+                obj = new(cls)
+                set_values(obj, list(values))
+                instances.append(obj)
+            return instances
+
+        # Only list columns can have UNSET values
+        has_unset = any(value is UNSET for name, column in zip(names, columns)
+                        if type(self.columns[name]) is list for value in column)
+        if not has_unset and layout.dict_storage and names:
+            return layout.build_dicts()(cls, columns)
+
+        setattr_ = object.__setattr__
+        instances = []
+        for values in rows:
+            obj = new(cls)
+            for name, value in zip(names, values):
+                if value is not UNSET:
+                    setattr_(obj, name, value)
+            instances.append(obj)
+        return instances
@@ -0,0 +1,216 @@
+"""
+Buffer-backed record views for dataclasses with a binary codec.
+
+`DataclassBuffer[Point](buffer)` reads the packed records of `Point.pack_many` (see `_codec_fns`) in place. Indexing
+returns a row view: a subclass of the dataclass where every storage attribute reads and writes its value at a fixed
+offset in the buffer, so the `field_property` getters and setters still run. Slicing returns another
+DataclassBuffer over the same memory. Nothing is copied.
+
+.. code-block:: python
+
+    points = DataclassBuffer[Point].from_records(Point(i, i * 2) for i in range(1000))
+    points[10].y = 5  # Runs the setter, which writes to the buffer
+    evens = points[::2]  # Shares the buffer
+    instances = evens.to_instances()
+"""
+import struct
+import operator
+import dataclasses
+
+from .compact import UNSET
+from .views import DataclassViews, make_view
+
+
+__all__ = ['BufferAttribute', 'DataclassBuffer']
+
+
+class BufferAttribute:
+    """Descriptor of a row view which reads and writes a value at a fixed offset in the buffer.
+
+    Args:
+        name (str): Storage attribute name.
+        offset (int): Offset of the value in a record.
+        code (str): struct format code of the value.
+        byte_order (str)['<']: struct byte order character.
+    """
+    __slots__ = ('name', 'offset', 'code', 'unpack_from', 'pack_into')
+
+    def __init__(self, name, offset, code, byte_order='<'):
+        packer = struct.Struct(byte_order + code)
+        self.name = name
+        self.offset = offset
+        self.code = code
+        self.unpack_from = packer.unpack_from
+        self.pack_into = packer.pack_into
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.unpack_from(instance.__dataclass_buffer__, instance.__dataclass_offset__ + self.offset)[0]
+
+    def __set__(self, instance, value):
+        self.pack_into(instance.__dataclass_buffer__, instance.__dataclass_offset__ + self.offset, value)
+
+    def __delete__(self, instance):
+        raise AttributeError('cannot delete {!r} of a buffer view'.format(self.name))
+
+    def __repr__(self):
+        return '<{} {!r} at {} ({!r})>'.format(type(self).__name__, self.name, self.offset, self.code)
+
+
+class _Layout:
+    """Offsets of the storage attributes and the row view class of a dataclass."""
+    def __init__(self, cls):
+        from . import DataclassInterface
+        from .deferred import build_deferred
+
+        build_deferred(cls)
+        packer = cls.__dict__.get(DataclassInterface._STRUCT, None)
+        if packer is None:
+            raise TypeError('{} has no binary codec, use dataclass(codec=True) with fields that can be packed'.format(
+                cls.__qualname__))
+
+        self.cls = cls
+        self.struct = packer
+        self.size = packer.size
+        self.fields = DataclassInterface._codec_fields(dataclasses.fields(cls))
+        self.attributes = {}  # {storage name: BufferAttribute}
+        self.field_storage = {}  # {field name: storage name}
+
+        offset = 0
+        byte_order = DataclassInterface.STRUCT_BYTE_ORDER
+        for f in self.fields:
+            storage = DataclassInterface._direct_storage(f)
+            if storage is None:
+                raise TypeError('The storage of property {!r} is not known'.format(f.name))
+            code = DataclassInterface._struct_code(cls, f)
+            self.attributes[storage] = BufferAttribute(storage, offset, code, byte_order)
+            self.field_storage[f.name] = storage
+            offset += struct.calcsize(byte_order + code)
+
+        self.compact = cls.__dict__.get('__dataclass_storage__', None)
+        self.view = self.make_view()
+
+    def make_view(self):
+        values = None
+        if self.compact is not None:
+            names = self.compact
+
+            def values(self):
+                # Snapshot for the generated compact methods (__eq__, __hash__, _astuple).
+                return [getattr(self, name, UNSET) for name in names]
+
+        return make_view(self.cls, self.fields, ('__dataclass_buffer__', '__dataclass_offset__'), self.attributes,
+                         'Buffer view of {} records.'.format(self.cls.__qualname__), values)
+
+
+class DataclassBuffer(DataclassViews):
+    """Sequence of row views over the packed records of a dataclass in a buffer.
+
+    Use `DataclassBuffer[Point](buffer)`. The buffer may be a bytes, bytearray, memoryview, mmap or any other object
+    that supports the buffer protocol. Views of a read only buffer raise TypeError when a value is set.
+
+    Args:
+        buffer (bytes-like): Packed records (`cls.pack_many`). The size must be a multiple of the record size.
+        indices (range)[None]: Record positions in the buffer (used by slicing).
+    """
+    Layout = _Layout
+
+    def __init__(self, buffer, indices=None):
+        layout = self.layout()
+        buffer = memoryview(buffer)
+        if buffer.format != 'B' or buffer.ndim != 1:
+            buffer = buffer.cast('B')
+        if indices is None:
+            count, extra = divmod(buffer.nbytes, layout.size)
+            if extra:
+                raise ValueError('The buffer size {} is not a multiple of the record size {}'.format(
+                    buffer.nbytes, layout.size))
+            indices = range(count)
+        self.buffer = buffer
+        self.indices = indices
+
+    @classmethod
+    def allocate(cls, length):
+        """Create a buffer of zero-filled records."""
+        return cls(bytearray(length * cls.layout().size))
+
+    @classmethod
+    def from_records(cls, records):
+        """Create a writable buffer with the packed instances (`cls.pack_many`)."""
+        return cls(bytearray(cls.dataclass.pack_many(records)))
+
+    @classmethod
+    def view_at(cls, buffer, offset=0):
+        """Return the row view of the record at the byte offset of the buffer."""
+        view_cls = cls.layout().view
+        view = object.__new__(view_cls)
+        view_cls.__dataclass_buffer__.__set__(view, buffer)
+        view_cls.__dataclass_offset__.__set__(view, offset)
+        return view
+
+    @property
+    def record_size(self):
+        return self.layout().size
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __repr__(self):
+        return '<{} with {} records>'.format(type(self).__name__, len(self.indices))
+
+    def view(self, index):
+        """Return the row view for the index."""
+        try:
+            position = self.indices[index]
+        except IndexError:
+            raise IndexError('DataclassBuffer index out of range') from None
+        return self.view_at(self.buffer, position * self.layout().size)
+
+    def __iter__(self):
+        layout = self.layout()
+        view = layout.view
+        set_buffer = view.__dataclass_buffer__.__set__
+        set_offset = view.__dataclass_offset__.__set__
+        buffer = self.buffer
+        new = object.__new__
+        for offset in range(self.indices.start * layout.size, self.indices.stop * layout.size,
+                            self.indices.step * layout.size):
+            row = new(view)
+            set_buffer(row, buffer)
+            set_offset(row, offset)
+            yield row
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(self.buffer, self.indices[index])
+        return self.view(operator.index(index))
+
+    def __setitem__(self, index, obj):
+        """Pack an instance into a record without running setters."""
+        try:
+            position = self.indices[operator.index(index)]
+        except IndexError:
+            raise IndexError('DataclassBuffer index out of range') from None
+        self.dataclass.pack_into(obj, self.buffer, position * self.layout().size)
+
+    def tobytes(self):
+        """Return the packed records (a copy)."""
+        size = self.layout().size
+        indices = self.indices
+        if indices.step == 1:
+            return self.buffer[indices.start * size:indices.stop * size].tobytes()
+        return b''.join(self.buffer[i * size:(i + 1) * size] for i in indices)
+
+    def to_instances(self, validate=False):
+        """Return a list of dataclass instances.
+
+        Args:
+            validate (bool)[False]: If True the property setters run (`cls.iter_unpack(validate=True)`).
+        """
+        size = self.layout().size
+        indices = self.indices
+        if indices.step == 1:
+            return list(self.dataclass.iter_unpack(self.buffer[indices.start * size:indices.stop * size], validate))
+        unpack = self.dataclass.unpack
+        return [unpack(self.buffer, i * size, validate) for i in indices]
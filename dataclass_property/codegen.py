@@ -0,0 +1,383 @@
+"""
+Code generation for the dataclass methods.
+
+The standard library (before Python 3.13) compiles every generated method with its own `exec` call. FuncBuilder
+collects the source for all of the methods of a class and compiles them with a single `exec`.
+
+The generated source only contains the field layout (names, which fields have defaults, flags). Types, defaults,
+and the class are passed in as arguments of the outer `__create_fn__` function. Classes with the same layout
+generate the same source, so CodeCache can reuse the compiled code object and only bind new values.
+
+CodeCache can also use a DiskCodeCache which stores the marshalled code objects in a directory (like __pycache__),
+so new processes do not have to compile the source again. Set the `DATACLASS_PROPERTY_CACHE_DIR` environment
+variable or call `DataclassInterface.code_cache.set_directory(path)` to enable it.
+"""
+import os
+import sys
+import types
+import threading
+import collections
+import dataclasses
+
+
+__all__ = ['CacheInfo', 'DiskCodeCache', 'CodeCache', 'FuncBuilder', 'LazyMethod', 'LazyDoc']
+
+
+MISSING = dataclasses.MISSING
+
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class DiskCodeCache:
+    """Store compiled code objects in a directory.
+
+    Files are named by the SHA-256 of the source and the interpreter cache tag (e.g. "cpython-311"). Each file
+    starts with the interpreter's bytecode magic number and the source digest. A file is only used if both match,
+    otherwise it is ignored and replaced. Like __pycache__ the directory must only be writable by trusted users,
+    because marshal data is not safe to load from an untrusted source.
+
+    hashlib, marshal, tempfile, and importlib.util are imported on first use to keep the package import fast.
+
+    Args:
+        directory (str): Directory for the cache files. It is created if it does not exist.
+    """
+    SUFFIX = '.dcp'
+
+    def __init__(self, directory):
+        import importlib.util
+        self.MAGIC = importlib.util.MAGIC_NUMBER
+        self.directory = os.path.abspath(directory)
+        self.tag = sys.implementation.cache_tag or sys.implementation.name
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def digest(self, source):
+        import hashlib
+        return hashlib.sha256(source.encode('utf-8')).digest()
+
+    def filename(self, digest):
+        return os.path.join(self.directory, '{}.{}{}'.format(digest.hex(), self.tag, self.SUFFIX))
+
+    def load(self, source, digest=None):
+        """Return the cached code object for the source or None."""
+        if digest is None:
+            digest = self.digest(source)
+        import marshal
+        header = self.MAGIC + digest
+        try:
+            with open(self.filename(digest), 'rb') as f:
+                data = f.read()
+            if data[:len(header)] != header:
+                raise ValueError('Invalid cache file header')
+            code = marshal.loads(data[len(header):])
+            if not isinstance(code, types.CodeType):
+                raise TypeError('Invalid cache file contents')
+        except (OSError, ValueError, EOFError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return code
+
+    def save(self, source, code, digest=None):
+        """Atomically write the code object for the source. Errors (read-only directory) are ignored."""
+        import marshal
+        import tempfile
+        if digest is None:
+            digest = self.digest(source)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.MAGIC + digest + marshal.dumps(code))
+                os.replace(tmp, self.filename(digest))
+            except BaseException:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                raise
+        except (OSError, ValueError):
+            return False
+        self.writes += 1
+        return True
+
+    def clear(self):
+        """Remove all cache files for this interpreter."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        suffix = '.{}{}'.format(self.tag, self.SUFFIX)
+        for name in names:
+            if name.endswith(suffix):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+class CodeCache:
+    """Least recently used cache of compiled code objects keyed by the generated source.
+
+    Args:
+        maxsize (int)[1024]: Maximum number of code objects to keep. None is unbounded and 0 disables the cache.
+        directory (str)[None]: Optional directory to also store the code objects on disk (see DiskCodeCache).
+    """
+    def __init__(self, maxsize=1024, directory=None):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.disk = None
+        self._codes = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            self.set_directory(directory)
+
+    def set_directory(self, directory):
+        """Set the directory for the on disk cache. None disables the on disk cache."""
+        self.disk = DiskCodeCache(directory) if directory else None
+
+    def compile(self, source):
+        """Compile the source code or return the cached code object."""
+        with self._lock:
+            try:
+                code = self._codes[source]
+            except KeyError:
+                pass
+            else:
+                self._codes.move_to_end(source)
+                self.hits += 1
+                return code
+            self.misses += 1
+
+        disk = self.disk
+        if disk is not None:
+            digest = disk.digest(source)
+            code = disk.load(source, digest)
+            if code is None:
+                code = self.compile_source(source)
+                disk.save(source, code, digest)
+        else:
+            code = self.compile_source(source)
+
+        if self.maxsize != 0:
+            with self._lock:
+                self._codes[source] = code
+                if self.maxsize is not None:
+                    while len(self._codes) > self.maxsize:
+                        self._codes.popitem(last=False)
+        return code
+
+    @staticmethod
+    def compile_source(source):
+        return compile(source, '<string>', 'exec')
+
+    def info(self):
+        """Return the CacheInfo(hits, misses, maxsize, currsize) like functools.lru_cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._codes))
+
+    def clear(self):
+        """Remove all code objects and reset the counters."""
+        with self._lock:
+            self._codes.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._codes)
+
+
+class FuncBuilder:
+    """Collect the source code of methods and add them all to a class with one `exec` call.
+
+    Args:
+        globals (dict): Globals for the generated functions (the module of the class).
+        code_cache (CodeCache)[None]: Cache to reuse the compiled code for classes with the same layout.
+    """
+    def __init__(self, globals, code_cache=None):
+        self.code_cache = code_cache
+        self.fns = None
+        self._lock = threading.Lock()
+        self.names = []
+        self.src = []
+        self.globals = globals
+        self.locals = {}
+        self.overwrite_errors = {}
+        self.unconditional_adds = {}
+
+    def add_fn(self, name, args, body, *, locals=None, return_type=MISSING,
+               overwrite_error=False, unconditional_add=False, decorator=None):
+        """Add the source of a function to be compiled.
+
+        Args:
+            name (str): Name of the function.
+            args (list): Parameter strings.
+            body (list): Lines of the function body (without indentation).
+            locals (dict)[None]: Values the function references. Names must be unique for all functions.
+            return_type (object)[MISSING]: Return annotation.
+            overwrite_error (bool/str)[False]: Raise a TypeError if the class already defines this attribute.
+                If a string is given it is appended to the error message.
+            unconditional_add (bool)[False]: Always set the attribute even if the class already defines it.
+            decorator (str)[None]: Decorator expression for the function (evaluated with the locals).
+        """
+        if locals is not None:
+            self.locals.update(locals)
+
+        if overwrite_error:
+            self.overwrite_errors[name] = overwrite_error
+        if unconditional_add:
+            self.unconditional_adds[name] = True
+
+        self.names.append(name)
+
+        if return_type is not MISSING:
+            self.locals[f'__dataclass_{name}_return_type__'] = return_type
+            return_annotation = f'->__dataclass_{name}_return_type__'
+        else:
+            return_annotation = ''
+        args = ','.join(args)
+        body = '\n'.join(f'  {b}' for b in body)
+
+        decorator = f' @{decorator}\n' if decorator else ''
+        self.src.append(f'{decorator} def {name}({args}){return_annotation}:\n{body}')
+
+    def source(self):
+        """Return the source of the function that creates and returns all of the functions."""
+        fns_src = '\n'.join(self.src)
+        local_vars = ','.join(self.locals.keys())
+
+        # Need to handle the 0-tuple specially.
+        if len(self.names) == 0:
+            return_names = '()'
+        else:
+            return_names = f'({",".join(self.names)},)'
+
+        # A simplified version of the generated source:
+        # def __create_fn__(__dataclass_type_x__, __dataclass_dflt_x__):
+        #  def __init__(self, x:__dataclass_type_x__=__dataclass_dflt_x__):
+        #   self.x=x
+        #  @__dataclass_recursive_repr__
+        #  def __repr__(self):
+        #   return self.__class__.__qualname__ + f"(x={self.x!r})"
+        #  return (__init__,__repr__,)
+        return f'def __create_fn__({local_vars}):\n{fns_src}\n return {return_names}'
+
+    def create_fns(self):
+        """Compile the source and return the list of (name, function)."""
+        source = self.source()
+        if self.code_cache is not None:
+            code = self.code_cache.compile(source)
+        else:
+            code = CodeCache.compile_source(source)
+
+        # Executing the code object only creates __create_fn__ with this class's globals. Calling it binds the
+        # locals (types, defaults, cls) to new closures.
+        ns = {}
+        exec(code, self.globals, ns)
+        fns = ns['__create_fn__'](**self.locals)
+        return list(zip(self.names, fns))
+
+    def get_fns(self, cls):
+        """Compile the functions once (thread safe) and return the dictionary of {name: function}."""
+        if self.fns is None:
+            with self._lock:
+                if self.fns is None:
+                    fns = {}
+                    for name, fn in self.create_fns():
+                        func = getattr(fn, '__func__', fn)  # classmethod
+                        func.__qualname__ = f'{cls.__qualname__}.{func.__name__}'
+                        fns[name] = fn
+                    self.fns = fns
+        return self.fns
+
+    def add_fns_to_class(self, cls, set_new_attribute=None):
+        """Compile all of the functions and add them to the class.
+
+        Args:
+            cls (type): Class to add the functions to.
+            set_new_attribute (callable)[None]: Function(cls, name, value) that sets the attribute if it is not
+                already defined in the class and returns True if it was already defined.
+        """
+        if set_new_attribute is None:
+            set_new_attribute = dataclasses._set_new_attribute
+
+        for name, fn in self.get_fns(cls).items():
+            self._set_attribute(cls, name, fn, set_new_attribute)
+
+    def add_lazy_fns_to_class(self, cls, set_new_attribute=None):
+        """Add LazyMethod placeholders to the class. All functions are compiled when one is first accessed."""
+        if set_new_attribute is None:
+            set_new_attribute = dataclasses._set_new_attribute
+
+        for name in self.names:
+            self._set_attribute(cls, name, LazyMethod(self, name), set_new_attribute)
+
+    def _set_attribute(self, cls, name, value, set_new_attribute):
+        if self.unconditional_adds.get(name, False):
+            setattr(cls, name, value)
+        else:
+            already_exists = set_new_attribute(cls, name, value)
+
+            # See if it's an error to overwrite this particular function.
+            msg_extra = self.overwrite_errors.get(name)
+            if already_exists and msg_extra:
+                error_msg = (f'Cannot overwrite attribute {name} '
+                             f'in class {cls.__name__}')
+                if msg_extra is not True:
+                    error_msg = f'{error_msg} {msg_extra}'
+                raise TypeError(error_msg)
+
+
+def _defining_class(descriptor, name, owner):
+    """Return the class in the owner's MRO that has the descriptor in its __dict__."""
+    for klass in owner.__mro__:
+        if klass.__dict__.get(name, None) is descriptor:
+            return klass
+    return owner
+
+
+class LazyMethod:
+    """Placeholder for a generated method that is compiled on first access.
+
+    Accessing any of the placeholders of a builder compiles all of its functions with one `exec` and replaces
+    the placeholders in the class with the real functions.
+    """
+    def __init__(self, func_builder, name):
+        self.func_builder = func_builder
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        cls = _defining_class(self, self.name, owner)
+        fns = self.func_builder.get_fns(cls)
+        for name, fn in fns.items():
+            placeholder = cls.__dict__.get(name, None)
+            if isinstance(placeholder, LazyMethod) and placeholder.func_builder is self.func_builder:
+                setattr(cls, name, fn)
+        return fns[self.name].__get__(instance, owner)
+
+    def __repr__(self):
+        return '<{} {!r}>'.format(type(self).__name__, self.name)
+
+
+class LazyDoc:
+    """Placeholder for the class doc-string that is computed on first access.
+
+    Args:
+        make_doc (callable): Function(cls) that returns the doc-string.
+    """
+    def __init__(self, make_doc):
+        self.make_doc = make_doc
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        cls = _defining_class(self, '__doc__', owner)
+        doc = self.make_doc(cls)
+        if cls.__dict__.get('__doc__', None) is self:
+            cls.__doc__ = doc
+        return doc
@@ -0,0 +1,78 @@
+"""
+Compact instance storage for `dataclass(storage='compact')`.
+
+All of the values of an instance are kept in one list in the `__dataclass_values__` slot instead of one attribute
+per value. Each storage name (the field name for normal fields, the backing attributes for properties) is a
+CompactAttribute descriptor that reads and writes its position in the list. Property getters and setters keep
+using `self._x`, so they do not need to change.
+"""
+
+__all__ = ['VALUES', 'UNSET', 'CompactAttribute', 'compact_getter', 'compact_setter']
+
+
+VALUES = '__dataclass_values__'
+
+
+class _Unset:
+    """Marker for a position in the value list that was never assigned."""
+    def __repr__(self):
+        return '<UNSET>'
+
+    def __reduce__(self):
+        return 'UNSET'
+
+
+UNSET = _Unset()
+
+
+class CompactAttribute:
+    """Descriptor for one position in the value list.
+
+    Args:
+        name (str): Attribute name.
+        index (int): Position in the value list.
+    """
+    __slots__ = ('name', 'index')
+
+    def __init__(self, name, index):
+        self.name = name
+        self.index = index
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dataclass_values__[self.index]
+        if value is UNSET:
+            raise AttributeError(self.name)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dataclass_values__[self.index] = value
+
+    def __delete__(self, instance):
+        values = instance.__dataclass_values__
+        if values[self.index] is UNSET:
+            raise AttributeError(self.name)
+        values[self.index] = UNSET
+
+    def __repr__(self):
+        return '<{} {!r} at {}>'.format(type(self).__name__, self.name, self.index)
+
+
+def compact_getter(index, name):
+    """Return a getter function for a property that reads its position in the value list."""
+    def fget(self):
+        value = self.__dataclass_values__[index]
+        if value is UNSET:
+            raise AttributeError(name)
+        return value
+    fget.__name__ = name
+    return fget
+
+
+def compact_setter(index, name):
+    """Return a setter function for a property that writes its position in the value list."""
+    def fset(self, value):
+        self.__dataclass_values__[index] = value
+    fset.__name__ = name
+    return fset
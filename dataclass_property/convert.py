@@ -0,0 +1,75 @@
+"""
+Recursive conversion of field values for the generated `_asdict` and `_astuple` methods.
+
+`dataclasses.asdict` checks every value with `is_dataclass` and `isinstance` and deep copies everything else.
+These functions look up a converter for the exact type of each value once and cache it. Atomic values (numbers,
+strings, None) are returned as they are. Instances of classes with a generated `_asdict`/`_astuple` call it with
+`mode='recursive'`. Other dataclasses, lists, tuples, namedtuples and dicts are converted like `dataclasses.asdict`
+and `dataclasses.astuple` do, and other values are deep copied.
+"""
+import copy
+import types
+import dataclasses
+
+
+__all__ = ['ATOMIC_TYPES', 'MAX_CONVERTERS', 'asdict_value', 'astuple_value']
+
+
+# Immutable values that do not need to be converted or copied
+ATOMIC_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes, types.FunctionType, type))
+
+
+def _identity(value):
+    return value
+
+
+def _is_namedtuple(tp):
+    return issubclass(tp, tuple) and hasattr(tp, '_fields')
+
+
+def _make_converter(tp, method, convert, dataclass_func):
+    """Return the function that converts values of the exact type tp."""
+    if tp in ATOMIC_TYPES:
+        return _identity
+    if dataclasses.is_dataclass(tp):
+        if method in tp.__dict__:  # Generated by this package for this class
+            return lambda value: getattr(value, method)('recursive')
+        return dataclass_func
+    if _is_namedtuple(tp):
+        return lambda value: tp(*[convert(v) for v in value])
+    if issubclass(tp, (list, tuple)):
+        return lambda value: tp(convert(v) for v in value)
+    if issubclass(tp, dict):
+        if hasattr(tp, 'default_factory'):  # defaultdict
+            return lambda value: tp(value.default_factory, {convert(k): convert(v) for k, v in value.items()})
+        return lambda value: tp((convert(k), convert(v)) for k, v in value.items())
+    return copy.deepcopy
+
+
+# {type: converter}. Cleared when it gets large, so classes that are created dynamically are not kept alive.
+MAX_CONVERTERS = 1024
+_ASDICT_CONVERTERS = {}
+_ASTUPLE_CONVERTERS = {}
+
+
+def _find_converter(converters, tp, method, convert, dataclass_func):
+    if len(converters) >= MAX_CONVERTERS:
+        converters.clear()
+    converter = converters[tp] = _make_converter(tp, method, convert, dataclass_func)
+    return converter
+
+
+def asdict_value(value):
+    """Return the value of a field for `_asdict(mode='recursive')`."""
+    converter = _ASDICT_CONVERTERS.get(type(value), None)
+    if converter is None:
+        converter = _find_converter(_ASDICT_CONVERTERS, type(value), '_asdict', asdict_value, dataclasses.asdict)
+    return converter(value)
+
+
+def astuple_value(value):
+    """Return the value of a field for `_astuple(mode='recursive')`."""
+    converter = _ASTUPLE_CONVERTERS.get(type(value), None)
+    if converter is None:
+        converter = _find_converter(_ASTUPLE_CONVERTERS, type(value), '_astuple', astuple_value, dataclasses.astuple)
+    return converter(value)
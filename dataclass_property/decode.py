@@ -0,0 +1,320 @@
+"""
+Compiled nested `from_dict` decoders (the inverse of `asdict`).
+
+The field types of a class are resolved once, the first time the class is decoded. A function is generated for the
+class that copies the dict and only converts the fields that need it:
+
+  * Dataclasses (nested dicts are decoded with the class's own decoder).
+  * `list[T]`, `tuple[T, ...]`, `tuple[A, B]`, `set[T]`, `frozenset[T]` and `dict[K, V]` (or the `typing` aliases).
+  * `Optional[T]` (`T | None`).
+
+Values of other types (int, str, Any, other unions, unresolved string annotations) are passed on as they are. The
+decoders are cached per class, so a class that contains itself (a tree) is supported.
+
+With validate=True the class is called, so the property setters run. With validate=False the class's `_construct`
+(`dataclass(construct=True)`) is used, which writes the values to the storage without running the setters. Classes
+without it are called. Errors are raised as FromDictError
+with the path of the value (e.g. "points[2].x") and the original error.
+
+typing is imported on first use to keep the package import fast.
+"""
+import sys
+import types
+import threading
+import dataclasses
+
+from .field_prop import PropertyField
+from .codegen import FuncBuilder
+
+
+__all__ = ['FromDictError', 'MAX_DECODERS', 'decoder', 'from_dict', 'clear_decoders']
+
+
+class FromDictError(ValueError):
+    """Error decoding a value with `from_dict`.
+
+    Args:
+        location (str): Path of the value starting with "." or "[" ("" for the top level object).
+        error (Exception): Original error.
+
+    Attributes:
+        path (str): Path of the value that could not be decoded like "points[2].x" ("" for the top level object).
+        error (Exception): Original error (also set as `__cause__`).
+    """
+    def __init__(self, location, error):
+        super().__init__(location, error)
+        self.location = location
+        self.error = error
+
+    @property
+    def path(self):
+        return self.location[1:] if self.location.startswith('.') else self.location
+
+    def __str__(self):
+        error = '{}: {}'.format(type(self.error).__name__, self.error)
+        return '{}: {}'.format(self.path, error) if self.location else error
+
+
+def _raise(step, err):
+    """Raise a FromDictError for the error with the step (".name", "[0]") prepended to its path."""
+    if isinstance(err, FromDictError):
+        step, err = step + err.location, err.error
+    raise FromDictError(step, err) from err
+
+
+def _not_mapping(cls, data):
+    _raise('', TypeError('{} expects a mapping, got {}'.format(cls.__name__, type(data).__name__)))
+
+
+def _setter_field(fields):
+    """Return a function(error) that returns the location of the property whose setter raised the error."""
+    names = {}
+    for f in fields:
+        fset = f.prop.fset if isinstance(f, PropertyField) else None
+        code = getattr(fset, '__code__', None)
+        if code is not None:
+            # Passthrough properties can share a setter, so their errors cannot be matched to a field
+            names[code] = None if code in names else '.' + f.name
+
+    def setter_field(err):
+        tb = err.__traceback__
+        while tb is not None:
+            location = names.get(tb.tb_frame.f_code, None)
+            if location is not None:
+                return location
+            tb = tb.tb_next
+        return ''
+    return setter_field
+
+
+# ===== Converters for field types (None means the value is used as it is) =====
+def _list_converter(convert, tp=list):
+    def convert_list(value):
+        result = []
+        append = result.append
+        try:
+            for item in value:
+                append(convert(item))
+        except Exception as err:
+            _raise('[{}]'.format(len(result)), err)
+        return result if tp is list else tp(result)
+    return convert_list
+
+
+def _tuple_converter(converters):
+    def convert_tuple(value):
+        if len(value) != len(converters):
+            _raise('', ValueError('expected {} items, got {}'.format(len(converters), len(value))))
+        result = []
+        append = result.append
+        try:
+            for convert, item in zip(converters, value):
+                append(item if convert is None else convert(item))
+        except Exception as err:
+            _raise('[{}]'.format(len(result)), err)
+        return tuple(result)
+    return convert_tuple
+
+
+def _dict_converter(convert_key, convert_value):
+    convert_key = convert_key or _identity
+    convert_value = convert_value or _identity
+
+    def convert_dict(value):
+        result = {}
+        key = None
+        try:
+            for key, item in value.items():
+                result[convert_key(key)] = convert_value(item)
+        except Exception as err:
+            _raise('[{!r}]'.format(key), err)
+        return result
+    return convert_dict
+
+
+def _optional_converter(convert):
+    def convert_optional(value):
+        return None if value is None else convert(value)
+    return convert_optional
+
+
+def _identity(value):
+    return value
+
+
+def _converter(tp, validate):
+    """Return the function that converts a value for the type or None if the value is used as it is."""
+    import typing
+
+    if isinstance(tp, dataclasses.InitVar):
+        tp = tp.type
+    if isinstance(tp, type) and dataclasses.is_dataclass(tp):
+        return _class_converter(tp, validate)
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is not None and origin is getattr(typing, 'Annotated', None):  # Python 3.9+
+        return _converter(args[0], validate)
+    if origin is typing.Union or isinstance(tp, getattr(types, 'UnionType', ())):
+        members = [a for a in args if a is not type(None)]
+        if len(members) == 1 and len(args) == 2:
+            convert = _converter(members[0], validate)
+            return convert and _optional_converter(convert)
+        return None  # The type of other unions cannot be decided from the value
+    if origin in (list, set, frozenset):
+        convert = _converter(args[0], validate) if args else None
+        if convert is None:
+            return None if origin is list else origin
+        return _list_converter(convert, origin)
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            convert = _converter(args[0], validate)
+            return tuple if convert is None else _list_converter(convert, tuple)
+        if not args or args == ((),):
+            return tuple
+        converters = tuple(_converter(a, validate) for a in args)
+        return _tuple_converter(converters) if any(converters) else tuple
+    if origin is dict:
+        convert_key, convert_value = (_converter(a, validate) for a in args) if args else (None, None)
+        if convert_key is None and convert_value is None:
+            return None
+        return _dict_converter(convert_key, convert_value)
+    if tp in (tuple, set, frozenset):
+        return tp  # JSON arrays are lists
+    return None
+
+
+def _class_converter(cls, validate):
+    # A class that contains itself (a tree) gets the decoder that is being compiled when it is called
+    cell = _COMPILING.get((cls, validate), None)
+    if cell is not None:
+        return lambda value: cell[0](value)
+    return decoder(cls, validate)
+
+
+def _field_types(cls):
+    """Return {name: type} with the string annotations of the fields evaluated if possible."""
+    import typing
+
+    try:
+        return typing.get_type_hints(cls, localns={cls.__name__: cls})
+    except Exception:
+        pass
+
+    # Evaluate each annotation separately (classes defined in a function cannot be found by name)
+    module = sys.modules.get(cls.__module__, None)
+    hints = {}
+    for f in dataclasses.fields(cls):
+        tp = f.type
+        if isinstance(tp, str):
+            try:
+                tp = eval(tp, dict(getattr(module, '__dict__', {})), {cls.__name__: cls})
+            except Exception:
+                pass
+        hints[f.name] = tp
+    return hints
+
+
+def _compile(cls, validate):
+    """Generate the decoder function for the class."""
+    make = cls
+    if not validate and hasattr(cls, '_construct'):
+        make = cls._construct
+    fields = [f for f in getattr(cls, dataclasses._FIELDS).values() if f._field_type is not dataclasses._FIELD_CLASSVAR]
+    hints = _field_types(cls)
+
+    locals = {
+        '__dataclass_cls__': cls,
+        '__dataclass_dict__': dict,
+        '__dataclass_make__': make,
+        '__dataclass_raise__': _raise,
+        '__dataclass_not_mapping__': _not_mapping,
+        '__dataclass_setter_field__': _setter_field(fields),
+        }
+    body = ['if type(data) is __dataclass_cls__:',
+            ' return data',
+            'try:',
+            ' __dataclass_kw__=__dataclass_dict__(data)',
+            'except (TypeError, ValueError):',
+            ' __dataclass_not_mapping__(__dataclass_cls__, data)']
+    for f in fields:
+        if make is cls and not f.init:
+            # Computed fields (included by asdict) cannot be given to __init__
+            body.append(f'__dataclass_kw__.pop({f.name!r}, None)')
+            continue
+
+        convert = _converter(hints.get(f.name, f.type), validate)
+        if convert is None:
+            continue
+        name = f'__dataclass_convert_{f.name}__'
+        locals[name] = convert
+        body += [f'if {f.name!r} in __dataclass_kw__:',
+                 ' try:',
+                 f'  __dataclass_kw__[{f.name!r}]={name}(__dataclass_kw__[{f.name!r}])',
+                 ' except Exception as __dataclass_err__:',
+                 f'  __dataclass_raise__({"." + f.name!r}, __dataclass_err__)']
+    body += ['try:',
+             ' return __dataclass_make__(**__dataclass_kw__)',
+             'except Exception as __dataclass_err__:',
+             ' __dataclass_raise__(__dataclass_setter_field__(__dataclass_err__), __dataclass_err__)']
+
+    func_builder = FuncBuilder({})
+    func_builder.add_fn('from_dict', ['data'], body, locals=locals)
+    return func_builder.get_fns(cls)['from_dict']
+
+
+# {(cls, validate): decoder}. Cleared when it gets large, so classes that are created dynamically are not kept alive.
+MAX_DECODERS = 1024
+_DECODERS = {}
+_COMPILING = {}  # {(cls, validate): [decoder]} filled when the class is compiled
+_LOCK = threading.RLock()
+
+
+def decoder(cls, validate=True):
+    """Return the compiled function(data) that creates an instance of the dataclass from a (nested) dict.
+
+    Args:
+        cls (type): Dataclass.
+        validate (bool)[True]: Run the property setters. If False the values are stored with `cls._construct` (if the
+            class has it).
+    """
+    key = (cls, validate)
+    try:
+        return _DECODERS[key]
+    except KeyError:
+        pass
+
+    with _LOCK:
+        if key in _DECODERS:
+            return _DECODERS[key]
+        cell = _COMPILING[key] = []
+        try:
+            decode = _compile(cls, validate)
+        finally:
+            del _COMPILING[key]
+        cell.append(decode)
+        if len(_DECODERS) >= MAX_DECODERS:
+            _DECODERS.clear()
+        _DECODERS[key] = decode
+        return decode
+
+
+def from_dict(cls, data, validate=True):
+    """Create an instance of the dataclass from a (nested) dict like the one `asdict` returns.
+
+    Args:
+        cls (type): Dataclass.
+        data (dict): Field values. Nested dataclasses, lists, tuples and dicts are converted for the field types.
+        validate (bool)[True]: Run the property setters. If False the values are stored with `cls._construct` (if the
+            class has it).
+
+    Raises:
+        FromDictError: If a value could not be decoded. The error has the path of the value.
+    """
+    return decoder(cls, validate)(data)
+
+
+def clear_decoders():
+    """Remove the compiled decoders (after a class's field types were changed)."""
+    with _LOCK:
+        _DECODERS.clear()
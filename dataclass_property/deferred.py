@@ -0,0 +1,145 @@
+"""
+Deferred class processing for `dataclass(defer=True)`.
+
+The decorator only installs two placeholders on the class. The class is built (annotate_properties and
+_process_class) the first time one of them is used:
+
+  * `__init__`: creating the first instance.
+  * `__dataclass_fields__`: `fields()`, `is_dataclass()`, `asdict()` or decorating a dataclass subclass.
+  * Generated classmethods (`from_records`, `from_columns`, `pack_many`, ...).
+  * The generated copy and pickle methods of `state=True` (`__setstate__` when an instance is unpickled in a new
+    process).
+
+Placeholders of methods that the build does not generate are removed, so inherited methods are used.
+"""
+import types
+import threading
+import dataclasses
+
+
+__all__ = ['DeferredClass', 'DeferredFields', 'DeferredInit', 'DeferredMethod', 'is_deferred', 'build_deferred']
+
+
+class DeferredClass:
+    """Keep the state of a class that has not been built yet.
+
+    Args:
+        cls (type): Class to build later.
+        build (callable): Function(cls) that builds the dataclass.
+        generates_init (bool): If the build will add an `__init__` method.
+        methods (tuple)[()]: Names of generated class attributes that build the class when they are accessed.
+    """
+    def __init__(self, cls, build, generates_init, methods=()):
+        self.cls = cls
+        self.build_func = build
+        self.generates_init = generates_init
+        self.original_init = cls.__dict__.get('__init__', None)
+        self.built = False
+        self.error = None
+        self.lock = threading.RLock()
+        self.methods = {}  # {name: DeferredMethod}
+
+        self.fields_placeholder = DeferredFields(self)
+        self.init_placeholder = DeferredInit(self)
+        setattr(cls, dataclasses._FIELDS, self.fields_placeholder)
+        setattr(cls, '__init__', self.init_placeholder)
+        for name in methods:
+            if name not in cls.__dict__:
+                self.methods[name] = DeferredMethod(self, name)
+                setattr(cls, name, self.methods[name])
+
+    def build(self):
+        """Build the class once. Other threads wait until the build is finished."""
+        if self.built:
+            return
+        with self.lock:
+            if self.built:
+                return
+            if self.error is not None:
+                raise self.error
+
+            cls = self.cls
+            if not self.generates_init:
+                # The class keeps its own (or inherited) __init__. Put it back before building, so the
+                # signature used for the class doc-string is correct.
+                if self.original_init is not None:
+                    setattr(cls, '__init__', self.original_init)
+                else:
+                    delattr(cls, '__init__')
+
+            try:
+                self.build_func(cls)
+            except BaseException as err:
+                self.error = err
+                raise
+            for name, placeholder in self.methods.items():
+                if cls.__dict__.get(name, None) is placeholder:
+                    delattr(cls, name)
+            self.built = True
+
+    def __repr__(self):
+        return '<{} {}>'.format(type(self).__name__, self.cls.__qualname__)
+
+
+class DeferredFields:
+    """Placeholder for `__dataclass_fields__` which builds the class when it is accessed."""
+    def __init__(self, deferred):
+        self.deferred = deferred
+
+    def __get__(self, instance, owner=None):
+        self.deferred.build()
+        fields = self.deferred.cls.__dict__.get(dataclasses._FIELDS, None)
+        if fields is self:
+            raise AttributeError(dataclasses._FIELDS)
+        return fields
+
+
+class DeferredInit:
+    """Placeholder for `__init__` which builds the class when the first instance is created."""
+    def __init__(self, deferred):
+        self.deferred = deferred
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __call__(self, instance, *args, **kwargs):
+        self.deferred.build()
+        cls = self.deferred.cls
+        if cls.__dict__.get('__init__', None) is self:
+            raise TypeError('{} was not built correctly'.format(cls.__qualname__))
+        return cls.__init__(instance, *args, **kwargs)
+
+
+class DeferredMethod:
+    """Placeholder for a generated class attribute which builds the class when it is accessed."""
+    def __init__(self, deferred, name):
+        self.deferred = deferred
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        self.deferred.build()
+        if self.deferred.cls.__dict__.get(self.name, None) is self:
+            raise AttributeError(self.name)
+        return getattr(owner if instance is None else instance, self.name)
+
+
+def is_deferred(cls):
+    """Return True if the class was decorated with defer=True and has not been built yet."""
+    if not isinstance(cls, type):
+        cls = type(cls)
+    placeholder = cls.__dict__.get(dataclasses._FIELDS, None)
+    return isinstance(placeholder, DeferredFields)
+
+
+def build_deferred(cls):
+    """Build a class that was decorated with defer=True. Does nothing if the class is already built."""
+    if not isinstance(cls, type):
+        cls = type(cls)
+    placeholder = cls.__dict__.get(dataclasses._FIELDS, None)
+    if isinstance(placeholder, DeferredFields):
+        placeholder.deferred.build()
+    return cls
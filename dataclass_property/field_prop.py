@@ -1,19 +1,83 @@
-import inspect
-import functools
-from typing import Callable, Any, Union, Mapping, Optional
+from __future__ import annotations
 
+import sys
+import types
+import inspect
+import weakref
 import dataclasses
 
+# typing is only needed for the annotations. Do not pay for importing it at runtime.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Any
+
 
-__all__ = ['get_return_type', 'field_property']
+__all__ = ['get_return_annotation', 'get_return_type', 'getter_storage', 'setter_storage', 'passthrough_setter',
+           'PropertyField', 'field_property']
 
 
 MISSING = dataclasses.MISSING
 
 
+_RETURN_ANNOTATIONS = weakref.WeakKeyDictionary()
+
+
+def get_return_annotation(func: Callable) -> Any:
+    """Return the return annotation of a function without calling it.
+
+    The function's `__annotations__` are read directly (following `__wrapped__`) instead of building a full
+    `inspect.signature`. Results are cached per function object.
+
+    Args:
+        func (callable/function): Function, staticmethod, or classmethod to get the return annotation for.
+
+    Returns:
+        annotation (type/str/object)[MISSING]: The return annotation or MISSING if the function has none.
+    """
+    if isinstance(func, (staticmethod, classmethod)):
+        func = func.__func__
+
+    try:
+        return _RETURN_ANNOTATIONS[func]
+    except KeyError:
+        pass
+    except TypeError:
+        return _find_return_annotation(func)  # Not weak referenceable or hashable
+
+    annotation = _find_return_annotation(func)
+    _RETURN_ANNOTATIONS[func] = annotation
+    return annotation
+
+
+def _find_return_annotation(func):
+    seen = set()
+    while func is not None and id(func) not in seen:
+        seen.add(id(func))
+        if isinstance(func, (types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+            annotations = getattr(func, '__annotations__', None) or {}
+            try:
+                return annotations['return']
+            except KeyError:
+                pass
+        elif not isinstance(func, type) and callable(func) and not hasattr(func, '__wrapped__'):
+            # Other callables (partial, callable objects). Still never called.
+            try:
+                annotation = inspect.signature(func).return_annotation
+            except (ValueError, TypeError):
+                break
+            if annotation is not inspect.Signature.empty:
+                return annotation
+            break
+        func = getattr(func, '__wrapped__', None)
+    return MISSING
+
+
 def get_return_type(default: Any = MISSING, default_factory: Callable[[], Any] = MISSING):
     """Find the return type for the default value or default_factory.
 
+    The default_factory is never called. The type comes from the factory's return annotation, the type of the
+    default value, or the factory itself if it is a class (`list`, `dict`, ...).
+
     Args:
         default (object)[MISSING]: is the default value of the field.
         default_factory (callable/function)[MISSING]: is a 0-argument function called to initialize a field's value.
@@ -22,19 +86,173 @@ def get_return_type(default: Any = MISSING, default_factory: Callable[[], Any] =
         return_type (type/object)[MISSING]: The type of the default or MISSING if not found.
     """
     # Fields must have an annotation
-    return_type = inspect.signature(default_factory).return_annotation
-    if return_type == inspect.Signature.empty:
-        return_type = MISSING
-        if default != MISSING:
+    return_type = MISSING
+    if default_factory is not MISSING:
+        return_type = get_return_annotation(default_factory)
+    if return_type is MISSING:
+        if default is not MISSING:
             return_type = type(default)
-        elif default_factory != MISSING:
-            try:
-                return_type = type(default_factory())
-            except (ValueError, TypeError, Exception):
-                pass
+        elif isinstance(default_factory, type):
+            return_type = default_factory
     return return_type
 
 
+_LOAD_ATTR_SHIFT = sys.version_info >= (3, 12)  # LOAD_ATTR has a method flag in the low bit
+
+
+def _instructions(func):
+    """Return the (opname, argval) bytecode instructions of a function without the no-op instructions or None.
+
+    Only the arguments of the instructions used to find the backing storage are resolved. This is a lot faster
+    than `dis.get_instructions`.
+    """
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+
+    import opcode  # Only needed while decorating a class
+
+    instructions = []
+    raw = code.co_code
+    extended = 0
+    for i in range(0, len(raw), 2):
+        opname = opcode.opname[raw[i]]
+        arg = raw[i + 1] | extended
+        if opname == 'EXTENDED_ARG':
+            extended = arg << 8
+            continue
+        extended = 0
+
+        if opname in ('CACHE', 'RESUME', 'NOP'):
+            continue
+        elif opname.startswith('LOAD_FAST'):
+            if opname.count('LOAD_FAST') == 2:  # LOAD_FAST_LOAD_FAST pushes two locals
+                argval = (code.co_varnames[arg >> 4], code.co_varnames[arg & 15])
+            else:
+                argval = code.co_varnames[arg]
+        elif opname in ('STORE_ATTR', 'DELETE_ATTR', 'LOAD_METHOD'):
+            argval = code.co_names[arg]
+        elif opname == 'LOAD_ATTR':
+            argval = code.co_names[arg >> 1 if _LOAD_ATTR_SHIFT else arg]
+        elif opname == 'LOAD_CONST':
+            argval = code.co_consts[arg]
+        else:
+            argval = None
+        instructions.append((opname, argval))
+    return instructions
+
+
+def getter_storage(fget: Callable) -> str:
+    """Return the attribute name if the getter is exactly `return self.<name>`, else None."""
+    instructions = _instructions(fget)
+    if not instructions or len(instructions) != 3 or fget.__code__.co_argcount != 1:
+        return None
+
+    load, attr, ret = instructions
+    if (_loads_self(load, fget.__code__.co_varnames[0])
+            and attr[0] == 'LOAD_ATTR' and ret[0] == 'RETURN_VALUE'):
+        return attr[1]
+    return None
+
+
+def _loads_self(ins, self_name):
+    opname, argval = ins
+    if not opname.startswith('LOAD_FAST'):
+        return False
+    if isinstance(argval, tuple):  # LOAD_FAST_LOAD_FAST (value, self)
+        return argval[-1] == self_name
+    return argval == self_name
+
+
+def setter_storage(fset: Callable) -> tuple:
+    """Return the attribute names a setter assigns or deletes on self.
+
+    Finds `self.<name> = ...`, `del self.<name>` and `object.__setattr__(self, '<name>', ...)`.
+    """
+    instructions = _instructions(fset)
+    if not instructions or fset.__code__.co_argcount < 1:
+        return ()
+
+    self_name = fset.__code__.co_varnames[0]
+    names = []
+    for i in range(1, len(instructions)):
+        ins, prev = instructions[i], instructions[i - 1]
+        if ins[0] in ('STORE_ATTR', 'DELETE_ATTR') and _loads_self(prev, self_name):
+            name = ins[1]
+        elif (ins[0] == 'LOAD_CONST' and isinstance(ins[1], str) and _loads_self(prev, self_name)
+              and i > 1 and instructions[i - 2][1] == '__setattr__'):
+            name = ins[1]
+        else:
+            continue
+        if name not in names:
+            names.append(name)
+    return tuple(names)
+
+
+_PASSTHROUGH_SETTERS = {}
+
+
+def passthrough_setter(storage: str) -> Callable[[Any, Any], None]:
+    """Return a setter function `self.<storage> = value`. Setters are shared for the same storage name."""
+    try:
+        return _PASSTHROUGH_SETTERS[storage]
+    except KeyError:
+        pass
+
+    if not isinstance(storage, str) or not storage.isidentifier():
+        raise ValueError('Invalid storage attribute name {!r}'.format(storage))
+
+    ns = {}
+    exec('def fset(self, value):\n    self.{} = value\n'.format(storage), ns)
+    fset = _PASSTHROUGH_SETTERS[storage] = ns['fset']
+    return fset
+
+
+class PropertyField(dataclasses.Field):
+    """Field created from a property. Keeps the property so the backing storage can be found."""
+    __slots__ = ('prop',)
+
+    @classmethod
+    def from_field(cls, field: dataclasses.Field, prop: property) -> PropertyField:
+        new = cls.__new__(cls)
+        for name in dataclasses.Field.__slots__:
+            try:
+                setattr(new, name, getattr(field, name))
+            except AttributeError:
+                pass  # Not set yet (name, type, _field_type are set by _get_field)
+        new.prop = prop
+        return new
+
+    @property
+    def storage(self) -> str:
+        """Return the attribute that the generated methods may use instead of the property or None.
+
+        Only pass-through properties with the generated setter are bypassed. A custom setter always runs.
+        """
+        prop = self.prop
+        if getattr(prop, 'passthrough', False) and prop.fset is passthrough_setter(prop.storage):
+            return prop.storage
+        return None
+
+
+class _FieldParams:
+    """Compute the dataclasses.field parameters (varname, type, default) the first time they are used.
+
+    The value replaces this descriptor on the class, so later lookups are normal class attribute lookups.
+    """
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        params = [(name, p.annotation, p.default)
+                  for name, p in inspect.signature(dataclasses.field).parameters.items()
+                  if name != 'default' and name != 'default_factory'
+                  ]
+        setattr(self.owner, self.name, params)
+        return params
+
+
 class field_property(property):
 
     get_return_type = staticmethod(get_return_type)
@@ -50,10 +268,7 @@ class field_property(property):
     # FIELD_PARAMS = [('init', bool, True), ('repr', bool, True), ('hash', Union[bool, None], None),
     #                 ('compare', bool, True), ('metadata', Optional[Mapping], None),
     #                 ('kw_only', Optional[bool], MISSING)]  # 'kw_only' is on newer versions of dataclasses
-    FIELD_PARAMS = [(name, p.annotation, p.default)
-                    for name, p in inspect.signature(dataclasses.field).parameters.items()
-                    if name != 'default' and name != 'default_factory'
-                    ]
+    FIELD_PARAMS = _FieldParams()  # Computed from the dataclasses.field signature on first use
 
     @classmethod
     def get_field_params(cls, prop=None, **kwargs):
@@ -75,11 +290,17 @@ class field_property(property):
                  doc: str = None,
                  default: Any = MISSING,
                  default_factory: Callable[[], Any] = MISSING,
+                 storage: str = None,
+                 passthrough: bool = False,
+                 fvec: Callable[[Any, Any], None] = None,
                  **kwargs
                  ):
 
         self.default_attr = default
         self.default_factory_attr = default_factory
+        self.storage = storage
+        self.passthrough = passthrough
+        self.fvec = fvec
         self.name = None
 
         # Set defaults or given keyword arguments for the Field parameters
@@ -99,20 +320,32 @@ class field_property(property):
         field_kwargs = {varname: getattr(self, varname, dv) for (varname, tp, dv) in self.FIELD_PARAMS}
         return type(self)(fget, self.fset, self.fdel, self.__doc__,
                           default=self.default_attr, default_factory=self.default_factory_attr,
+                          storage=self.storage, passthrough=self.passthrough, fvec=self.fvec,
                           **field_kwargs)
 
     def setter(self, fset: Callable[[Any, Any], None]) -> 'field_property':
         field_kwargs = {varname: getattr(self, varname, dv) for (varname, tp, dv) in self.FIELD_PARAMS}
         return type(self)(self.fget, fset, self.fdel, self.__doc__,
                           default=self.default_attr, default_factory=self.default_factory_attr,
+                          storage=self.storage, passthrough=self.passthrough, fvec=self.fvec,
                           **field_kwargs)
 
     def deleter(self, fdel: Callable[[Any], None]) -> 'field_property':
         field_kwargs = {varname: getattr(self, varname, dv) for (varname, tp, dv) in self.FIELD_PARAMS}
         return type(self)(self.fget, self.fset, fdel, self.__doc__,
                           default=self.default_attr, default_factory=self.default_factory_attr,
+                          storage=self.storage, passthrough=self.passthrough, fvec=self.fvec,
                           **field_kwargs)
 
+    def vectorized(self, fvec: Callable[[Any, Any], None]) -> 'field_property':
+        """Register a setter for a whole column of values (used by DataclassArray).
+
+        The function is called with a columns object as `self` and the sequence of values. It validates the
+        values and assigns whole columns to the backing attributes (`self._x = values`).
+        """
+        self.fvec = fvec
+        return self
+
     def default(self, default: Any) -> 'field_property':
         self.default_attr = default
         return self
@@ -1,11 +1,21 @@
+import os
+import sys
 import types
+import operator
 import inspect
+import reprlib
+import itertools
+import builtins
 import dataclasses
 
-from .field_prop import get_return_type, field_property
+from .field_prop import get_return_annotation, get_return_type, getter_storage, setter_storage, \
+    passthrough_setter, PropertyField, field_property
+from .codegen import CodeCache, FuncBuilder, LazyDoc
+from .deferred import DeferredClass, DeferredInit, DeferredMethod
+from .compact import VALUES, UNSET
 
 
-__all__ = ['BaseDataclassInterface']
+__all__ = ['BaseDataclassInterface', 'replace']
 
 
 MISSING = dataclasses.MISSING
@@ -13,35 +23,67 @@ MISSING = dataclasses.MISSING
 
 class BaseDataclassInterface:
     """Basically, I need to override certain methods to support dataclass properties."""
-    # ===== Done below in for loop =====
+    # ===== dataclasses attributes (set below from DATACLASSES_ATTRS) =====
     # field = dataclasses.field
     # Field = dataclasses.Field
     # _FIELD = dataclasses._FIELD
     # _is_classvar = dataclasses._is_classvar
-    # _FIELD_CLASSVAR = dataclasses._FIELD_CLASSVAR
-    # _is_type = dataclasses._is_type
-    # _is_initvar = dataclasses._is_initvar
-    # _FIELD_INITVAR = dataclasses._FIELD_INITVAR
-    # _PARAMS = dataclasses._PARAMS
-    # _DataclassParams = dataclasses._DataclassParams
-    # _FIELDS = dataclasses._FIELDS
-    # _POST_INIT_NAME = dataclasses._POST_INIT_NAME
-    # _set_new_attribute = dataclasses._set_new_attribute
-    # _repr_fn = dataclasses._repr_fn
-    # _tuple_str = dataclasses._tuple_str
-    # _cmp_fn = dataclasses._cmp_fn
-    # _frozen_get_del_attr = dataclasses._frozen_get_del_attr
-    # _hash_action = dataclasses._hash_action
-    # _init_fn = dataclasses._init_fn
+    # ...
+
+    # ===== Code generation (all methods are compiled together by a FuncBuilder) =====
+    FuncBuilder = FuncBuilder
+    # Shared by classes with the same field layout. Optionally stored on disk for new processes.
+    code_cache = CodeCache(maxsize=1024, directory=os.environ.get('DATACLASS_PROPERTY_CACHE_DIR', None))
+
+    get_return_annotation = staticmethod(get_return_annotation)
+    get_return_type = staticmethod(get_return_type)
+    PropertyField = PropertyField
+
+    # Default factories that return an immutable constant. The value is computed once and used as the default.
+    CONSTANT_FACTORIES = frozenset((int, float, complex, bool, str, bytes, tuple, frozenset))
+
+    # Options of dataclass() that add generated methods: {option: method names}. Classes only get the methods
+    # they ask for. Dataclass subclasses also get the methods of their dataclass bases. The methods build a
+    # defer=True class when they are accessed (the copy and pickle methods are needed to unpickle an instance in a
+    # process where the class was not built yet).
+    OPTIONAL_METHODS = {
+        'bulk': ('from_records', 'from_columns'),
+        'codec': ('pack', 'pack_into', 'pack_many', 'unpack', 'iter_unpack'),
+        'construct': ('_construct',),
+        'convert': ('_asdict', '_astuple'),
+        'decode': ('from_dict',),
+        'replace': ('__replace__',),
+        'state': ('__getstate__', '__setstate__', '__reduce_ex__', '__copy__', '__deepcopy__'),
+        }
+    INIT_METHODS = ('from_records', 'from_columns', '__replace__')  # Only generated with init=True
+
+    # Methods that define how an instance is pickled. If a class defines one, the copy and pickle methods are not
+    # generated.
+    STATE_METHODS = ('__getstate__', '__setstate__', '__reduce__', '__reduce_ex__')
+
+    # struct format codes of the field types for the generated binary codec (pack/unpack). Other types, such as
+    # fixed-size bytes ('16s'), are given with the field metadata: field(metadata={'struct': '16s'}).
+    STRUCT_CODES = {bool: '?', int: 'q', float: 'd'}
+    STRUCT_METADATA = 'struct'
+    STRUCT_BYTE_ORDER = '<'  # Little-endian, standard sizes and no padding
+    CODEC_METHODS = OPTIONAL_METHODS['codec']
+
+    # Class attribute with the enabled OPTIONAL_METHODS options of a class
+    _METHODS = '__dataclass_methods__'
+    # Class attribute with the storage names of a class with compact storage (in value list order)
+    _STORAGE = '__dataclass_storage__'
+    # Class attribute with the struct.Struct of the binary codec (None if the fields cannot be packed)
+    _STRUCT = '__dataclass_struct__'
 
     @classmethod
     def annotate_properties(mcs, cls):
-        # Annotate all properties
-        if not hasattr(cls, '__annotations__'):
+        # Annotate all properties.  Before Python 3.10 a class without
+        # annotations finds the __annotations__ of its base class.
+        if '__annotations__' not in cls.__dict__:
             cls.__annotations__ = {}
         for name, attr in cls.__dict__.items():
             if isinstance(attr, property) and name not in cls.__annotations__:
-                return_type = get_return_type(default_factory=attr.fget)
+                return_type = mcs.get_return_type(default_factory=attr.fget)
                 if return_type != MISSING:
                     cls.__annotations__[name] = return_type
 
@@ -57,6 +99,10 @@ class BaseDataclassInterface:
                 # This is a field in __slots__, so it has no default value.
                 default = MISSING
             if isinstance(default, property):
+                prop = default
+                if getattr(prop, 'passthrough', False):
+                    default = mcs.make_passthrough(cls, a_name, prop)
+
                 default_factory_attr = getattr(default, 'default_factory_attr', MISSING)
                 default_attr = getattr(default, 'default_attr', MISSING)
 
@@ -69,22 +115,1250 @@ class BaseDataclassInterface:
                 if default_factory_attr != MISSING:
                     if isinstance(default_factory_attr, (staticmethod, classmethod)):
                         default_factory_attr = default_factory_attr.__get__(cls, cls)
-                    f = mcs.field(default_factory=default_factory_attr, **field_kwargs)
+                    f = mcs.factory_field(default_factory_attr, field_kwargs)
                 elif default_attr != MISSING:
                     f = mcs.field(default=default_attr, **field_kwargs)
                 else:
-                    return_type = inspect.signature(default.fget).return_annotation
-                    if return_type != inspect.Signature.empty and field_kwargs['init']:
-                        default = return_type
-                        f = mcs.field(default_factory=default, **field_kwargs)
+                    return_type = mcs.resolve_type(cls, mcs.get_return_annotation(prop.fget))
+                    if callable(return_type) and field_kwargs['init']:
+                        f = mcs.factory_field(return_type, field_kwargs)
                     else:
-                        default = MISSING
-                        f = mcs.field(default=default, **field_kwargs)
+                        f = mcs.field(default=MISSING, **field_kwargs)
+                f = mcs.PropertyField.from_field(f, default)
             else:
                 f = mcs.field(default=default)
 
         return f
 
-# Set all dataclasses variables in DataclassInterface so the functions can be overridden
-for attr in dir(dataclasses):
-    setattr(BaseDataclassInterface, attr, getattr(dataclasses, attr))
+    @classmethod
+    def factory_field(mcs, default_factory, field_kwargs):
+        """Return a field for a property with a default factory.
+
+        Factories in CONSTANT_FACTORIES (immutable builtin types like `int`) always return an equal immutable
+        value, so they are called once and the result is used as the default.
+        """
+        try:
+            constant = default_factory in mcs.CONSTANT_FACTORIES
+        except TypeError:  # Not hashable
+            constant = False
+        if constant:
+            return mcs.field(default=default_factory(), **field_kwargs)
+        return mcs.field(default_factory=default_factory, **field_kwargs)
+
+    @classmethod
+    def make_passthrough(mcs, cls, name, prop):
+        """Replace a `field_property(passthrough=True)` on the class with fast accessors for its storage.
+
+        The getter becomes `operator.attrgetter(storage)` which does not run a Python function. A setter
+        `self.<storage> = value` is created if the property does not have one. Only the created setter is bypassed by
+        the generated methods; a custom setter still runs in `__init__`. The storage name is the given
+        `storage`, the attribute returned by a `return self.<name>` getter, or `'_' + name`.
+
+        Returns:
+            prop (field_property): New property that was set on the class.
+        """
+        storage = prop.storage or getter_storage(prop.fget) or '_' + name
+        if storage == name:
+            raise ValueError(f'field {name!r} cannot use itself as the pass-through storage')
+
+        fset = prop.fset if prop.fset is not None else passthrough_setter(storage)
+        new_prop = prop.getter(operator.attrgetter(storage)).setter(fset)
+        new_prop.storage = storage
+        new_prop.name = name
+        setattr(cls, name, new_prop)
+        return new_prop
+
+    @classmethod
+    def property_storage(mcs, prop):
+        """Return the names of the attributes a property keeps its value in.
+
+        This is the `storage` given to the field_property or the attributes the setter assigns on self and the
+        attribute a `return self.<name>` getter reads.
+        """
+        storage = getattr(prop, 'storage', None)
+        if storage:
+            return (storage,) if isinstance(storage, str) else tuple(storage)
+
+        names = list(setter_storage(prop.fset)) if prop.fset is not None else []
+        name = getter_storage(prop.fget)
+        if name and name not in names:
+            names.append(name)
+        return tuple(names)
+
+    @classmethod
+    def resolve_type(mcs, cls, annotation):
+        """Resolve a string annotation that is a simple name (`from __future__ import annotations`).
+
+        Only the class module's globals and builtins are checked. Nothing is evaluated.
+
+        Returns:
+            annotation (type/object)[MISSING]: The resolved object, the given annotation if it is not a string,
+                or MISSING if a string annotation could not be resolved.
+        """
+        if not isinstance(annotation, str):
+            return annotation
+
+        module = sys.modules.get(cls.__module__, None)
+        for namespace in (getattr(module, '__dict__', {}), builtins.__dict__):
+            try:
+                return namespace[annotation]
+            except KeyError:
+                pass
+        return MISSING
+
+    @staticmethod
+    def _set_new_attribute(cls, name, value):
+        # Never overwrites an existing attribute.  Returns True if the
+        # attribute already exists.  The defer=True placeholders do not
+        # count as existing attributes.
+        existing = cls.__dict__.get(name, MISSING)
+        if existing is not MISSING and not isinstance(existing, (DeferredInit, DeferredMethod)):
+            return True
+        if isinstance(value, types.FunctionType):
+            value.__qualname__ = f'{cls.__qualname__}.{value.__name__}'
+        setattr(cls, name, value)
+        return False
+
+    @classmethod
+    def optional_methods(mcs, cls, options=()):
+        """Return the OPTIONAL_METHODS options of a class: the given options and the options of its dataclass bases."""
+        enabled = set(options)
+        for base in cls.__mro__[1:-1]:
+            enabled.update(base.__dict__.get(mcs._METHODS, ()))
+        return frozenset(enabled)
+
+    @classmethod
+    def defer_class(mcs, cls, build, init=True, methods=()):
+        """Install placeholders that build the class on first instantiation or first access of the fields or of the
+        generated OPTIONAL_METHODS.
+
+        Args:
+            cls (type): Class to build later.
+            build (callable): Function(cls) that builds the dataclass.
+            init (bool)[True]: If the dataclass generates an __init__ method.
+            methods (tuple)[()]: OPTIONAL_METHODS options of the class.
+        """
+        methods = mcs.optional_methods(cls, methods)
+        if methods:
+            setattr(cls, mcs._METHODS, methods)  # Deferred subclasses inherit the options
+        names = []
+        for option in sorted(methods):
+            names.extend(name for name in mcs.OPTIONAL_METHODS[option] if init or name not in mcs.INIT_METHODS)
+        DeferredClass(cls, build, init and '__init__' not in cls.__dict__, names)
+        return cls
+
+    @classmethod
+    def make_doc(mcs, cls):
+        """Return the default class doc-string which is the signature of the class."""
+        return cls.__name__ + str(inspect.signature(cls)).replace(' -> None', '')
+
+    @classmethod
+    def make_lazy_doc(mcs, cls):
+        """Return a placeholder that runs make_doc the first time the class doc-string is read."""
+        return LazyDoc(mcs.make_doc)
+
+
+    @staticmethod
+    def _field_assign(frozen, name, value, self_name):
+        # If we're a frozen class, then assign to our fields in __init__
+        # via object.__setattr__.  Otherwise, just use a simple
+        # assignment.
+        #
+        # self_name is what "self" is called in this function: don't
+        # hard-code "self", since that might be a field name.
+        if frozen:
+            return f'__dataclass_builtins_object__.__setattr__({self_name},{name!r},{value})'
+        return f'{self_name}.{name}={value}'
+
+    @classmethod
+    def _field_init_value(mcs, f, locals, slots):
+        # Return the expression of the value that will initialize this
+        # field in __init__ or None if the field is not initialized.
+        default_name = f'__dataclass_dflt_{f.name}__'
+        if f.default_factory is not MISSING:
+            if f.init:
+                # This field has a default factory.  If a parameter is
+                # given, use it.  If not, call the factory.
+                locals[default_name] = f.default_factory
+                value = (f'{default_name}() '
+                         f'if {f.name} is __dataclass_HAS_DEFAULT_FACTORY__ '
+                         f'else {f.name}')
+            else:
+                # This is a field that's not in the __init__ params, but
+                # has a default factory function.  It needs to be
+                # initialized here by calling the factory function,
+                # because there's no other way to initialize it.
+                locals[default_name] = f.default_factory
+                value = f'{default_name}()'
+        else:
+            # No default factory.
+            if f.init:
+                if f.default is not MISSING:
+                    locals[default_name] = f.default
+                value = f.name
+            else:
+                # If the class has slots, then initialize this field.
+                if slots and f.default is not MISSING:
+                    locals[default_name] = f.default
+                    value = default_name
+                else:
+                    # This field does not need initialization: reading from it will
+                    # just use the class attribute that contains the default.
+                    # Signify that to the caller by returning None.
+                    return None
+        return value
+
+    @classmethod
+    def _setter_assign(mcs, f, frozen, value, self_name, locals, prebound=False):
+        # Assign the value through the field's attribute.  If prebound is
+        # True, property setters are called directly instead of looking
+        # up the property on every assignment.
+        fset = getattr(getattr(f, 'prop', None), 'fset', None)
+        if prebound and fset is not None:
+            fset_name = f'__dataclass_fset_{f.name}__'
+            locals[fset_name] = fset
+            return f'{fset_name}({self_name},{value})'
+        return mcs._field_assign(frozen, f.name, value, self_name)
+
+    @classmethod
+    def _field_init(mcs, f, frozen, locals, self_name, slots, prebound=False, direct=None):
+        # Return the text of the line in the body of __init__ that will
+        # initialize this field.
+        value = mcs._field_init_value(f, locals, slots)
+        if value is None:
+            return None
+
+        # Only test this now, so that we can create variables for the
+        # default.  However, return None to signify that we're not going
+        # to actually do the assignment statement for InitVars.
+        if f._field_type is mcs._FIELD_INITVAR:
+            return None
+
+        # Values that were already validated are written to the storage
+        # attributes ({field name: [(storage name, value)]}).
+        if direct and f.name in direct:
+            return ';'.join(mcs._field_assign(frozen, name, expr, self_name) for name, expr in direct[f.name])
+
+        # Now, actually generate the field assignment. Pass-through
+        # properties store the value without calling the setter.
+        storage = getattr(f, 'storage', None)
+        if storage:
+            return mcs._field_assign(frozen, storage, value, self_name)
+        return mcs._setter_assign(f, frozen, value, self_name, locals, prebound)
+
+    @classmethod
+    def _compact_init(mcs, fields, frozen, locals, self_name, layout, prebound=False, direct=None,
+                      validate_defaults=True):
+        # Return the body lines of __init__ for compact storage.  The
+        # value list is created with all of the values that are known
+        # before the first property setter runs.  Fields after that are
+        # assigned in order, so setters see the same state as with
+        # normal attributes.
+        locals['__dataclass_UNSET__'] = UNSET
+        values = ['__dataclass_UNSET__'] * len(layout)
+        body_lines = []
+        setter_seen = False
+        for f in fields:
+            value = mcs._field_init_value(f, locals, True)
+            if value is None or f._field_type is mcs._FIELD_INITVAR:
+                continue
+
+            default_lines = None if validate_defaults else mcs._default_init(f, frozen, locals, self_name,
+                                                                             prebound, layout)
+            if default_lines:
+                setter_seen = True
+                body_lines.extend(default_lines)
+                continue
+
+            if direct and f.name in direct:
+                stores = [(layout.get(name, None), expr) for name, expr in direct[f.name]]
+            else:
+                stores = [(mcs._compact_index(f, layout), value)]
+            for index, expr in stores:
+                if index is None:
+                    setter_seen = True
+                    body_lines.append(mcs._setter_assign(f, frozen, expr, self_name, locals, prebound))
+                elif setter_seen:
+                    body_lines.append(f'{self_name}.{VALUES}[{index}]={expr}')
+                else:
+                    values[index] = f'({expr})'
+
+        store = '[' + ','.join(values) + ']'
+        return [mcs._field_assign(frozen, VALUES, store, self_name)] + body_lines
+
+    @classmethod
+    def _default_init(mcs, f, frozen, locals, self_name, prebound=False, layout=None):
+        # Return the lines that store the default of a property field
+        # without running the setter (validate_defaults=False) or None.
+        # Given values still go through the setter.
+        if (f._field_type is not mcs._FIELD or not f.init or f.default is MISSING
+                or not isinstance(f, mcs.PropertyField) or f.storage is not None):
+            return None
+        storage = mcs._direct_storage(f)
+        if storage is None:
+            return None
+
+        default_name = f'__dataclass_dflt_{f.name}__'
+        locals[default_name] = f.default
+        if layout is not None:
+            store = f'{self_name}.{VALUES}[{layout[storage]}]={f.name}'
+        else:
+            store = mcs._field_assign(frozen, storage, f.name, self_name)
+        return [f'if {f.name} is {default_name}:',
+                f' {store}',
+                'else:',
+                f' {mcs._setter_assign(f, frozen, f.name, self_name, locals, prebound)}']
+
+    @classmethod
+    def _init_body(mcs, fields, frozen, locals, self_name, slots, layout=None, prebound=False, direct=None,
+                   validate_defaults=True):
+        # Return the lines that initialize the fields of an instance
+        # (without calling __post_init__).
+        if layout is not None:
+            return mcs._compact_init(fields, frozen, locals, self_name, layout, prebound, direct, validate_defaults)
+
+        body_lines = []
+        for f in fields:
+            if not validate_defaults and not (direct and f.name in direct):
+                default_lines = mcs._default_init(f, frozen, locals, self_name, prebound)
+                if default_lines:
+                    body_lines.extend(default_lines)
+                    continue
+            line = mcs._field_init(f, frozen, locals, self_name, slots, prebound, direct)
+            # line is None means that this field doesn't require
+            # initialization (it's a pseudo-field).  Just skip it.
+            if line:
+                body_lines.append(line)
+        return body_lines
+
+    @classmethod
+    def _compact_index(mcs, f, layout):
+        # Return the position of the field value in the compact value list
+        # or None if the value must go through the property.
+        if isinstance(f, mcs.PropertyField):
+            storage = f.storage
+            return None if storage is None else layout.get(storage, None)
+        return layout.get(f.name, None)
+
+    @classmethod
+    def _storage_layout(mcs, cls):
+        """Return {storage name: index} for a class with compact storage or None."""
+        names = cls.__dict__.get(mcs._STORAGE, None)
+        if names is None:
+            return None
+        return {name: i for i, name in enumerate(names)}
+
+    @classmethod
+    def _fields_tuple_str(mcs, obj_name, fields, layout=None, as_tuple=False, all_fields=False):
+        # Return the expression for the values of the fields.  Compact
+        # storage reads the value list directly.  If all of the fields are
+        # used, the value list itself is compared (it compares the same as
+        # a tuple) or converted to a tuple if as_tuple is True.
+        if layout is None:
+            return mcs._tuple_str(obj_name, fields)
+
+        if all_fields and fields:
+            if as_tuple:
+                return f'tuple({obj_name}.{VALUES})'
+            return f'{obj_name}.{VALUES}'
+        if not fields:
+            return '()'
+        return '(' + ','.join(mcs._field_ref(obj_name, f, layout) for f in fields) + ',)'
+
+    @classmethod
+    def _field_ref(mcs, obj_name, f, layout=None):
+        # Return the expression that reads the value of a field.
+        index = None if layout is None else mcs._compact_index(f, layout)
+        if index is None:
+            return f'{obj_name}.{f.name}'
+        return f'{obj_name}.{VALUES}[{index}]'
+
+    @staticmethod
+    def _init_param(f):
+        # Return the __init__ parameter string for this field.  For
+        # example, the equivalent of 'x:int=3' (except instead of 'int',
+        # reference a variable set to int, and instead of '3', reference a
+        # variable set to 3).
+        if f.default is MISSING and f.default_factory is MISSING:
+            # There's no default, and no default_factory, just output the
+            # variable name and type.
+            default = ''
+        elif f.default is not MISSING:
+            # There's a default, this will be the name that's used to look
+            # it up.
+            default = f'=__dataclass_dflt_{f.name}__'
+        else:
+            # There's a factory function.  Set a marker.
+            default = '=__dataclass_HAS_DEFAULT_FACTORY__'
+        return f'{f.name}:__dataclass_type_{f.name}__{default}'
+
+    @classmethod
+    def _init_fn(mcs, fields, std_fields, kw_only_fields, frozen, has_post_init, self_name, func_builder, slots,
+                 layout=None, validate_defaults=True):
+        # fields contains both real fields and InitVar pseudo-fields.
+
+        # Make sure we don't have fields without defaults following fields
+        # with defaults.  This actually would be caught when exec-ing the
+        # function source code, but catching it here gives a better error
+        # message, and future-proofs us in case we build up the function
+        # using ast.
+        seen_default = False
+        for f in std_fields:
+            # Only consider the non-kw-only fields in the __init__ call.
+            if f.init:
+                if not (f.default is MISSING and f.default_factory is MISSING):
+                    seen_default = True
+                elif seen_default:
+                    raise TypeError(f'non-default argument {f.name!r} '
+                                    'follows default argument')
+
+        locals = {f'__dataclass_type_{f.name}__': f.type for f in fields}
+        locals.update({
+            '__dataclass_HAS_DEFAULT_FACTORY__': mcs._HAS_DEFAULT_FACTORY,
+            '__dataclass_builtins_object__': object,
+        })
+
+        body_lines = mcs._init_body(fields, frozen, locals, self_name, slots, layout,
+                                    validate_defaults=validate_defaults)
+
+        # Does this class have a post-init function?
+        if has_post_init:
+            params_str = ','.join(f.name for f in fields
+                                  if f._field_type is mcs._FIELD_INITVAR)
+            body_lines.append(f'{self_name}.{mcs._POST_INIT_NAME}({params_str})')
+
+        # If no body lines, use 'pass'.
+        if not body_lines:
+            body_lines = ['pass']
+
+        _init_params = [mcs._init_param(f) for f in std_fields]
+        if kw_only_fields:
+            # Add the keyword-only args.  Because the * can only be added if
+            # there's at least one keyword-only arg, there needs to be a test here
+            # (instead of just concatenating the lists together).
+            _init_params += ['*']
+            _init_params += [mcs._init_param(f) for f in kw_only_fields]
+        func_builder.add_fn('__init__',
+                            [self_name] + _init_params,
+                            body_lines,
+                            locals=locals,
+                            return_type=None)
+
+    @staticmethod
+    def _arg_name(name, fields):
+        # Use name for an argument of a generated function unless a field
+        # has the same name.
+        return f'__dataclass_{name}__' if any(f.name == name for f in fields) else name
+
+    @classmethod
+    def _vectorized_storage(mcs, f):
+        # Return the storage names that the vectorized setter of a
+        # property field assigns or None.
+        if not isinstance(f, mcs.PropertyField) or getattr(f.prop, 'fvec', None) is None:
+            return None
+        return mcs.property_storage(f.prop) or None
+
+    @classmethod
+    def _bulk_init_fns(mcs, fields, std_fields, kw_only_fields, frozen, has_post_init, func_builder, slots,
+                       layout=None, validate_defaults=True):
+        """Add the `from_records` and `from_columns` classmethods that create many instances at once.
+
+        Both run one loop that initializes each instance like `__init__` without calling it. Property setters
+        and `__post_init__` are looked up once, and `from_columns` runs the vectorized setters
+        (`field_property.vectorized`) once per column and writes their results directly.
+        """
+        params = [f for f in std_fields if f.init] + [f for f in kw_only_fields if f.init]
+        names = [f.name for f in params]
+        cls_name = mcs._arg_name('cls', fields)
+        obj = '__dataclass_obj__'
+
+        locals = {
+            '__dataclass_HAS_DEFAULT_FACTORY__': mcs._HAS_DEFAULT_FACTORY,
+            '__dataclass_builtins_object__': object,
+            '__dataclass_KEYS__': frozenset(names),
+            '__dataclass_zip__': zip,
+            '__dataclass_repeat__': itertools.repeat,
+            '__dataclass_Namespace__': types.SimpleNamespace,
+            '__dataclass_classmethod__': classmethod,
+            }
+        prologue = ['__dataclass_new__=__dataclass_builtins_object__.__new__']
+        if has_post_init:
+            prologue.append(f'__dataclass_post_init__={cls_name}.{mcs._POST_INIT_NAME}')
+        prologue += ['__dataclass_instances__=[]',
+                     '__dataclass_append__=__dataclass_instances__.append']
+
+        def row_lines(direct=None):
+            lines = [f'{obj}=__dataclass_new__({cls_name})']
+            lines += mcs._init_body(fields, frozen, locals, obj, slots, layout, prebound=True, direct=direct,
+                                    validate_defaults=validate_defaults)
+            if has_post_init:
+                initvars = [f.name for f in fields if f._field_type is mcs._FIELD_INITVAR]
+                lines.append(f'__dataclass_post_init__({",".join([obj] + initvars)})')
+            lines.append(f'__dataclass_append__({obj})')
+            return lines
+
+        # from_records: dicts with the field names or tuples in __init__ parameter order.  Anything else
+        # (missing keys, other lengths, other mappings) is passed to the class to get the same errors.
+        records = mcs._arg_name('records', fields)
+        rec = '__dataclass_record__'
+        fallback = f'__dataclass_append__({cls_name}(**{rec}) if hasattr({rec},"keys") else {cls_name}(*{rec}))'
+        body = prologue + [f'for {rec} in {records}:',
+                           f' if type({rec}) is dict and len({rec})=={len(params)}:',
+                           # Every parameter is given.  A missing key means there is an unknown key.
+                           '  try:']
+        body += [f'   {f.name}={rec}[{f.name!r}]' for f in params] or ['   pass']
+        body += ['  except KeyError:',
+                 f'   {fallback}',
+                 '   continue',
+                 f' elif type({rec}) is dict and __dataclass_KEYS__.issuperset({rec}):',
+                 '  try:']
+        for f in params:
+            if f.default_factory is not MISSING:
+                body.append(f'   {f.name}={rec}.get({f.name!r},__dataclass_HAS_DEFAULT_FACTORY__)')
+            elif f.default is not MISSING:
+                body.append(f'   {f.name}={rec}.get({f.name!r},__dataclass_dflt_{f.name}__)')
+            else:
+                body.append(f'   {f.name}={rec}[{f.name!r}]')
+        if not params:
+            body.append('   pass')
+        body += ['  except KeyError:',
+                 f'   {fallback}',
+                 '   continue',
+                 f' elif (type({rec}) is tuple or type({rec}) is list) and len({rec})=={len(params)}:',
+                 f'  {"".join(name + "," for name in names)}={rec}' if params else '  pass',
+                 ' else:',
+                 f'  {fallback}',
+                 '  continue']
+        body += [' ' + line for line in row_lines()]
+        body.append('return __dataclass_instances__')
+        func_builder.add_fn('from_records', [cls_name, records], body, locals=locals, decorator='__dataclass_classmethod__')
+
+        # from_columns: one sequence per field name.  Missing columns use the field defaults.
+        columns = mcs._arg_name('columns', fields)
+        body = [f'if not __dataclass_KEYS__.issuperset({columns}):',
+                f' raise TypeError("unexpected columns: "+", ".join(sorted(set({columns})-__dataclass_KEYS__)))',
+                f'__dataclass_lengths__={{len(__dataclass_c__) for __dataclass_c__ in {columns}.values()}}',
+                'if len(__dataclass_lengths__)>1:',
+                ' raise ValueError("all columns must have the same length")',
+                '__dataclass_n__=__dataclass_lengths__.pop() if __dataclass_lengths__ else 0']
+        direct = {}
+        targets = []
+        iters = []
+        for f in params:
+            col = f'__dataclass_col_{f.name}__'
+            given = f'{columns}[{f.name!r}] if {f.name!r} in {columns} else '
+            vec_storage = mcs._vectorized_storage(f)
+            if f.default is MISSING and f.default_factory is MISSING:
+                body += [f'if {f.name!r} not in {columns}:',
+                         f' raise TypeError("missing required column {f.name!r}")',
+                         f'{col}={columns}[{f.name!r}]']
+            elif vec_storage is None:
+                default = '__dataclass_HAS_DEFAULT_FACTORY__' if f.default is MISSING else f'__dataclass_dflt_{f.name}__'
+                body.append(f'{col}={given}__dataclass_repeat__({default},__dataclass_n__)')
+            elif f.default is MISSING:
+                body.append(f'{col}={given}[__dataclass_dflt_{f.name}__() for __dataclass_i__ in range(__dataclass_n__)]')
+            else:
+                body.append(f'{col}={given}[__dataclass_dflt_{f.name}__]*__dataclass_n__')
+
+            if vec_storage is None:
+                targets.append(f.name)
+                iters.append(col)
+            else:
+                # Validate the whole column once and write the results to the storage attributes.
+                fvec_name = f'__dataclass_fvec_{f.name}__'
+                locals[fvec_name] = f.prop.fvec
+                body += ['__dataclass_vec__=__dataclass_Namespace__()',
+                         f'{fvec_name}(__dataclass_vec__,{col})']
+                direct[f.name] = []
+                for i, name in enumerate(vec_storage):
+                    var = f'__dataclass_vec_{f.name}_{i}__'
+                    body.append(f'__dataclass_veccol_{f.name}_{i}__=__dataclass_vec__.{name}')
+                    direct[f.name].append((name, var))
+                    targets.append(var)
+                    iters.append(f'__dataclass_veccol_{f.name}_{i}__')
+
+        body += prologue
+        if targets:
+            body.append(f'for {"".join(t + "," for t in targets)} in __dataclass_zip__({",".join(iters)}):')
+        else:
+            body.append('for __dataclass_i__ in range(__dataclass_n__):')
+        body += [' ' + line for line in row_lines(direct)]
+        body.append('return __dataclass_instances__')
+        func_builder.add_fn('from_columns', [cls_name, f'**{columns}'], body, locals=locals,
+                            decorator='__dataclass_classmethod__')
+
+    @classmethod
+    def _direct_storage(mcs, f):
+        # Return the attribute that holds exactly the value of the field
+        # or None if the value must go through the property setter.
+        if not isinstance(f, mcs.PropertyField):
+            return f.name
+        if f.storage is not None:
+            return f.storage
+        if getattr(f.prop, 'passthrough', False):
+            return f.prop.storage  # The getter reads the storage (the custom setter runs on assignment)
+        name = getter_storage(f.prop.fget)
+        if name is not None and mcs.property_storage(f.prop) == (name,):
+            return name
+        return None
+
+    @classmethod
+    def _construct_fn(mcs, fields, frozen, has_post_init, func_builder, layout=None):
+        """Add the `_construct` classmethod that creates an instance from trusted values.
+
+        The values (keyword arguments) are written directly to the storage attributes without running the
+        property setters. Fields that are not given use their defaults. Properties that do not read a single
+        storage attribute still use their setter. `__post_init__` only runs if has_post_init is true.
+        """
+        cls_name = mcs._arg_name('cls', fields)
+        obj = '__dataclass_obj__'
+        locals = {
+            '__dataclass_HAS_DEFAULT_FACTORY__': mcs._HAS_DEFAULT_FACTORY,
+            '__dataclass_builtins_object__': object,
+            '__dataclass_object_new__': object.__new__,  # Bound once instead of an attribute lookup per call
+            '__dataclass_UNSET__': UNSET,
+            '__dataclass_classmethod__': classmethod,
+            }
+
+        params = []
+        values = ['__dataclass_UNSET__'] * len(layout or ())
+        body_lines = []
+        for f in fields:
+            default_name = f'__dataclass_dflt_{f.name}__'
+            if f._field_type is mcs._FIELD_INITVAR:
+                if has_post_init:
+                    if f.default is not MISSING:
+                        locals[default_name] = f.default
+                        params.append(f'{f.name}={default_name}')
+                    else:
+                        params.append(f.name)
+                continue
+
+            optional = False
+            if f.default_factory is not MISSING:
+                locals[default_name] = f.default_factory
+                params.append(f'{f.name}=__dataclass_HAS_DEFAULT_FACTORY__')
+                value = f'{default_name}() if {f.name} is __dataclass_HAS_DEFAULT_FACTORY__ else {f.name}'
+            elif f.default is not MISSING:
+                locals[default_name] = f.default
+                params.append(f'{f.name}={default_name}')
+                value = f.name
+            elif f.init:
+                params.append(f.name)
+                value = f.name
+            else:
+                # Usually set by __post_init__.  Only assign it if it is given.
+                params.append(f'{f.name}=__dataclass_UNSET__')
+                value = f.name
+                optional = True
+
+            storage = mcs._direct_storage(f)
+            if layout is not None and storage in layout:
+                # The compact value list uses UNSET for missing values as well.
+                values[layout[storage]] = f'({value})'
+                continue
+            elif storage is not None:
+                line = mcs._field_assign(frozen, storage, value, obj)
+            else:
+                line = mcs._setter_assign(f, frozen, value, obj, locals, prebound=True)
+            if optional:
+                body_lines += [f'if {f.name} is not __dataclass_UNSET__:', f' {line}']
+            else:
+                body_lines.append(line)
+
+        if layout is not None:
+            body_lines.insert(0, mcs._field_assign(frozen, VALUES, '[' + ','.join(values) + ']', obj))
+        if has_post_init:
+            initvars = [f.name for f in fields if f._field_type is mcs._FIELD_INITVAR]
+            body_lines.append(f'{obj}.{mcs._POST_INIT_NAME}({",".join(initvars)})')
+
+        body_lines = [f'{obj}=__dataclass_object_new__({cls_name})'] + body_lines + [f'return {obj}']
+        func_builder.add_fn('_construct', [cls_name, '*'] + params if params else [cls_name], body_lines,
+                            locals=locals, decorator='__dataclass_classmethod__')
+
+    @classmethod
+    def _replace_fn(mcs, cls, fields, frozen, has_post_init, self_name, func_builder, slots, layout=None):
+        """Add the `__replace__(**changes)` method used by `replace()` (and `copy.replace` in Python 3.13).
+
+        Stored values of the fields that are not changed are copied without calling the getters and setters. Only
+        the setters of the changed fields run. init=False fields are initialized like `__init__` does and
+        `__post_init__` runs with the InitVars. Instances of subclasses and invalid changes use
+        `dataclasses.replace`, which calls `__init__` (and raises the errors).
+        """
+        init = cls.__dict__.get('__init__', None)
+        if init is not None and not isinstance(init, DeferredInit):
+            return  # The class defines __init__. The copy must be created by it.
+
+        obj = '__dataclass_obj__'
+        changes = '__dataclass_changes__'
+        initvars = [f for f in fields if f._field_type is mcs._FIELD_INITVAR]
+        locals = {
+            '__dataclass_builtins_object__': object,
+            '__dataclass_FIELDS__': cls.__dict__[mcs._FIELDS],
+            '__dataclass_REPLACE_NAMES__': frozenset(f.name for f in fields if f.init),
+            '__dataclass_replace__': dataclasses.replace,
+            '__dataclass_UNSET__': UNSET,
+            }
+        condition = (f'type({self_name}).__dict__.get({mcs._FIELDS!r}) is not __dataclass_FIELDS__ '
+                     f'or not __dataclass_REPLACE_NAMES__.issuperset({changes})')
+        required = frozenset(f.name for f in initvars if f.default is MISSING)
+        if required:
+            # dataclasses.replace requires the InitVars without a default
+            locals['__dataclass_REPLACE_INITVARS__'] = required
+            condition += f' or not __dataclass_REPLACE_INITVARS__.issubset({changes})'
+        body_lines = [f'if {condition}:',
+                      f' return __dataclass_replace__({self_name},**{changes})',
+                      f'{obj}=__dataclass_builtins_object__.__new__(type({self_name}))']
+        if layout is not None:
+            # The value list holds the stored values of all of the fields
+            body_lines.append(mcs._field_assign(frozen, VALUES, f'{self_name}.{VALUES}.copy()', obj))
+
+        for f in fields:
+            if f._field_type is mcs._FIELD_INITVAR:
+                continue
+            if not f.init:
+                # Initialize it like __init__ does (or leave it unset)
+                if layout is not None:
+                    value = mcs._field_init_value(f, locals, True)
+                    index = mcs._compact_index(f, layout)
+                    if value is None:
+                        if index is not None:
+                            body_lines.append(f'{obj}.{VALUES}[{index}]=__dataclass_UNSET__')
+                    elif index is not None:
+                        body_lines.append(f'{obj}.{VALUES}[{index}]={value}')
+                    else:
+                        body_lines.append(mcs._setter_assign(f, frozen, value, obj, locals, prebound=True))
+                else:
+                    line = mcs._field_init(f, frozen, locals, obj, slots, prebound=True)
+                    if line:
+                        body_lines.append(line)
+                continue
+
+            value = f'{changes}[{f.name!r}]'
+            index = None if layout is None else mcs._compact_index(f, layout)
+            storage = getattr(f, 'storage', None)
+            if index is not None:
+                set_line = f'{obj}.{VALUES}[{index}]={value}'
+            elif storage:
+                set_line = mcs._field_assign(frozen, storage, value, obj)
+            else:
+                set_line = mcs._setter_assign(f, frozen, value, obj, locals, prebound=True)
+
+            if layout is not None:
+                # The stored value was copied with the value list
+                body_lines += [f'if {f.name!r} in {changes}:', f' {set_line}']
+                continue
+
+            storage = mcs._direct_storage(f)
+            if storage is not None:
+                copy_line = mcs._field_assign(frozen, storage, f'{self_name}.{storage}', obj)
+            else:
+                copy_line = mcs._setter_assign(f, frozen, f'{self_name}.{f.name}', obj, locals, prebound=True)
+            body_lines += [f'if {f.name!r} in {changes}:', f' {set_line}', 'else:', f' {copy_line}']
+
+        if has_post_init:
+            args = []
+            for f in initvars:
+                if f.default is MISSING:
+                    args.append(f'{changes}[{f.name!r}]')
+                else:
+                    locals[f'__dataclass_dflt_{f.name}__'] = f.default
+                    args.append(f'{changes}.get({f.name!r},__dataclass_dflt_{f.name}__)')
+            args = ','.join(args)
+            body_lines.append(f'{obj}.{mcs._POST_INIT_NAME}({args})')
+        body_lines.append(f'return {obj}')
+        func_builder.add_fn('__replace__', (self_name, f'**{changes}'), body_lines, locals=locals)
+
+    @classmethod
+    def _repr_fn(mcs, fields, func_builder):
+        func_builder.add_fn('__repr__',
+                            ('self',),
+                            ['return self.__class__.__qualname__ + f"(' +
+                             ', '.join([f"{f.name}={{self.{f.name}!r}}"
+                                        for f in fields]) +
+                             ')"'],
+                            locals={'__dataclass_recursive_repr__': reprlib.recursive_repr()},
+                            decorator='__dataclass_recursive_repr__')
+
+    @classmethod
+    def _frozen_get_del_attr(mcs, cls, fields, func_builder):
+        locals = {'__dataclass_cls__': cls,
+                  '__dataclass_FrozenInstanceError__': mcs.FrozenInstanceError}
+        condition = 'type(self) is __dataclass_cls__'
+        if fields:
+            condition += ' or name in {' + ', '.join(repr(f.name) for f in fields) + '}'
+
+        func_builder.add_fn('__setattr__',
+                            ('self', 'name', 'value'),
+                            (f'if {condition}:',
+                             ' raise __dataclass_FrozenInstanceError__(f"cannot assign to field {name!r}")',
+                             f'super(__dataclass_cls__, self).__setattr__(name, value)'),
+                            locals=locals,
+                            overwrite_error=True)
+        func_builder.add_fn('__delattr__',
+                            ('self', 'name'),
+                            (f'if {condition}:',
+                             ' raise __dataclass_FrozenInstanceError__(f"cannot delete field {name!r}")',
+                             f'super(__dataclass_cls__, self).__delattr__(name)'),
+                            locals=locals,
+                            overwrite_error=True)
+
+    @classmethod
+    def _cmp_fn(mcs, name, op, self_tuple, other_tuple, func_builder, overwrite_error=False):
+        # Create a comparison function.  If the fields in the object are
+        # named 'x' and 'y', then self_tuple is the string
+        # '(self.x,self.y)' and other_tuple is the string
+        # '(other.x,other.y)'.
+        func_builder.add_fn(name,
+                            ('self', 'other'),
+                            ['if other.__class__ is self.__class__:',
+                             f' return {self_tuple}{op}{other_tuple}',
+                             'return NotImplemented'],
+                            overwrite_error=overwrite_error)
+
+    @staticmethod
+    def _hash_set_none(cls, fields, func_builder):
+        # This is a scalar value, not a function, so set it directly.
+        cls.__hash__ = None
+
+    @classmethod
+    def _hash_add(mcs, cls, fields, func_builder):
+        flds = [f for f in fields if (f.compare if f.hash is None else f.hash)]
+        self_tuple = mcs._fields_tuple_str('self', flds, mcs._storage_layout(cls), as_tuple=True,
+                                           all_fields=len(flds) == len(fields))
+        func_builder.add_fn('__hash__',
+                            ('self',),
+                            [f'return hash({self_tuple})'],
+                            unconditional_add=True)
+
+    @staticmethod
+    def _hash_exception(cls, fields, func_builder):
+        # Raise an exception.
+        raise TypeError(f'Cannot overwrite attribute __hash__ '
+                        f'in class {cls.__name__}')
+
+    @classmethod
+    def _hash_action(mcs, unsafe_hash, eq, frozen, has_explicit_hash):
+        """Return the hash function (cls, fields, func_builder) to run or None.
+
+        Same decision table as dataclasses._hash_action:
+
+            unsafe_hash  eq     frozen  |  no explicit __hash__    explicit __hash__
+            False        False  any     |  None (use base class)   None
+            False        True   False   |  set None (unhashable)   None
+            False        True   True    |  add                     None
+            True         any    any     |  add                     raise
+        """
+        if unsafe_hash:
+            return mcs._hash_exception if has_explicit_hash else mcs._hash_add
+        if eq and not has_explicit_hash:
+            return mcs._hash_add if frozen else mcs._hash_set_none
+        return None
+
+    @classmethod
+    def _storage_ref(mcs, obj_name, f, layout=None):
+        # Return the expression that reads the stored value of a field
+        # (the storage attribute or the position in the compact value
+        # list).  Other properties are read through the getter.
+        storage = mcs._direct_storage(f)
+        if storage is None:
+            return f'{obj_name}.{f.name}'
+        if layout is not None and storage in layout:
+            return f'{obj_name}.{VALUES}[{layout[storage]}]'
+        return f'{obj_name}.{storage}'
+
+    @classmethod
+    def _convert_fn(mcs, name, fields, func_builder, layout, make, convert):
+        # Add a method with a mode argument.  make(refs) returns the
+        # expression of the result for the value expressions.
+        locals = {f'__dataclass_{name}_value__': convert}
+        shallow = [mcs._field_ref('self', f, layout) for f in fields]
+        storage = [mcs._storage_ref('self', f, layout) for f in fields]
+        recursive = [f'__dataclass_{name}_value__({ref})' for ref in shallow]
+        func_builder.add_fn(name,
+                            ('self', "mode='shallow'"),
+                            ["if mode == 'shallow':",
+                             f' return {make(shallow)}',
+                             "if mode == 'storage':",
+                             f' return {make(storage)}',
+                             "if mode == 'recursive':",
+                             f' return {make(recursive)}',
+                             'raise ValueError(f"invalid mode {mode!r}, expected \'shallow\', \'storage\' or '
+                             '\'recursive\'")'],
+                            locals=locals)
+
+    @classmethod
+    def _asdict_fn(mcs, fields, func_builder, layout=None):
+        """Add the `_asdict(mode='shallow')` method.
+
+        Modes:
+            shallow: Field values (properties run their getters).
+            storage: Stored values. Properties that read a single storage attribute are not called.
+            recursive: Like `dataclasses.asdict`, nested dataclasses, lists, tuples and dicts are converted.
+        """
+        from .convert import asdict_value
+
+        mcs._convert_fn('_asdict', fields, func_builder, layout,
+                        lambda refs: '{' + ','.join(f'{f.name!r}:{ref}' for f, ref in zip(fields, refs)) + '}',
+                        asdict_value)
+
+    @classmethod
+    def _astuple_fn(mcs, fields, func_builder, layout=None):
+        """Add the `_astuple(mode='shallow')` method. The modes are the same as `_asdict`."""
+        from .convert import astuple_value
+
+        mcs._convert_fn('_astuple', fields, func_builder, layout,
+                        lambda refs: '(' + ''.join(ref + ',' for ref in refs) + ')',
+                        astuple_value)
+
+    @classmethod
+    def _from_dict_fn(mcs, func_builder):
+        """Add the `from_dict(data, validate=True)` classmethod which uses the compiled decoder of the class.
+
+        The field types are resolved and the decoder is compiled the first time it is called (see decode.py).
+        """
+        from .decode import decoder
+
+        func_builder.add_fn('from_dict', ('cls', 'data', 'validate=True'),
+                            ['return __dataclass_decoder__(cls, validate)(data)'],
+                            locals={'__dataclass_decoder__': decoder, '__dataclass_classmethod__': classmethod},
+                            decorator='__dataclass_classmethod__')
+
+    @classmethod
+    def _defines_state(mcs, cls):
+        # Return True if the class or a base class that is not a
+        # dataclass defines how instances are pickled.
+        for base in cls.__mro__[:-1]:
+            if base is not cls and mcs._FIELDS in base.__dict__:
+                continue  # The generated methods of a dataclass base are generated again
+            if any(name in base.__dict__ and not isinstance(base.__dict__[name], DeferredMethod)
+                   for name in mcs.STATE_METHODS):
+                return True
+        return False
+
+    @classmethod
+    def _state_entries(mcs, fields, validate=False):
+        # Return the list of the values in the state of an instance.
+        # (storage name, None) values are copied from the attribute and
+        # (None, field) values are read with the getter and written with
+        # the setter.  Read only properties without storage are skipped.
+        entries = []
+        seen = set()
+        for f in fields:
+            prop = getattr(f, 'prop', None)
+            if prop is not None and f.storage is None and prop.fset is not None:
+                names = mcs.property_storage(prop)
+                if validate or not names:
+                    entries.append((None, f))
+                    continue
+            elif prop is not None and f.storage is None:
+                names = mcs.property_storage(prop)
+            else:
+                names = (mcs._direct_storage(f),)
+            for name in names:
+                if name not in seen:
+                    seen.add(name)
+                    entries.append((name, None))
+        return entries
+
+    @classmethod
+    def _state_fns(mcs, cls, fields, frozen, func_builder, slots, layout=None, validate_state=False):
+        """Add `__copy__`, `__deepcopy__`, `__getstate__`, `__setstate__` and `__reduce_ex__`.
+
+        The state is the list of the stored values (the compact value list is copied as it is). Properties whose
+        storage is not known are read with the getter and restored with the setter. If validate_state is true,
+        `__setstate__` restores all properties with their setters. `array.array` fields are pickled as
+        `pickle.PickleBuffer` with protocol 5.
+
+        Instances of subclasses and instances with other attributes use the state of `object.__reduce_ex__`.
+        Nothing is generated if the class defines how it is pickled.
+        """
+        if mcs._defines_state(cls):
+            return
+
+        import array
+        from . import state
+
+        locals = {
+            '__dataclass_builtins_object__': object,
+            '__dataclass_FIELDS__': cls.__dict__[mcs._FIELDS],
+            '__dataclass_UNSET__': UNSET,
+            '__dataclass_newobj__': state.newobj,
+            '__dataclass_object_state__': state.object_state,
+            '__dataclass_restore_state__': state.restore_state,
+            '__dataclass_copy_object__': state.copy_object,
+            '__dataclass_deepcopy_object__': state.deepcopy_object,
+            '__dataclass_deepcopy_value__': state.deepcopy_value,
+            '__dataclass_array_state__': state.array_state,
+            }
+
+        def read(obj, entry):
+            name, f = entry
+            if name is None:
+                return f'{obj}.{f.name}'
+            if layout is not None and name in layout:
+                return f'{obj}.{VALUES}[{layout[name]}]'
+            return f'{obj}.{name}'
+
+        def write(obj, entry, value):
+            name, f = entry
+            if name is None:
+                return mcs._setter_assign(f, frozen, value, obj, locals, prebound=True)
+            if layout is not None and name in layout:
+                return f'{obj}.{VALUES}[{layout[name]}]={value}'
+            return mcs._field_assign(frozen, name, value, obj)
+
+        entries = mcs._state_entries(fields)
+        state_entries = mcs._state_entries(fields, validate_state)
+        condition = f'type(self).__dict__.get({mcs._FIELDS!r}) is __dataclass_FIELDS__'
+        if layout is None and not slots:
+            # Instances with other attributes (or missing attributes) use the state of object.__reduce_ex__.
+            # The attributes are only known if the storage of all of the properties is known.
+            if all(name is not None for name, _ in entries):
+                locals['__dataclass_STATE_NAMES__'] = frozenset(name for name, _ in entries)
+                condition += ' and self.__dict__.keys()==__dataclass_STATE_NAMES__'
+            else:
+                condition = 'False'
+
+        # Positions of the array.array values in the state
+        arrays = []
+        for f in fields:
+            tp = mcs.resolve_type(cls, f.type)
+            if not (isinstance(tp, type) and issubclass(tp, array.array)):
+                continue
+            storage = mcs._direct_storage(f)
+            if layout is not None and not validate_state:
+                arrays.append(layout[storage])
+            elif (storage, None) in state_entries:
+                arrays.append(state_entries.index((storage, None)))
+            elif (None, f) in state_entries:
+                arrays.append(state_entries.index((None, f)))
+
+        if layout is not None and not validate_state:
+            size = len(layout)
+            get_state = f'self.{VALUES}.copy()'
+            set_state = [mcs._field_assign(frozen, VALUES, 'list(state)', 'self')]
+        else:
+            size = len(state_entries)
+            get_state = '[' + ','.join(read('self', entry) for entry in state_entries) + ']'
+            set_state = [write('self', entry, f'state[{i}]') for i, entry in enumerate(state_entries)]
+            if layout is not None:
+                set_state.insert(0, mcs._field_assign(frozen, VALUES, f'[__dataclass_UNSET__]*{len(layout)}', 'self'))
+
+        func_builder.add_fn('__getstate__', ('self',),
+                            [f'if {condition}:',
+                             ' try:',
+                             f'  return {get_state}',
+                             ' except AttributeError:',
+                             '  pass',
+                             'return __dataclass_object_state__(self)'],
+                            locals=locals)
+        func_builder.add_fn('__setstate__', ('self', 'state'),
+                            [f'if type(state) is list and len(state)=={size}:',
+                             *(' ' + line for line in set_state),
+                             'else:',
+                             ' __dataclass_restore_state__(self,state)'],
+                            locals=locals)
+        body = ['state=self.__getstate__()']
+        if arrays:
+            body += [f'if protocol>=5 and type(state) is list and len(state)=={size}:',
+                     *(f' state[{i}]=__dataclass_array_state__(state[{i}])' for i in arrays)]
+        body.append('return (__dataclass_newobj__,(type(self),),state)')
+        func_builder.add_fn('__reduce_ex__', ('self', 'protocol'), body, locals=locals)
+
+        # Copies
+        if layout is not None:
+            copy_lines = [mcs._field_assign(frozen, VALUES, f'self.{VALUES}.copy()', '__dataclass_obj__')]
+            deepcopy_lines = [mcs._field_assign(frozen, VALUES,
+                                                f'[__dataclass_deepcopy_value__(__dataclass_v__,memo) '
+                                                f'for __dataclass_v__ in self.{VALUES}]',
+                                                '__dataclass_obj__')]
+        else:
+            if slots:
+                copy_lines = [write('__dataclass_obj__', entry, read('self', entry)) for entry in entries]
+            else:
+                # The instance dictionary only has the storage attributes
+                copy_lines = ['__dataclass_obj__.__dict__.update(self.__dict__)']
+            deepcopy_lines = [write('__dataclass_obj__', entry,
+                                    f'__dataclass_deepcopy_value__({read("self", entry)},memo)')
+                              for entry in entries]
+        new = '__dataclass_obj__=__dataclass_builtins_object__.__new__(type(self))'
+        func_builder.add_fn('__copy__', ('self',),
+                            [f'if {condition}:',
+                             f' {new}',
+                             ' try:',
+                             *('  ' + line for line in copy_lines),
+                             '  return __dataclass_obj__',
+                             ' except AttributeError:',
+                             '  pass',
+                             'return __dataclass_copy_object__(self)'],
+                            locals=locals)
+        func_builder.add_fn('__deepcopy__', ('self', 'memo'),
+                            [f'if {condition}:',
+                             f' {new}',
+                             ' memo[id(self)]=__dataclass_obj__',
+                             ' try:',
+                             *('  ' + line for line in deepcopy_lines),
+                             '  return __dataclass_obj__',
+                             ' except AttributeError:',
+                             '  del memo[id(self)]',
+                             'return __dataclass_deepcopy_object__(self,memo)'],
+                            locals=locals)
+
+    @classmethod
+    def _struct_code(mcs, cls, f):
+        # Return the struct format code of a field or None if the
+        # field type cannot be packed.
+        import struct
+
+        code = f.metadata.get(mcs.STRUCT_METADATA, None) if f.metadata else None
+        if code is not None:
+            try:
+                packer = struct.Struct(mcs.STRUCT_BYTE_ORDER + code)
+            except (struct.error, TypeError) as err:
+                raise ValueError(f'invalid struct code {code!r} for field {f.name!r}: {err}') from None
+            if len(packer.unpack(bytes(packer.size))) != 1:
+                raise ValueError(f'struct code {code!r} for field {f.name!r} must be a single value')
+            return code
+
+        tp = mcs.resolve_type(cls, f.type)
+        for typ, code in mcs.STRUCT_CODES.items():
+            if tp is typ:
+                return code
+        return None
+
+    @classmethod
+    def _codec_fields(mcs, fields):
+        # Return the fields that are packed in order.  Read only
+        # properties without storage are skipped.
+        return [f for f in fields
+                if getattr(getattr(f, 'prop', None), 'fset', True) is not None or mcs._direct_storage(f) is not None]
+
+    @classmethod
+    def _codec_fns(mcs, cls, fields, frozen, func_builder, layout=None):
+        """Add the binary codec methods. Every field must be an int, float, bool or have a struct code in its metadata,
+        otherwise the methods raise TypeError.
+
+        The struct.Struct is created once here and stored as `__dataclass_struct__`. Read only properties without
+        storage are computed values and are not packed.
+
+        Methods:
+            pack(self): Return the packed stored values (`cls.pack(obj)` works as well).
+            pack_into(self, buffer, offset=0): Pack the stored values into a writable buffer.
+            pack_many(cls, objects): Return the packed records of all of the objects.
+            unpack(cls, buffer, offset=0, validate=True): Create an instance from a packed record.
+            iter_unpack(cls, buffer, validate=True): Iterate over the instances of a buffer of packed records.
+
+        If validate is false, the unpacked values are stored without running the property setters.
+        """
+        import struct
+
+        codec_fields = mcs._codec_fields(fields)
+        codes = [mcs._struct_code(cls, f) for f in codec_fields]
+        if not codec_fields or None in codes:
+            # The methods raise TypeError. Do not inherit the codec of a base class, which would not pack the fields
+            # of this class.
+            setattr(cls, mcs._STRUCT, None)
+            message = f'{cls.__name__!r} has fields that cannot be packed'
+            for name in mcs.CODEC_METHODS:
+                func_builder.add_fn(name, ('*args', '**kwargs'), [f'raise TypeError({message!r})'])
+            return
+
+        packer = struct.Struct(mcs.STRUCT_BYTE_ORDER + ''.join(codes))
+        setattr(cls, mcs._STRUCT, packer)
+        locals = {
+            '__dataclass_builtins_object__': object,
+            '__dataclass_UNSET__': UNSET,
+            '__dataclass_pack__': packer.pack,
+            '__dataclass_pack_into__': packer.pack_into,
+            '__dataclass_unpack_from__': packer.unpack_from,
+            '__dataclass_iter_unpack__': packer.iter_unpack,
+            '__dataclass_classmethod__': classmethod,
+            }
+
+        obj = '__dataclass_obj__'
+        names = [f'__dataclass_v_{f.name}__' for f in codec_fields]
+        targets = ''.join(name + ',' for name in names)
+
+        def values(obj_name):
+            return ','.join(mcs._storage_ref(obj_name, f, layout) for f in codec_fields)
+
+        def store_lines(validate):
+            # Lines that store the unpacked values in the new instance
+            lines = []
+            compact = None if layout is None else ['__dataclass_UNSET__'] * len(layout)
+            for f, value in zip(codec_fields, names):
+                # Pass-through properties store the value like __init__ does
+                storage = mcs._direct_storage(f)
+                fset = getattr(getattr(f, 'prop', None), 'fset', None)
+                if storage is None or (validate and fset is not None and getattr(f, 'storage', None) is None):
+                    lines.append(mcs._setter_assign(f, frozen, value, obj, locals, prebound=True))
+                elif layout is not None and storage in layout:
+                    compact[layout[storage]] = value
+                else:
+                    lines.append(mcs._field_assign(frozen, storage, value, obj))
+            if layout is not None:
+                lines.insert(0, mcs._field_assign(frozen, VALUES, '[' + ','.join(compact) + ']', obj))
+            return [f'{obj}=__dataclass_builtins_object__.__new__(cls)'] + lines
+
+        func_builder.add_fn('pack', ('self',), [f'return __dataclass_pack__({values("self")})'], locals=locals)
+        func_builder.add_fn('pack_into', ('self', 'buffer', 'offset=0'),
+                            [f'__dataclass_pack_into__(buffer,offset,{values("self")})'], locals=locals)
+        func_builder.add_fn('pack_many', ('cls', 'objects'),
+                            [f"return b''.join([__dataclass_pack__({values(obj)}) for {obj} in objects])"],
+                            locals=locals, decorator='__dataclass_classmethod__')
+        func_builder.add_fn('unpack', ('cls', 'buffer', 'offset=0', 'validate=True'),
+                            [f'{targets}=__dataclass_unpack_from__(buffer,offset)',
+                             'if validate:',
+                             *(' ' + line for line in store_lines(True)),
+                             'else:',
+                             *(' ' + line for line in store_lines(False)),
+                             f'return {obj}'],
+                            locals=locals, decorator='__dataclass_classmethod__')
+        func_builder.add_fn('iter_unpack', ('cls', 'buffer', 'validate=True'),
+                            ['if validate:',
+                             f' for {targets} in __dataclass_iter_unpack__(buffer):',
+                             *('  ' + line for line in store_lines(True)),
+                             f'  yield {obj}',
+                             'else:',
+                             f' for {targets} in __dataclass_iter_unpack__(buffer):',
+                             *('  ' + line for line in store_lines(False)),
+                             f'  yield {obj}'],
+                            locals=locals, decorator='__dataclass_classmethod__')
+
+    @classmethod
+    def _add_fns_to_class(mcs, func_builder, cls):
+        """Compile all of the generated methods with one exec call and add them to the class."""
+        func_builder.add_fns_to_class(cls, mcs._set_new_attribute)
+
+    @classmethod
+    def _add_lazy_fns_to_class(mcs, func_builder, cls):
+        """Add placeholders that compile the generated methods the first time one of them is used."""
+        func_builder.add_lazy_fns_to_class(cls, mcs._set_new_attribute)
+
+
+def replace(obj, **changes):
+    """Return a copy of the dataclass instance with the fields in changes replaced.
+
+    Uses the generated `__replace__` method (`dataclass(replace=True)`), which only runs the setters of the changed
+    fields. Other dataclasses use `dataclasses.replace`.
+    """
+    replace_fn = getattr(type(obj), '__replace__', None)
+    if replace_fn is None:
+        return dataclasses.replace(obj, **changes)
+    return replace_fn(obj, **changes)
+
+
+# Set the dataclasses variables that are used in DataclassInterface so the functions can be overridden
+DATACLASSES_ATTRS = (
+    # Public API
+    'field', 'Field', 'fields', 'asdict', 'astuple', 'make_dataclass', 'replace', 'is_dataclass',
+    'FrozenInstanceError', 'InitVar', 'MISSING',
+    # Internals used by _get_field and _process_class
+    '_FIELD', '_FIELD_CLASSVAR', '_FIELD_INITVAR', '_FIELDS', '_PARAMS', '_POST_INIT_NAME',
+    '_DataclassParams', '_HAS_DEFAULT_FACTORY',
+    '_is_classvar', '_is_initvar', '_is_type', '_tuple_str',
+    )
+for attr in DATACLASSES_ATTRS:
+    if attr not in BaseDataclassInterface.__dict__:
+        setattr(BaseDataclassInterface, attr, getattr(dataclasses, attr))
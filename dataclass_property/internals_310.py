@@ -7,10 +7,11 @@ Edited spots are marked with <<<EDITED>>>
 import sys
 import abc
 import types
-import inspect
+import itertools
 import dataclasses
 
 from .interface import BaseDataclassInterface
+from .compact import VALUES, CompactAttribute, compact_getter, compact_setter
 
 
 __all__ = ['DataclassInterface', 'dataclass']
@@ -24,11 +25,14 @@ class DataclassInterface(BaseDataclassInterface):
     KW_ONLY = dataclasses.KW_ONLY
     _is_kw_only = dataclasses._is_kw_only
     _fields_in_init_order = dataclasses._fields_in_init_order
-    _add_slots = dataclasses._add_slots
 
     @classmethod
     def dataclass(mcs, cls=None, *, init=True, repr=True, eq=True, order=False,
-                  unsafe_hash=False, frozen=False, match_args=True, kw_only=False, slots=False):
+                  unsafe_hash=False, frozen=False, match_args=True, kw_only=False, slots=False,
+                  weakref_slot=False, storage=None, lazy_methods=False, defer=False, construct_post_init=False,
+                  validate_defaults=True, validate_state=False, bulk=False, construct=False,
+                  convert=False, decode=False, replace=False,
+                  state=False, codec=False):
         """Returns the same class as was passed in, with dunder methods
         added based on the fields defined in the class.
 
@@ -38,12 +42,86 @@ class DataclassInterface(BaseDataclassInterface):
         repr is true, a __repr__() method is added. If order is true, rich
         comparison dunder methods are added. If unsafe_hash is true, a
         __hash__() method function is added. If frozen is true, fields may
-        not be assigned to after instance creation.
+        not be assigned to after instance creation. If slots is true, a new
+        class with __slots__ is returned. Property fields keep their
+        property and get slots for their backing attributes instead. If
+        weakref_slot is true, a __weakref__ slot is added.
+
+        If storage is 'compact', the values of an instance are kept in one
+        list slot (`__dataclass_values__`) indexed by field position
+        instead of one attribute per value. This implies slots.
+        Dataclass subclasses of a compact class are always compact.
+
+        If lazy_methods is true, __repr__(), __eq__(), the ordering methods,
+        __hash__() and the class doc-string are only generated the first
+        time they are used.
+
+        If defer is true, the class is only processed the first time an
+        instance is created or the fields are requested (fields(),
+        is_dataclass(), or a dataclass subclass).
+
+        If validate_defaults is false, the generated __init__() stores the
+        default of a property directly in its storage attribute instead of
+        running the setter when the argument is not given.
+
+        The following options add generated methods. Dataclass subclasses
+        also get the methods of their dataclass bases.
+
+        If bulk is true (and init is true), the from_records() and
+        from_columns() classmethods create many instances at once.
+
+        If construct is true, the `_construct(**values)` classmethod creates
+        an instance from trusted values without running the property
+        setters. It only calls __post_init__() if construct_post_init is true
+        (which implies construct).
+
+        If convert is true, the `_asdict(mode)` and `_astuple(mode)` methods
+        convert an instance to a dict or tuple without walking fields().
+
+        If decode is true, the `from_dict(data, validate=True)` classmethod
+        creates an instance from nested dicts (see decode.py).
+
+        If replace is true (and init is true), the `__replace__(**changes)`
+        method used by replace() only runs the setters of the changed fields.
+
+        If state is true, copies (copy.copy, copy.deepcopy) and pickles
+        store the values of the storage attributes. If validate_state is true
+        (which implies state), unpickling runs the property setters instead
+        of restoring the stored values. Compact classes and frozen classes
+        with slots always get these methods: copies must not share the value
+        list, and the frozen fields cannot be restored with setattr().
+
+        If codec is true, the `pack()`, `pack_into()`, `pack_many()`,
+        `unpack()` and `iter_unpack()` methods pack the stored values with a
+        struct.Struct. They raise TypeError if a field cannot be packed.
         """
-        def wrap(cls):
+        if storage not in (None, 'compact'):
+            raise ValueError(f'invalid storage {storage!r}, expected None or \'compact\'')
+        if defer and (slots or storage):
+            # _add_slots creates a new class, which cannot replace the deferred class after decoration.
+            raise TypeError('defer cannot be used with slots')
+        if weakref_slot and not (slots or storage):
+            raise TypeError('weakref_slot is True but slots is False')
+
+        methods = tuple(name for name, enabled in (('bulk', bulk), ('construct', construct or construct_post_init),
+                                                   ('convert', convert), ('decode', decode),
+                                                   ('replace', replace), ('state', state or validate_state),
+                                                   ('codec', codec))
+                        if enabled)
+
+        def build(cls):
             # Annotate all properties
             mcs.annotate_properties(cls)  # <<<EDITED>>>
-            return mcs._process_class(cls, init, repr, eq, order, unsafe_hash, frozen, match_args, kw_only, slots)
+            return mcs._process_class(cls, init, repr, eq, order, unsafe_hash, frozen, match_args, kw_only, slots,
+                                      weakref_slot, storage=storage, lazy_methods=lazy_methods,
+                                      construct_post_init=construct_post_init,
+                                      validate_defaults=validate_defaults, validate_state=validate_state,
+                                      methods=methods)
+
+        def wrap(cls):
+            if defer:
+                return mcs.defer_class(cls, build, init, methods)
+            return build(cls)
 
         # See if we're being called as @dataclass or @dataclass().
         if cls is None:
@@ -144,7 +222,8 @@ class DataclassInterface(BaseDataclassInterface):
 
     @classmethod
     def _process_class(mcs, cls, init, repr, eq, order, unsafe_hash, frozen,
-                       match_args, kw_only, slots):
+                       match_args, kw_only, slots, weakref_slot=False, storage=None, lazy_methods=False,
+                       construct_post_init=False, validate_defaults=True, validate_state=False, methods=()):
         # Now that dicts retain insertion order, there's no reason to use
         # an ordered dict.  I am leveraging that ordering here, because
         # derived class fields overwrite base class fields, but the order
@@ -259,6 +338,12 @@ class DataclassInterface(BaseDataclassInterface):
         # also marks this class as being a dataclass.
         setattr(cls, mcs._FIELDS, fields)
 
+        # <<<EDITED>>> Optional generated methods (given or inherited from
+        # dataclass bases).
+        methods = mcs.optional_methods(cls, methods)
+        if methods:
+            setattr(cls, mcs._METHODS, methods)
+
         # Was this class defined with an explicit __hash__?  Note that if
         # __eq__ is defined in this class, then python will automatically
         # set __hash__ to None.  This is a heuristic, as it's possible
@@ -281,23 +366,57 @@ class DataclassInterface(BaseDataclassInterface):
         (std_init_fields,
          kw_only_init_fields) = mcs._fields_in_init_order(all_init_fields)
 
+        # <<<EDITED>>> Compact storage keeps every storage name at a
+        # position in one value list.  Subclasses of a compact class
+        # must be compact too, because the base class attributes read
+        # the value list.
+        if storage is None and any(getattr(b, mcs._STORAGE, None) is not None for b in cls.__mro__[1:]):
+            storage = 'compact'
+        layout = None
+        if storage == 'compact':
+            names = mcs._field_slots(cls, [f for f in fields.values() if f._field_type is mcs._FIELD])
+            setattr(cls, mcs._STORAGE, tuple(names))
+            layout = mcs._storage_layout(cls)
+
+        # All of the generated methods are compiled together with one exec.
+        func_builder = mcs.FuncBuilder(globals, mcs.code_cache)  # <<<EDITED>>>
+        # Methods that are not needed to create an instance can be compiled on first use.
+        if lazy_methods:
+            lazy_builder = mcs.FuncBuilder(globals, mcs.code_cache)
+        else:
+            lazy_builder = func_builder
+
+        # Does this class have a post-init function?
+        has_post_init = hasattr(cls, mcs._POST_INIT_NAME)
+
+        # The alternate constructors, _asdict and _astuple are only compiled the first time they are used.
+        extra_builder = mcs.FuncBuilder(globals, mcs.code_cache)
+        if 'construct' in methods:
+            mcs._construct_fn(all_init_fields, frozen, has_post_init and construct_post_init, extra_builder, layout)
+
         if init:
-            # Does this class have a post-init function?
-            has_post_init = hasattr(cls, mcs._POST_INIT_NAME)
-
-            mcs._set_new_attribute(cls, '__init__',
-                               mcs._init_fn(all_init_fields,
-                                        std_init_fields,
-                                        kw_only_init_fields,
-                                        frozen,
-                                        has_post_init,
-                                        # The name to use for the "self"
-                                        # param in __init__.  Use "self"
-                                        # if possible.
-                                        '__dataclass_self__' if 'self' in fields
-                                                else 'self',
-                                        globals,
-                              ))
+            mcs._init_fn(all_init_fields,
+                         std_init_fields,
+                         kw_only_init_fields,
+                         frozen,
+                         has_post_init,
+                         # The name to use for the "self"
+                         # param in __init__.  Use "self"
+                         # if possible.
+                         '__dataclass_self__' if 'self' in fields
+                                 else 'self',
+                         func_builder,
+                         slots,
+                         layout,
+                         validate_defaults,
+                         )
+
+            if 'bulk' in methods:
+                mcs._bulk_init_fns(all_init_fields, std_init_fields, kw_only_init_fields, frozen, has_post_init,
+                                   extra_builder, slots, layout, validate_defaults)
+            if 'replace' in methods:
+                mcs._replace_fn(cls, all_init_fields, frozen, has_post_init,
+                                '__dataclass_self__' if 'self' in fields else 'self', extra_builder, slots, layout)
 
         # Get the fields as a list, and include only real fields.  This is
         # used in all of the following methods.
@@ -305,68 +424,185 @@ class DataclassInterface(BaseDataclassInterface):
 
         if repr:
             flds = [f for f in field_list if f.repr]
-            mcs._set_new_attribute(cls, '__repr__', mcs._repr_fn(flds, globals))
+            mcs._repr_fn(flds, lazy_builder)
 
         if eq:
             # Create __eq__ method.  There's no need for a __ne__ method,
             # since python will call __eq__ and negate it.
             flds = [f for f in field_list if f.compare]
-            self_tuple = mcs._tuple_str('self', flds)
-            other_tuple = mcs._tuple_str('other', flds)
-            mcs._set_new_attribute(cls, '__eq__',
-                               mcs._cmp_fn('__eq__', '==',
-                                       self_tuple, other_tuple,
-                                       globals=globals))
+            self_tuple = mcs._fields_tuple_str('self', flds, layout, all_fields=len(flds) == len(field_list))
+            other_tuple = mcs._fields_tuple_str('other', flds, layout, all_fields=len(flds) == len(field_list))
+            mcs._cmp_fn('__eq__', '==', self_tuple, other_tuple, lazy_builder)
 
         if order:
             # Create and set the ordering methods.
             flds = [f for f in field_list if f.compare]
-            self_tuple = mcs._tuple_str('self', flds)
-            other_tuple = mcs._tuple_str('other', flds)
+            self_tuple = mcs._fields_tuple_str('self', flds, layout)
+            other_tuple = mcs._fields_tuple_str('other', flds, layout)
             for name, op in [('__lt__', '<'),
                              ('__le__', '<='),
                              ('__gt__', '>'),
                              ('__ge__', '>='),
                              ]:
-                if mcs._set_new_attribute(cls, name,
-                                      mcs._cmp_fn(name, op, self_tuple, other_tuple,
-                                              globals=globals)):
-                    raise TypeError(f'Cannot overwrite attribute {name} '
-                                    f'in class {cls.__name__}. Consider using '
-                                    'functools.total_ordering')
+                # Raise an error if the class already defines an ordering method.
+                mcs._cmp_fn(name, op, self_tuple, other_tuple, lazy_builder,
+                            overwrite_error='Consider using functools.total_ordering')
 
         if frozen:
-            for fn in mcs._frozen_get_del_attr(cls, field_list, globals):
-                if mcs._set_new_attribute(cls, fn.__name__, fn):
-                    raise TypeError(f'Cannot overwrite attribute {fn.__name__} '
-                                    f'in class {cls.__name__}')
+            mcs._frozen_get_del_attr(cls, field_list, func_builder)
 
         # Decide if/how we're going to create a hash function.
-        hash_action = mcs._hash_action[bool(unsafe_hash),
-                                   bool(eq),
-                                   bool(frozen),
-                                   has_explicit_hash]
+        hash_action = mcs._hash_action(bool(unsafe_hash),
+                                       bool(eq),
+                                       bool(frozen),
+                                       has_explicit_hash)
         if hash_action:
-            # No need to call _set_new_attribute here, since by the time
-            # we're here the overwriting is unconditional.
-            cls.__hash__ = hash_action(cls, field_list, globals)
+            hash_action(cls, field_list, lazy_builder)
+
+        if 'convert' in methods:
+            mcs._asdict_fn(field_list, extra_builder, layout)
+            mcs._astuple_fn(field_list, extra_builder, layout)
+        if 'decode' in methods:
+            mcs._from_dict_fn(extra_builder)
+        if 'state' in methods or layout is not None or (slots and frozen):
+            mcs._state_fns(cls, field_list, frozen, extra_builder, slots, layout, validate_state)
+        if 'codec' in methods:
+            mcs._codec_fns(cls, field_list, frozen, extra_builder, layout)
+
+        # Compile and add all of the methods to the class.
+        mcs._add_fns_to_class(func_builder, cls)  # <<<EDITED>>>
+        if lazy_methods:
+            mcs._add_lazy_fns_to_class(lazy_builder, cls)
+        mcs._add_lazy_fns_to_class(extra_builder, cls)
 
         if not getattr(cls, '__doc__'):
             # Create a class doc-string.
-            cls.__doc__ = (cls.__name__ +
-                           str(inspect.signature(cls)).replace(' -> None', ''))
+            if lazy_methods:
+                cls.__doc__ = mcs.make_lazy_doc(cls)
+            else:
+                cls.__doc__ = mcs.make_doc(cls)  # <<<EDITED>>>
 
         if match_args:
             # I could probably compute this once
             mcs._set_new_attribute(cls, '__match_args__',
                                tuple(f.name for f in std_init_fields))
 
-        if slots:
-            cls = mcs._add_slots(cls, frozen)
+        if slots or layout is not None:
+            cls = mcs._add_slots(cls, frozen, weakref_slot, layout)  # <<<EDITED>>>
 
         abc.update_abstractmethods(cls)
 
         return cls
 
 
+    @staticmethod
+    def _get_slots(cls):
+        slots = cls.__dict__.get('__slots__', None)
+        if slots is None:
+            return ()
+        if isinstance(slots, str):
+            return (slots,)
+        if hasattr(slots, '__next__'):
+            # Slots may be any iterable, but we cannot handle an iterator
+            # because it will already be (partially) consumed.
+            raise TypeError(f"Slots of '{cls.__name__}' cannot be determined")
+        return tuple(slots)
+
+    @classmethod
+    def _field_slots(mcs, cls, fields):
+        # <<<EDITED>>> Fields get a slot with their name. Property fields
+        # keep the property, so they get slots for their backing
+        # attributes instead.  Never add a slot that would replace a
+        # property.
+        names = []
+        for f in fields:
+            if isinstance(f, mcs.PropertyField):
+                storage = mcs.property_storage(f.prop)
+            else:
+                storage = (f.name,)
+            for name in storage:
+                if name not in names and not isinstance(getattr(cls, name, None), property):
+                    names.append(name)
+        return names
+
+    @classmethod
+    def _compact_attributes(mcs, cls_dict, fields, layout):
+        # <<<EDITED>>> Return the class attributes for compact storage.
+        # Every storage name reads its position in the value list.
+        # Pass-through properties read and write the list directly.
+        attrs = {name: CompactAttribute(name, index) for name, index in layout.items()}
+        for f in fields:
+            prop = getattr(f, 'prop', None)
+            index = mcs._compact_index(f, layout)
+            if index is None or prop is None:
+                continue
+            new_prop = prop.getter(compact_getter(index, f.name)).setter(compact_setter(index, f.name))
+            new_prop.name = f.name
+            attrs[f.name] = new_prop
+        return attrs
+
+    @classmethod
+    def _add_slots(mcs, cls, is_frozen, weakref_slot, layout=None):
+        # Need to create a new class, since we can't set __slots__
+        #  after a class has been created.
+
+        # Make sure __slots__ isn't already set.
+        if '__slots__' in cls.__dict__:
+            raise TypeError(f'{cls.__name__} already specifies __slots__')
+
+        # Create a new dict for our new class.
+        cls_dict = dict(cls.__dict__)
+        fields = mcs.fields(cls)
+        # Make sure slots don't overlap with those in base classes.
+        inherited_slots = set(
+            itertools.chain.from_iterable(map(mcs._get_slots, cls.__mro__[1:-1]))
+        )
+        # The slots for our class.  Remove slots from our base classes.  Add
+        # '__weakref__' if weakref_slot was given, unless it is already present.
+        cls_dict["__slots__"] = tuple(
+            itertools.filterfalse(
+                inherited_slots.__contains__,
+                itertools.chain(
+                    # <<<EDITED>>>
+                    (VALUES,) if layout is not None else mcs._field_slots(cls, fields),
+                    ('__weakref__',) if weakref_slot else ()
+                )
+            ),
+        )
+
+        for f in fields:
+            # Remove our attributes, if present. They'll still be
+            #  available in _MARKER.  Keep the properties.
+            if not isinstance(cls_dict.get(f.name, None), property):  # <<<EDITED>>>
+                cls_dict.pop(f.name, None)
+
+        if layout is not None:
+            cls_dict.update(mcs._compact_attributes(cls_dict, fields, layout))  # <<<EDITED>>>
+
+        # Remove __dict__ itself.
+        cls_dict.pop('__dict__', None)
+
+        # Clear existing `__weakref__` descriptor, it belongs to a previous type:
+        cls_dict.pop('__weakref__', None)  # gh-102069
+
+        # And finally create the class.
+        qualname = getattr(cls, '__qualname__', None)
+        old_cls, cls = cls, type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        if qualname is not None:
+            cls.__qualname__ = qualname
+
+        # <<<EDITED>>> The generated frozen __setattr__ and __delattr__
+        # reference the class. Point them to the new class.
+        for value in cls_dict.values():
+            code = getattr(value, '__code__', None)
+            if code is not None and '__dataclass_cls__' in code.co_freevars:
+                cell = value.__closure__[code.co_freevars.index('__dataclass_cls__')]
+                if cell.cell_contents is old_cls:
+                    cell.cell_contents = cls
+
+        # <<<EDITED>>> Pickling and copying of frozen and compact classes
+        # use the methods generated by _state_fns.
+        return cls
+
+
 dataclass = DataclassInterface.dataclass
@@ -5,12 +5,11 @@ Changes:
   * Custom field_property
   * Custom dataclass function to automatically annotate properties.
   * Modified _get_field to get default value for property.
-  * No Changes to _process_class, included to use _get_field and _init_fn
+  * _process_class uses _get_field and compiles all generated methods with one FuncBuilder exec
 """
 
 import sys
 import types
-import inspect
 import dataclasses
 
 from .interface import BaseDataclassInterface
@@ -27,7 +26,10 @@ class DataclassInterface(BaseDataclassInterface):
 
     @classmethod
     def dataclass(mcs, cls=None, *, init=True, repr=True, eq=True, order=False,
-                  unsafe_hash=False, frozen=False):
+                  unsafe_hash=False, frozen=False, lazy_methods=False, defer=False, construct_post_init=False,
+                  validate_defaults=True, validate_state=False, bulk=False, construct=False,
+                  convert=False, decode=False, replace=False,
+                  state=False, codec=False):
         """Returns the same class as was passed in, with dunder methods
         added based on the fields defined in the class.
 
@@ -38,11 +40,66 @@ class DataclassInterface(BaseDataclassInterface):
         comparison dunder methods are added. If unsafe_hash is true, a
         __hash__() method function is added. If frozen is true, fields may
         not be assigned to after instance creation.
+
+        If lazy_methods is true, __repr__(), __eq__(), the ordering methods,
+        __hash__() and the class doc-string are only generated the first
+        time they are used.
+
+        If defer is true, the class is only processed the first time an
+        instance is created or the fields are requested (fields(),
+        is_dataclass(), or a dataclass subclass).
+
+        If validate_defaults is false, the generated __init__() stores the
+        default of a property directly in its storage attribute instead of
+        running the setter when the argument is not given.
+
+        The following options add generated methods. Dataclass subclasses
+        also get the methods of their dataclass bases.
+
+        If bulk is true (and init is true), the from_records() and
+        from_columns() classmethods create many instances at once.
+
+        If construct is true, the `_construct(**values)` classmethod creates
+        an instance from trusted values without running the property
+        setters. It only calls __post_init__() if construct_post_init is true
+        (which implies construct).
+
+        If convert is true, the `_asdict(mode)` and `_astuple(mode)` methods
+        convert an instance to a dict or tuple without walking fields().
+
+        If decode is true, the `from_dict(data, validate=True)` classmethod
+        creates an instance from nested dicts (see decode.py).
+
+        If replace is true (and init is true), the `__replace__(**changes)`
+        method used by replace() only runs the setters of the changed fields.
+
+        If state is true, copies (copy.copy, copy.deepcopy) and pickles
+        store the values of the storage attributes. If validate_state is true
+        (which implies state), unpickling runs the property setters instead
+        of restoring the stored values.
+
+        If codec is true, the `pack()`, `pack_into()`, `pack_many()`,
+        `unpack()` and `iter_unpack()` methods pack the stored values with a
+        struct.Struct. They raise TypeError if a field cannot be packed.
         """
-        def wrap(cls):
+        methods = tuple(name for name, enabled in (('bulk', bulk), ('construct', construct or construct_post_init),
+                                                   ('convert', convert), ('decode', decode),
+                                                   ('replace', replace), ('state', state or validate_state),
+                                                   ('codec', codec))
+                        if enabled)
+
+        def build(cls):
             # Annotate all properties
             mcs.annotate_properties(cls)  # <<<EDITED>>>
-            return mcs._process_class(cls, init, repr, eq, order, unsafe_hash, frozen)
+            return mcs._process_class(cls, init, repr, eq, order, unsafe_hash, frozen, lazy_methods=lazy_methods,
+                                      construct_post_init=construct_post_init,
+                                      validate_defaults=validate_defaults, validate_state=validate_state,
+                                      methods=methods)
+
+        def wrap(cls):
+            if defer:
+                return mcs.defer_class(cls, build, init, methods)
+            return build(cls)
 
         # See if we're being called as @dataclass or @dataclass().
         if cls is None:
@@ -128,7 +185,8 @@ class DataclassInterface(BaseDataclassInterface):
         return f
 
     @classmethod
-    def _process_class(mcs, cls, init, repr, eq, order, unsafe_hash, frozen):
+    def _process_class(mcs, cls, init, repr, eq, order, unsafe_hash, frozen, lazy_methods=False,
+                       construct_post_init=False, validate_defaults=True, validate_state=False, methods=()):
         # Now that dicts retain insertion order, there's no reason to use
         # an ordered dict.  I am leveraging that ordering here, because
         # derived class fields overwrite base class fields, but the order
@@ -224,6 +282,12 @@ class DataclassInterface(BaseDataclassInterface):
         # also marks this class as being a dataclass.
         setattr(cls, mcs._FIELDS, fields)
 
+        # <<<EDITED>>> Optional generated methods (given or inherited from
+        # dataclass bases).
+        methods = mcs.optional_methods(cls, methods)
+        if methods:
+            setattr(cls, mcs._METHODS, methods)
+
         # Was this class defined with an explicit __hash__?  Note that if
         # __eq__ is defined in this class, then python will automatically
         # set __hash__ to None.  This is a heuristic, as it's possible
@@ -238,24 +302,51 @@ class DataclassInterface(BaseDataclassInterface):
         if order and not eq:
             raise ValueError('eq must be true if order is true')
 
+        # All of the generated methods are compiled together with one exec.
+        func_builder = mcs.FuncBuilder(globals, mcs.code_cache)  # <<<EDITED>>>
+        # Methods that are not needed to create an instance can be compiled on first use.
+        if lazy_methods:
+            lazy_builder = mcs.FuncBuilder(globals, mcs.code_cache)
+        else:
+            lazy_builder = func_builder
+
+        # Does this class have a post-init function?
+        has_post_init = hasattr(cls, mcs._POST_INIT_NAME)
+
+        # Include InitVars and regular fields (so, not ClassVars).
+        flds = [f for f in fields.values()
+                if f._field_type in (mcs._FIELD, mcs._FIELD_INITVAR)]
+
+        # The alternate constructors, _asdict and _astuple are only compiled the first time they are used.
+        extra_builder = mcs.FuncBuilder(globals, mcs.code_cache)
+        if 'construct' in methods:
+            mcs._construct_fn(flds, frozen, has_post_init and construct_post_init, extra_builder)
+
         if init:
-            # Does this class have a post-init function?
-            has_post_init = hasattr(cls, mcs._POST_INIT_NAME)
-
-            # Include InitVars and regular fields (so, not ClassVars).
-            flds = [f for f in fields.values()
-                    if f._field_type in (mcs._FIELD, mcs._FIELD_INITVAR)]
-            mcs._set_new_attribute(cls, '__init__',
-                               mcs._init_fn(flds,
-                                        frozen,
-                                        has_post_init,
-                                        # The name to use for the "self"
-                                        # param in __init__.  Use "self"
-                                        # if possible.
-                                        '__dataclass_self__' if 'self' in fields
-                                        else 'self',
-                                        globals,
-                                        ))
+            # Only init=True fields are __init__ parameters (there are no
+            # keyword-only fields before Python 3.10).
+            std_init_fields = [f for f in flds if f.init]
+            mcs._init_fn(flds,
+                         std_init_fields,
+                         [],
+                         frozen,
+                         has_post_init,
+                         # The name to use for the "self"
+                         # param in __init__.  Use "self"
+                         # if possible.
+                         '__dataclass_self__' if 'self' in fields
+                         else 'self',
+                         func_builder,
+                         False,
+                         validate_defaults=validate_defaults,
+                         )
+
+            if 'bulk' in methods:
+                mcs._bulk_init_fns(flds, std_init_fields, [], frozen, has_post_init, extra_builder, False,
+                                   validate_defaults=validate_defaults)
+            if 'replace' in methods:
+                mcs._replace_fn(cls, flds, frozen, has_post_init,
+                                '__dataclass_self__' if 'self' in fields else 'self', extra_builder, False)
 
         # Get the fields as a list, and include only real fields.  This is
         # used in all of the following methods.
@@ -263,7 +354,7 @@ class DataclassInterface(BaseDataclassInterface):
 
         if repr:
             flds = [f for f in field_list if f.repr]
-            mcs._set_new_attribute(cls, '__repr__', mcs._repr_fn(flds, globals))
+            mcs._repr_fn(flds, lazy_builder)
 
         if eq:
             # Create _eq__ method.  There's no need for a __ne__ method,
@@ -271,10 +362,7 @@ class DataclassInterface(BaseDataclassInterface):
             flds = [f for f in field_list if f.compare]
             self_tuple = mcs._tuple_str('self', flds)
             other_tuple = mcs._tuple_str('other', flds)
-            mcs._set_new_attribute(cls, '__eq__',
-                               mcs._cmp_fn('__eq__', '==',
-                                       self_tuple, other_tuple,
-                                       globals=globals))
+            mcs._cmp_fn('__eq__', '==', self_tuple, other_tuple, lazy_builder)
 
         if order:
             # Create and set the ordering methods.
@@ -286,33 +374,43 @@ class DataclassInterface(BaseDataclassInterface):
                              ('__gt__', '>'),
                              ('__ge__', '>='),
                              ]:
-                if mcs._set_new_attribute(cls, name,
-                                      mcs._cmp_fn(name, op, self_tuple, other_tuple,
-                                              globals=globals)):
-                    raise TypeError(f'Cannot overwrite attribute {name} '
-                                    f'in class {cls.__name__}. Consider using '
-                                    'functools.total_ordering')
+                # Raise an error if the class already defines an ordering method.
+                mcs._cmp_fn(name, op, self_tuple, other_tuple, lazy_builder,
+                            overwrite_error='Consider using functools.total_ordering')
 
         if frozen:
-            for fn in mcs._frozen_get_del_attr(cls, field_list, globals):
-                if mcs._set_new_attribute(cls, fn.__name__, fn):
-                    raise TypeError(f'Cannot overwrite attribute {fn.__name__} '
-                                    f'in class {cls.__name__}')
+            mcs._frozen_get_del_attr(cls, field_list, func_builder)
 
         # Decide if/how we're going to create a hash function.
-        hash_action = mcs._hash_action[bool(unsafe_hash),
-                                   bool(eq),
-                                   bool(frozen),
-                                   has_explicit_hash]
+        hash_action = mcs._hash_action(bool(unsafe_hash),
+                                       bool(eq),
+                                       bool(frozen),
+                                       has_explicit_hash)
         if hash_action:
-            # No need to call _set_new_attribute here, since by the time
-            # we're here the overwriting is unconditional.
-            cls.__hash__ = hash_action(cls, field_list, globals)
+            hash_action(cls, field_list, lazy_builder)
+
+        if 'convert' in methods:
+            mcs._asdict_fn(field_list, extra_builder)
+            mcs._astuple_fn(field_list, extra_builder)
+        if 'decode' in methods:
+            mcs._from_dict_fn(extra_builder)
+        if 'state' in methods:
+            mcs._state_fns(cls, field_list, frozen, extra_builder, False, validate_state=validate_state)
+        if 'codec' in methods:
+            mcs._codec_fns(cls, field_list, frozen, extra_builder)
+
+        # Compile and add all of the methods to the class.
+        mcs._add_fns_to_class(func_builder, cls)  # <<<EDITED>>>
+        if lazy_methods:
+            mcs._add_lazy_fns_to_class(lazy_builder, cls)
+        mcs._add_lazy_fns_to_class(extra_builder, cls)
 
         if not getattr(cls, '__doc__'):
             # Create a class doc-string.
-            cls.__doc__ = (cls.__name__ +
-                           str(inspect.signature(cls)).replace(' -> None', ''))
+            if lazy_methods:
+                cls.__doc__ = mcs.make_lazy_doc(cls)
+            else:
+                cls.__doc__ = mcs.make_doc(cls)  # <<<EDITED>>>
 
         return cls
 
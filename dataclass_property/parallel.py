@@ -0,0 +1,158 @@
+"""
+Build many instances in a process or thread pool.
+
+`build_many(cls, records, executor='process')` splits the records into chunks and creates the instances of every
+chunk in a worker, with the generated `from_records` of `dataclass(bulk=True)` classes (the same initialization as
+`__init__`). Use it when the property setters do expensive validation. The results keep the order of the records and
+errors are reported per record.
+
+Process workers pickle the instances to send them back, so the setters do not run again in this process. With
+`dataclass(state=True)` the generated `__reduce_ex__` only pickles the list of stored values (unless the class uses
+`validate_state=True`). Threads only run in parallel on free-threaded Python builds.
+
+.. code-block:: python
+
+    try:
+        users = build_many(User, rows, executor='process', chunksize=1000)
+    except BuildError as err:
+        for index, error in err.errors:
+            print(index, error)
+"""
+import os
+import sys
+import pickle
+
+
+__all__ = ['EXECUTORS', 'BuildError', 'build_records', 'build_many']
+
+
+EXECUTORS = (None, 'auto', 'process', 'thread')
+
+
+class BuildError(ValueError):
+    """Some of the records could not be built.
+
+    Attributes:
+        errors (list): [(record index, exception)] in record order.
+        results (list): Instances in record order. Failed records are None.
+    """
+    def __init__(self, errors, results):
+        index, error = errors[0]
+        super().__init__('{} of {} records failed. Record {}: {}: {}'.format(
+            len(errors), len(results), index, type(error).__name__, error))
+        self.errors = errors
+        self.results = results
+
+
+def _build_one(cls, record):
+    from_records = getattr(cls, 'from_records', None)
+    if from_records is not None:
+        return from_records((record,))[0]
+    if isinstance(record, dict):
+        return cls(**record)
+    return cls(*record)
+
+
+def build_records(cls, records):
+    """Build the instances of the records in this thread. Return (instances, [(position, exception)]).
+
+    All of the records are built with one `from_records` call. If it fails, every record is built separately to find
+    the records that fail (so the setters of the records before the error run twice).
+    """
+    from_records = getattr(cls, 'from_records', None)
+    if from_records is not None:
+        try:
+            return from_records(records), []
+        except Exception:
+            pass
+
+    instances = []
+    errors = []
+    for i, record in enumerate(records):
+        try:
+            instances.append(_build_one(cls, record))
+        except Exception as err:
+            instances.append(None)
+            errors.append((i, err))
+    return instances, errors
+
+
+def _picklable(err):
+    try:
+        pickle.dumps(err)
+        return err
+    except Exception:
+        return RuntimeError('{}: {}'.format(type(err).__name__, err))
+
+
+def _build_chunk(cls, records):
+    # Runs in a worker process.  The exceptions are sent back as well.
+    instances, errors = build_records(cls, records)
+    return instances, [(i, _picklable(err)) for i, err in errors]
+
+
+def _free_threaded():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def build_many(cls, records, executor='auto', chunksize=None, max_workers=None, errors='raise'):
+    """Build instances of a dataclass from records (dicts with the field names or tuples of `__init__` arguments).
+
+    Args:
+        cls (type): Dataclass. It must be importable by name in worker processes.
+        records (iterable): Records to build.
+        executor (str/Executor)['auto']: 'process' for a ProcessPoolExecutor, 'thread' for a ThreadPoolExecutor,
+            'auto' for threads on free-threaded builds and processes otherwise, None to build in this thread or an
+            existing executor.
+        chunksize (int)[None]: Records per task. By default the records are split into 4 chunks per worker.
+        max_workers (int)[None]: Workers of a new pool.
+        errors (str)['raise']: 'raise' to raise BuildError if any record fails or 'return' to put the exceptions in
+            the results at the positions of the failed records.
+
+    Returns:
+        results (list): Instances in the order of the records.
+    """
+    if errors not in ('raise', 'return'):
+        raise ValueError('Invalid errors {!r}, expected \'raise\' or \'return\''.format(errors))
+    if not (executor in EXECUTORS or hasattr(executor, 'submit')):
+        raise ValueError('Invalid executor {!r}, expected one of {} or an Executor'.format(executor, EXECUTORS))
+    records = list(records)
+
+    if executor is None or not records:
+        results, failed = build_records(cls, records)
+    elif isinstance(executor, str):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if executor == 'auto':
+            executor = 'thread' if _free_threaded() else 'process'
+        pool = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+        with pool(max_workers) as pool_executor:
+            results, failed = _build_chunks(cls, records, pool_executor, chunksize, max_workers)
+    else:
+        results, failed = _build_chunks(cls, records, executor, chunksize, getattr(executor, '_max_workers', None))
+
+    if failed:
+        if errors == 'raise':
+            raise BuildError(failed, results)
+        for i, err in failed:
+            results[i] = err
+    return results
+
+
+def _build_chunks(cls, records, executor, chunksize, workers):
+    from concurrent.futures import ProcessPoolExecutor
+
+    if chunksize is None:
+        chunksize = max(1, -(-len(records) // ((workers or os.cpu_count() or 1) * 4)))
+    starts = range(0, len(records), chunksize)
+    task = _build_chunk if isinstance(executor, ProcessPoolExecutor) else build_records
+    futures = [executor.submit(task, cls, records[start:start + chunksize]) for start in starts]
+
+    results = []
+    failed = []
+    for start, future in zip(starts, futures):
+        instances, errors = future.result()
+        results.extend(instances)
+        failed.extend((start + i, err) for i, err in errors)
+    return results, failed
@@ -0,0 +1,195 @@
+"""
+Opt-in profiler for the phases of building a dataclass.
+
+The profiler temporarily replaces the phase methods on a DataclassInterface with timed wrappers. When it is not
+enabled the interface is left untouched, so there is no cost at all.
+
+.. code-block:: python
+
+    from dataclass_property.profiler import profile_decoration
+
+    with profile_decoration() as prof:
+        import my_models
+
+    print(prof.format())
+"""
+import time
+import contextlib
+
+
+__all__ = ['DecorationProfiler', 'profile_decoration']
+
+
+class DecorationProfiler:
+    """Record the wall time and number of calls for each phase of class decoration.
+
+    Times are inclusive. `make_field` runs inside `_get_field` and `get_return_type` runs inside
+    `annotate_properties`, so the phase times do not add up to the total.
+
+    Args:
+        interface (type)[None]: DataclassInterface class to instrument. Default is the one used by `dataclass`.
+        phases (list)[None]: Names of the interface methods to time. Default is PHASES. Phases that the interface
+            does not define (`_add_slots` before Python 3.10) are skipped.
+    """
+
+    PHASES = ('annotate_properties', '_get_field', 'make_field', 'get_return_type',
+              '_init_fn', '_bulk_init_fns', '_construct_fn', '_replace_fn', '_repr_fn', '_cmp_fn',
+              '_hash_action', '_hash_add', '_hash_set_none', '_hash_exception', '_frozen_get_del_attr',
+              '_asdict_fn', '_astuple_fn', '_from_dict_fn', '_state_fns', '_codec_fns',
+              '_add_fns_to_class', '_add_lazy_fns_to_class', 'make_doc', '_add_slots')
+    TOTAL = '_process_class'
+    UNKNOWN = '<unknown>'
+
+    def __init__(self, interface=None, phases=None):
+        if interface is None:
+            from . import DataclassInterface as interface
+
+        self.interface = interface
+        self.phases = tuple(phases or self.PHASES)
+        self.stats = {}  # {class name: {phase: [calls, seconds]}}
+        self._stack = []
+        self._saved = None
+
+    @property
+    def enabled(self):
+        return self._saved is not None
+
+    def enable(self):
+        """Install the timed wrappers on the interface."""
+        if self._saved is not None:
+            return
+        self._saved = {}
+        for name in (self.TOTAL, 'annotate_properties') + self.phases:
+            raw = self._lookup(name)
+            if raw is None or name in self._saved:
+                continue
+            self._saved[name] = self.interface.__dict__.get(name, None), name in self.interface.__dict__
+            setattr(self.interface, name, self._wrap(name, raw))
+
+    def disable(self):
+        """Restore the original interface methods."""
+        if self._saved is None:
+            return
+        for name, (value, owned) in self._saved.items():
+            if owned:
+                setattr(self.interface, name, value)
+            else:
+                delattr(self.interface, name)
+        self._saved = None
+
+    def reset(self):
+        self.stats.clear()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+        return False
+
+    def _lookup(self, name):
+        """Return the raw class attribute (classmethod, staticmethod or function) from the interface MRO or None."""
+        for klass in self.interface.__mro__:
+            if name in klass.__dict__:
+                return klass.__dict__[name]
+        return None
+
+    def _record(self, cls_name, name, seconds):
+        phases = self.stats.setdefault(cls_name, {})
+        try:
+            stat = phases[name]
+            stat[0] += 1
+            stat[1] += seconds
+        except KeyError:
+            phases[name] = [1, seconds]
+
+    def _wrap(self, name, raw):
+        """Return a wrapper of the same method type as raw which records the call time."""
+        record = self._record
+        stack = self._stack
+        unknown = self.UNKNOWN
+        track_cls = name in (self.TOTAL, 'annotate_properties')
+
+        if isinstance(raw, (classmethod, staticmethod)):
+            func = raw.__func__
+        else:
+            func = raw
+        cls_index = 1 if isinstance(raw, classmethod) else 0  # Skip mcs to find the class being decorated
+
+        def timed(args, kwargs):
+            if track_cls:
+                cls_name = getattr(args[cls_index], '__qualname__', unknown)
+                stack.append(cls_name)
+            else:
+                cls_name = stack[-1] if stack else unknown
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(cls_name, name, time.perf_counter() - start)
+                if track_cls:
+                    stack.pop()
+
+        if isinstance(raw, classmethod):
+            def wrapper(mcs, *args, **kwargs):
+                return timed((mcs,) + args, kwargs)
+            return classmethod(wrapper)
+
+        def wrapper(*args, **kwargs):
+            return timed(args, kwargs)
+        if isinstance(raw, staticmethod):
+            return staticmethod(wrapper)
+        return wrapper
+
+    @staticmethod
+    def _summarize(phases):
+        return {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in phases.items()}
+
+    def report(self):
+        """Return the per class and aggregate statistics.
+
+        Returns:
+            report (dict): {'classes': {qualname: {phase: {'calls', 'seconds'}}, ...},
+                            'aggregate': {phase: {'calls', 'seconds'}}, 'total': seconds}
+        """
+        aggregate = {}
+        for phases in self.stats.values():
+            for name, (calls, seconds) in phases.items():
+                stat = aggregate.setdefault(name, [0, 0.0])
+                stat[0] += calls
+                stat[1] += seconds
+
+        total = sum(stat[1] for name, stat in aggregate.items() if name in (self.TOTAL, 'annotate_properties'))
+        return {'classes': {cls_name: self._summarize(phases) for cls_name, phases in self.stats.items()},
+                'aggregate': self._summarize(aggregate),
+                'total': total}
+
+    def format(self, limit=10):
+        """Return a human readable report with the aggregate phases and the slowest classes."""
+        report = self.report()
+        lines = ['{:<24} {:>8} {:>12}'.format('phase', 'calls', 'ms')]
+        for name, stat in sorted(report['aggregate'].items(), key=lambda item: -item[1]['seconds']):
+            lines.append('{:<24} {:>8} {:>12.3f}'.format(name, stat['calls'], stat['seconds'] * 1000))
+
+        classes = []
+        for cls_name, phases in report['classes'].items():
+            seconds = sum(phases.get(name, {}).get('seconds', 0.0) for name in (self.TOTAL, 'annotate_properties'))
+            classes.append((seconds, cls_name))
+        classes.sort(reverse=True)
+        if classes:
+            lines.append('')
+            lines.append('{:<37} {:>12}'.format('class', 'ms'))
+            for seconds, cls_name in classes[:limit]:
+                lines.append('{:<37} {:>12.3f}'.format(cls_name, seconds * 1000))
+        lines.append('')
+        lines.append('total: {:.3f} ms for {} classes'.format(report['total'] * 1000, len(classes)))
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def profile_decoration(interface=None, phases=None):
+    """Context manager that profiles every class decorated inside the with block."""
+    profiler = DecorationProfiler(interface, phases)
+    with profiler:
+        yield profiler
@@ -0,0 +1,218 @@
+"""
+Files of packed records for dataclasses with a binary codec.
+
+A record file starts with a header that records the schema (the field names and struct codes), followed by the
+records of `cls.pack`. Existing files are memory mapped: indexing decodes one record, iteration decodes the records
+lazily and `records()` returns a `DataclassBuffer` of row views over the mapped file. Memory does not grow with the
+size of the file.
+
+.. code-block:: python
+
+    with RecordFile(Sample, 'samples.rec') as f:
+        f.extend(samples)
+
+    with RecordFile(Sample, 'samples.rec', mode='r') as f:
+        last = f[-1]
+        total = sum(s.value for s in f)
+
+Opening a file whose schema does not match the class raises RecordSchemaError.
+"""
+import os
+import io
+import json
+import mmap
+import struct
+import operator
+
+from .buffer import DataclassBuffer
+
+
+__all__ = ['MAGIC', 'RecordSchemaError', 'record_schema', 'read_schema', 'RecordFile']
+
+
+MAGIC = b'DCPREC01'
+HEADER_LENGTH = struct.Struct('<I')  # Length of the schema after the magic bytes
+HEADER_ALIGNMENT = 8  # The records start at a multiple of 8 bytes
+
+
+class RecordSchemaError(ValueError):
+    """The schema of a record file does not match the class.
+
+    Attributes:
+        expected (dict): Schema of the class.
+        found (dict): Schema in the file header.
+    """
+    def __init__(self, message, expected=None, found=None):
+        super().__init__(message)
+        self.expected = expected
+        self.found = found
+
+
+def record_schema(cls):
+    """Return the schema of the packed records of a dataclass: {'class', 'format', 'size', 'fields'}.
+
+    Fields are [name, struct code] pairs in record order.
+    """
+    layout = DataclassBuffer[cls].layout()
+    return {'class': cls.__qualname__,
+            'format': layout.struct.format,
+            'size': layout.size,
+            'fields': [[f.name, attr.code] for f, attr in zip(layout.fields, layout.attributes.values())]}
+
+
+def _header(schema):
+    text = json.dumps(schema, separators=(',', ':')).encode('utf-8')
+    size = len(MAGIC) + HEADER_LENGTH.size + len(text)
+    text += b' ' * (-size % HEADER_ALIGNMENT)
+    return MAGIC + HEADER_LENGTH.pack(len(text)) + text
+
+
+def read_schema(file):
+    """Read the header of a record file (opened in binary mode). Return (schema, header size)."""
+    start = file.read(len(MAGIC) + HEADER_LENGTH.size)
+    if len(start) < len(MAGIC) + HEADER_LENGTH.size or not start.startswith(MAGIC):
+        raise ValueError('{!r} is not a record file'.format(getattr(file, 'name', file)))
+    length, = HEADER_LENGTH.unpack_from(start, len(MAGIC))
+    text = file.read(length)
+    if len(text) < length:
+        raise ValueError('The header of {!r} is truncated'.format(getattr(file, 'name', file)))
+    return json.loads(text.decode('utf-8')), len(start) + length
+
+
+class RecordFile:
+    """Append instances to a file of packed records and read them through a memory map.
+
+    Args:
+        cls (type): Dataclass with a binary codec (`pack`/`unpack`).
+        path (str/os.PathLike): File path.
+        mode (str)['a']: 'r' to read, 'a' to read and append (the file is created if it does not exist) or 'w' to
+            create an empty file. Row views of `records()` can change the records unless the mode is 'r'.
+        validate (bool)[True]: If true the property setters run when records are decoded.
+    """
+    MODES = {'r': 'rb', 'a': 'r+b', 'w': 'w+b'}
+
+    def __init__(self, cls, path, mode='a', validate=True):
+        if mode not in self.MODES:
+            raise ValueError('Invalid mode {!r}, expected one of {}'.format(mode, tuple(self.MODES)))
+        self.cls = cls
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.validate = validate
+        self.schema = record_schema(cls)
+        self.record_size = self.schema['size']
+        self._map = None
+        self._mapped_size = -1
+
+        if mode == 'a' and not os.path.exists(self.path):
+            mode = 'w'
+        self._file = open(self.path, self.MODES[mode])
+        try:
+            if mode == 'w':
+                header = _header(self.schema)
+                self._file.write(header)
+                self._file.flush()
+                self.header_size = len(header)
+            else:
+                self.header_size = self._check_header()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _check_header(self):
+        found, header_size = read_schema(self._file)
+        if found.get('fields') != self.schema['fields'] or found.get('format') != self.schema['format']:
+            raise RecordSchemaError('The records of {!r} ({}) do not match {} ({})'.format(
+                                        self.path, found.get('format'), self.cls.__qualname__, self.schema['format']),
+                                    self.schema, found)
+        size = self._file.seek(0, io.SEEK_END) - header_size
+        if size % self.record_size:
+            raise ValueError('The last record of {!r} is truncated'.format(self.path))
+        return header_size
+
+    def __repr__(self):
+        return '<{} {!r} with {} {} records>'.format(type(self).__name__, self.path, len(self), self.cls.__qualname__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def close(self):
+        """Close the file. Row views and memoryviews of the records keep the memory map until they are deleted."""
+        self._release()
+        self._file.close()
+
+    def flush(self):
+        self._file.flush()
+        if self._map is not None and self.mode != 'r':
+            self._map.flush()
+
+    def _release(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # Exported memoryviews. The map is closed when they are deleted.
+            self._map = None
+            self._mapped_size = -1
+
+    def _mapped(self):
+        """Return the memory map of the whole file (mapped again after appending records)."""
+        self._file.flush()
+        size = os.fstat(self._file.fileno()).st_size
+        if size != self._mapped_size:
+            self._release()
+            access = mmap.ACCESS_READ if self.mode == 'r' else mmap.ACCESS_WRITE
+            self._map = mmap.mmap(self._file.fileno(), size, access=access)
+            self._mapped_size = size
+        return self._map
+
+    def __len__(self):
+        self._file.flush()
+        return (os.fstat(self._file.fileno()).st_size - self.header_size) // self.record_size
+
+    def append(self, obj):
+        """Add an instance at the end of the file."""
+        if self.mode == 'r':
+            raise io.UnsupportedOperation('The record file is not writable')
+        self._file.seek(0, io.SEEK_END)
+        self._file.write(self.cls.pack(obj))
+
+    def extend(self, records):
+        """Add the instances at the end of the file."""
+        if self.mode == 'r':
+            raise io.UnsupportedOperation('The record file is not writable')
+        self._file.seek(0, io.SEEK_END)
+        self._file.write(self.cls.pack_many(records))
+
+    def buffer(self):
+        """Return a memoryview of the packed records in the memory map."""
+        return memoryview(self._mapped())[self.header_size:]
+
+    def records(self):
+        """Return a `DataclassBuffer` of row views over the mapped records."""
+        return DataclassBuffer[self.cls](self.buffer())
+
+    def __getitem__(self, index):
+        """Decode the record at the index or a list of the records of a slice."""
+        n = len(self)
+        data = self._mapped()
+        unpack = self.cls.unpack
+        if isinstance(index, slice):
+            return [unpack(data, self.header_size + i * self.record_size, self.validate)
+                    for i in range(*index.indices(n))]
+        index = operator.index(index)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('RecordFile index out of range')
+        return unpack(data, self.header_size + index * self.record_size, self.validate)
+
+    def __iter__(self):
+        """Decode the records lazily. Records appended during the iteration are not included."""
+        return self.cls.iter_unpack(self.buffer(), self.validate)
@@ -0,0 +1,138 @@
+"""
+Record buffers in shared memory for worker processes.
+
+`SharedDataclassBuffer[Point]` is a `DataclassBuffer` whose records are in a `multiprocessing.shared_memory` block.
+The parent creates and fills it. Workers attach by name, and read and write the rows through the same row views
+(the property getters and setters run). Pickling a shared buffer (or a slice of it) only sends its name and the
+record range, so nothing is pickled per record.
+
+.. code-block:: python
+
+    def work(points):  # Runs in a worker. Only the name and the range are pickled.
+        with points:
+            for p in points:
+                p.y = p.y * 2
+
+    with SharedDataclassBuffer[Point].from_records(records) as points:
+        n = len(points)
+        list(executor.map(work, [points[i:i + 1000] for i in range(0, n, 1000)]))
+        results = points.to_instances()
+    # The creator unlinks the shared memory on exit
+
+The shared memory block starts with a header with the number of records and the record size.
+"""
+import sys
+import struct
+from multiprocessing import shared_memory, resource_tracker
+
+from .buffer import DataclassBuffer
+
+
+__all__ = ['SHARED_HEADER', 'SharedDataclassBuffer', 'attach_shared']
+
+
+SHARED_HEADER = struct.Struct('<QQ')  # Number of records and record size
+
+
+def _attach_memory(name):
+    """Attach to a shared memory block and remove it from the resource tracker of this process.
+
+    Only the creator unlinks the block. Before Python 3.13 (`track=False`), attaching registers the block, and a
+    worker that was started before the block was created has its own resource tracker, which would unlink the block
+    when the worker exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    shm = shared_memory.SharedMemory(name)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def attach_shared(cls, name, indices=None):
+    """Attach to the shared record buffer of a dataclass by name (used to unpickle a SharedDataclassBuffer)."""
+    return SharedDataclassBuffer[cls].attach(name, indices)
+
+
+class SharedDataclassBuffer(DataclassBuffer):
+    """DataclassBuffer in a `multiprocessing.shared_memory.SharedMemory` block.
+
+    Use `SharedDataclassBuffer[Point].create(length)`, `.from_records(records)` or `.attach(name)`. Slices share the
+    memory block. `close()` releases the memory of this process and `unlink()` frees the block. Leaving the `with`
+    block of the buffer that created the block does both.
+
+    Args:
+        shm (SharedMemory): Shared memory block with the header and the records.
+        indices (range)[None]: Record positions in the buffer (used by slicing).
+        owner (bool)[False]: If true the block is unlinked when the buffer is used as a context manager.
+    """
+    def __init__(self, shm, indices=None, owner=False):
+        layout = self.layout()
+        length, record_size = SHARED_HEADER.unpack_from(shm.buf)
+        if record_size != layout.size:
+            raise ValueError('The records in shared memory {!r} have {} bytes, expected {} for {}'.format(
+                shm.name, record_size, layout.size, self.dataclass.__qualname__))
+        self.shm = shm
+        self.owner = owner
+        start = SHARED_HEADER.size
+        super().__init__(shm.buf[start:start + length * record_size], indices)
+
+    @classmethod
+    def create(cls, length, name=None):
+        """Create a shared memory block with zero-filled records."""
+        size = cls.layout().size
+        shm = shared_memory.SharedMemory(name, create=True, size=SHARED_HEADER.size + length * size)
+        SHARED_HEADER.pack_into(shm.buf, 0, length, size)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def from_records(cls, records, name=None):
+        """Create a shared memory block with the packed instances."""
+        data = cls.dataclass.pack_many(records)
+        self = cls.create(len(data) // cls.layout().size, name)
+        self.buffer[:] = data
+        return self
+
+    @classmethod
+    def attach(cls, name, indices=None):
+        """Attach to an existing shared memory block by name."""
+        return cls(_attach_memory(name), indices)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __reduce__(self):
+        return attach_shared, (self.dataclass, self.shm.name, self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            new = object.__new__(type(self))
+            new.__dict__.update(self.__dict__)
+            new.owner = False
+            new.buffer = self.buffer[:]  # Closing the slice does not release this buffer
+            new.indices = self.indices[index]
+            return new
+        return super().__getitem__(index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def close(self):
+        """Release the shared memory of this process. Row views cannot be used after closing."""
+        try:
+            self.buffer.release()
+            self.shm.close()
+        except BufferError:
+            pass  # Exported memoryviews. The memory is released when they are deleted.
+
+    def unlink(self):
+        """Free the shared memory block (call once, usually in the process that created it)."""
+        if sys.version_info < (3, 13):
+            # unlink() unregisters the block. Register it again in case attaching in this process unregistered it.
+            resource_tracker.register(self.shm._name, 'shared_memory')
+        self.shm.unlink()
@@ -0,0 +1,103 @@
+"""
+Helpers for the generated `__copy__`, `__deepcopy__`, `__getstate__`, `__setstate__` and `__reduce_ex__` methods.
+
+The generated methods copy and pickle the stored values of the fields (the storage attributes or the compact value
+list). Instances that have other attributes (or instances of subclasses) use the functions here, which handle the
+state like `object.__reduce_ex__` does (`__dict__` and `(__dict__, {slot: value})`).
+
+`array.array` fields are pickled with `pickle.PickleBuffer` for protocol 5, so their data can be sent out-of-band
+(`buffer_callback`). Numpy arrays already do this themselves.
+"""
+import copy
+import array
+import copyreg
+
+from .convert import ATOMIC_TYPES
+
+
+__all__ = ['object_state', 'restore_state', 'copy_object', 'deepcopy_object', 'deepcopy_value', 'array_state',
+           'ArrayState', 'rebuild_array', 'newobj']
+
+
+newobj = copyreg.__newobj__
+
+
+def object_state(obj):
+    """Return the state that `object.__reduce_ex__` pickles: `__dict__`, `(__dict__, slots)` or None."""
+    state = getattr(obj, '__dict__', None) or None
+    slots = {}
+    for name in copyreg._slotnames(type(obj)):
+        try:
+            slots[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    return (state, slots) if slots else state
+
+
+def restore_state(obj, state):
+    """Restore the state returned by `object_state` (like `copy` and `pickle` do without `__setstate__`)."""
+    slots = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slots = state
+    if state:
+        obj.__dict__.update(state)
+    if slots:
+        for name, value in slots.items():
+            object.__setattr__(obj, name, value)  # The dataclass may be frozen
+
+
+def copy_object(obj):
+    """Return a shallow copy of all of the attributes of the object."""
+    new = object.__new__(type(obj))
+    state = object_state(obj)
+    if isinstance(state, dict):
+        state = state.copy()
+    restore_state(new, state)
+    return new
+
+
+def deepcopy_object(obj, memo):
+    """Return a deep copy of all of the attributes of the object."""
+    new = object.__new__(type(obj))
+    memo[id(obj)] = new
+    restore_state(new, copy.deepcopy(object_state(obj), memo))
+    return new
+
+
+def deepcopy_value(value, memo):
+    """Return a deep copy of a stored value. Atomic values (numbers, strings, None) are returned as they are."""
+    if type(value) in ATOMIC_TYPES:
+        return value
+    return copy.deepcopy(value, memo)
+
+
+def rebuild_array(typecode, buffer):
+    """Create an `array.array` from the pickled buffer."""
+    arr = array.array(typecode)
+    arr.frombytes(memoryview(buffer).cast('B'))
+    return arr
+
+
+def array_state(value):
+    """Return the value to pickle for an `array.array` field (the value may be None or another type)."""
+    if isinstance(value, array.array):
+        return ArrayState(value)
+    return value
+
+
+class ArrayState:
+    """Pickle an `array.array` value with a PickleBuffer (protocol 5 out-of-band data).
+
+    Unpickling returns the array itself, not an ArrayState.
+    """
+    __slots__ = ('array',)
+
+    def __init__(self, arr):
+        self.array = arr
+
+    def __reduce_ex__(self, protocol):
+        import pickle
+        arr = self.array
+        if protocol >= 5:
+            return rebuild_array, (arr.typecode, pickle.PickleBuffer(arr))
+        return rebuild_array, (arr.typecode, arr.tobytes())
@@ -0,0 +1,147 @@
+"""
+Shared parts of the containers of row views (`DataclassArray` and `DataclassBuffer`).
+
+A container is specialized for a dataclass with `Container[cls]` (one subclass per dataclass, cached). The layout of
+the dataclass (its `Layout` class attribute) is computed once per specialized class. The row view class is a
+subclass of the dataclass where the storage attributes are descriptors that read and write the container, so the
+property getters and setters still run.
+
+Copying, pickling and replacing a row view (and calling the view class) create a plain instance of the dataclass with
+the stored values of the row. Row views compare equal to instances (and views) with the same values.
+"""
+import copy
+import dataclasses
+
+from .compact import VALUES
+
+
+__all__ = ['DataclassViews', 'make_view']
+
+
+class DataclassViews:
+    """Mixin for containers of row views that are specialized for a dataclass with `Container[cls]`.
+
+    Subclasses set `Layout` to the layout class, which is called with the dataclass.
+    """
+    dataclass = None
+    Layout = None
+
+    def __class_getitem__(cls, item):
+        if cls.dataclass is not None:
+            raise TypeError('{} is already specialized'.format(cls.__name__))
+        if not isinstance(item, type) or not dataclasses.is_dataclass(item):
+            raise TypeError('{} requires a dataclass, got {!r}'.format(cls.__name__, item))
+
+        specialized = cls.__dict__.get('_specialized', None)
+        if specialized is None:
+            specialized = cls._specialized = {}
+        try:
+            return specialized[item]
+        except KeyError:
+            pass
+        name = '{}[{}]'.format(cls.__name__, item.__qualname__)
+        new_cls = specialized[item] = type(cls)(name, (cls,), {'dataclass': item, '__module__': cls.__module__})
+        return new_cls
+
+    @classmethod
+    def layout(cls):
+        """Return the layout and row view class of the dataclass (computed once)."""
+        if cls.dataclass is None:
+            raise TypeError('Use {}[cls] to specialize it for a dataclass'.format(cls.__name__))
+        layout = cls.__dict__.get('_layout', None)
+        if layout is None:
+            layout = cls._layout = cls.Layout(cls.dataclass)
+        return layout
+
+
+def _unpickle_view(obj):
+    """Return the plain instance that was pickled for a row view."""
+    return obj
+
+
+def make_view(cls, fields, slots, attributes, doc, values=None):
+    """Return the row view class of a dataclass.
+
+    The view class is named after the dataclass (`PointView`) in this module, so pickle does not mistake it for the
+    dataclass. `__dataclass_instance__()` returns a plain instance with the stored values of
+    the row (the setters do not run).
+
+    Args:
+        cls (type): Dataclass.
+        fields (list): Fields of the dataclass.
+        slots (tuple): Slots of a row view that locate its record in the container.
+        attributes (dict): {storage name: descriptor} that reads and writes the container.
+        doc (str): Docstring of the view class.
+        values (function)[None]: Getter of the value list snapshot for the generated methods of compact classes.
+    """
+    names = tuple(attributes)
+    new = object.__new__
+    setattr_ = object.__setattr__
+
+    def __dataclass_instance__(self):
+        obj = new(cls)
+        if values is not None:
+            getattr(cls, VALUES).__set__(obj, values(self))
+            return obj
+        for name in names:
+            try:
+                setattr_(obj, name, getattr(self, name))
+            except AttributeError:
+                pass  # Not set
+        return obj
+
+    def __new__(view_cls, *args, **kwargs):
+        return cls(*args, **kwargs)  # Used by dataclasses.replace
+
+    def __repr__(self):
+        return repr(self.__dataclass_instance__())
+
+    def __copy__(self):
+        return self.__dataclass_instance__()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.__dataclass_instance__(), memo)
+
+    def __reduce_ex__(self, protocol):
+        # pickle only allows the class of the object in __newobj__, so the plain instance is an argument.
+        return _unpickle_view, (self.__dataclass_instance__(),)
+
+    def __replace__(self, **changes):
+        from .interface import replace
+        return replace(self.__dataclass_instance__(), **changes)
+
+    attrs = {'__slots__': slots,
+             '__module__': __name__,
+             '__qualname__': cls.__qualname__ + 'View',
+             '__doc__': doc,
+             '__new__': __new__,
+             '__dataclass_instance__': __dataclass_instance__,
+             '__repr__': __repr__,
+             '__copy__': __copy__,
+             '__deepcopy__': __deepcopy__,
+             '__reduce_ex__': __reduce_ex__,
+             '__replace__': __replace__,
+             }
+
+    params = getattr(cls, dataclasses._PARAMS, None)
+    if params is not None and params.eq:
+        def __eq__(self, other):
+            instance = getattr(type(other), '__dataclass_instance__', None)
+            if instance is not None:
+                other = instance(other)
+            return self.__dataclass_instance__() == other
+
+        attrs['__eq__'] = __eq__
+        attrs['__hash__'] = cls.__hash__  # Defining __eq__ would set it to None
+    attrs.update(attributes)
+
+    # Pass-through properties without a custom setter read the container directly
+    for f in fields:
+        storage = getattr(f, 'storage', None)
+        if storage is not None:
+            attrs[f.name] = attributes[storage]
+
+    if values is not None:
+        attrs[VALUES] = property(values)
+
+    return type(cls)(cls.__name__ + 'View', (cls,), attrs)
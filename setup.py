@@ -80,6 +80,7 @@ if __name__ == "__main__":
           install_requires=[
               ],
           extras_require={
+              'numpy': ['numpy'],  # DataclassArray(backend='numpy')
               },
 
           # entry_points={
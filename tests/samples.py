@@ -0,0 +1,130 @@
+"""
+Sample dataclasses shared by the tests.
+
+Every factory builds a new class with the given dataclass options. `register` names a class and adds it to this
+module, so pickle and worker processes find it by name.
+"""
+import itertools
+
+
+__all__ = ['register', 'make_point_class', 'make_reading_class', 'make_record_class', 'make_user_class']
+
+
+_COUNTER = itertools.count()
+
+
+def register(cls, name=None):
+    """Add the class to this module under its name (or a new unique name) and return it."""
+    if name is None:
+        name = '{}_{}'.format(cls.__name__, next(_COUNTER))
+    cls.__qualname__ = cls.__name__ = name
+    cls.__module__ = __name__
+    globals()[name] = cls
+    return cls
+
+
+def make_point_class(**kwargs):
+    """Return a point with a plain field, a pass-through property and a validating property with a vectorized setter.
+
+    Every field can be packed (`codec=True`).
+    """
+    from dataclass_property import dataclass, field_property
+
+    @dataclass(**kwargs)
+    class Point:
+        x: int = 0
+        tag: bytes = field_property(default=b'', passthrough=True, metadata={'struct': '4s'})
+
+        @field_property(default=0.0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            if value < 0:
+                raise ValueError('y must be positive')
+            object.__setattr__(self, '_y', float(value))
+
+        @y.vectorized
+        def y(self, values):
+            if any(value < 0 for value in values):
+                raise ValueError('y must be positive')
+            self._y = [float(value) for value in values]
+
+    return Point
+
+
+def make_reading_class(**kwargs):
+    """Return a packed reading (`codec=True`) with a validating property and the list of the setter values."""
+    from dataclass_property import dataclass, field_property, field
+
+    calls = []
+
+    @dataclass(codec=True, **kwargs)
+    class Reading:
+        t: int = 0
+        sensor: bytes = field(default=b'', metadata={'struct': '4s'})
+
+        @field_property(default=0.0)
+        def value(self) -> float:
+            return self._value
+
+        @value.setter
+        def value(self, value):
+            if value < 0:
+                raise ValueError('value must be positive')
+            calls.append(value)
+            object.__setattr__(self, '_value', float(value))
+
+    return Reading, calls
+
+
+def make_record_class(**kwargs):
+    """Return a registered record with mutable defaults, a property, a read only property and the setter values."""
+    import array
+    from dataclass_property import dataclass, field_property, field
+
+    calls = []
+
+    @dataclass(**kwargs)
+    class Record:
+        x: int = 0
+        data: array.array = field(default_factory=lambda: array.array('d'))
+        items: list = field(default_factory=list)
+
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            calls.append(value)
+            object.__setattr__(self, '_y', value)
+
+        @field_property(init=False)
+        def kind(self) -> str:  # Read only without storage
+            return 'record'
+
+    return register(Record), calls
+
+
+def make_user_class(**kwargs):
+    """Return a registered user with a validating and normalizing property."""
+    import re
+    from dataclass_property import dataclass, field_property
+
+    @dataclass(**kwargs)
+    class User:
+        id: int = 0
+
+        @field_property(default='')
+        def email(self) -> str:
+            return self._email
+
+        @email.setter
+        def email(self, value):
+            if not re.fullmatch(r'[^@]+@[^@]+', value):
+                raise ValueError('invalid email {!r}'.format(value))
+            self._email = value.lower()
+
+    return register(User)
@@ -0,0 +1,182 @@
+from samples import register, make_point_class
+
+
+def test_array_columns_and_views():
+    import array
+    from dataclass_property import DataclassArray
+
+    Point = make_point_class()
+    points = DataclassArray[Point](Point(i, str(i).encode(), i * 2) for i in range(5))
+    assert DataclassArray[Point] is type(points)
+    assert len(points) == 5
+    assert points.columns['x'] == array.array('q', range(5))
+    assert points.columns['_y'] == array.array('d', [0.0, 2.0, 4.0, 6.0, 8.0])
+    assert points.columns['_tag'] == [b'0', b'1', b'2', b'3', b'4']
+
+    row = points[2]
+    assert isinstance(row, Point)
+    assert repr(row) == repr(Point(2, b'2', 4.0))
+    assert (row.x, row.tag, row.y) == (2, b'2', 4.0)
+
+    # Setters still run on the views
+    row.y = 10
+    assert points.columns['_y'][2] == 10.0
+    try:
+        row.y = -1
+        raise AssertionError('The setter should validate the value')
+    except ValueError:
+        pass
+
+    # Values that do not fit the typed column change it to an object column
+    row.x = 'a'
+    assert points.columns['x'] == [0, 1, 'a', 3, 4]
+    assert points[-1].x == 4
+
+
+def test_array_bulk_operations():
+    from dataclass_property import DataclassArray
+
+    Point = make_point_class()
+    points = DataclassArray[Point](Point(i, str(i).encode(), i) for i in range(5))
+
+    points.set_column('y', [5, 4, 3, 2, 1])  # Vectorized setter
+    assert list(points.columns['_y']) == [5.0, 4.0, 3.0, 2.0, 1.0]
+    try:
+        points.set_column('y', [1, 1, 1, 1, -1])
+        raise AssertionError('The vectorized setter should validate the values')
+    except ValueError:
+        pass
+    points.set_column('x', [10, 11, 12, 13, 14])  # Normal field
+    points.set_column('tag', [b'a', b'b', b'c', b'd', b'e'])  # Pass-through property
+    assert points.column('tag') == [b'a', b'b', b'c', b'd', b'e']
+    assert points.column('y') == [5.0, 4.0, 3.0, 2.0, 1.0]
+
+    big = points.filter(lambda p: p.y > 2)
+    assert list(big.column('x')) == [10, 11, 12]
+    assert list(points[[True, False, True, False, False]].column('x')) == [10, 12]
+    assert list(points[3:].column('x')) == [13, 14]
+
+    instances = big.to_instances()
+    assert instances == [Point(10, b'a', 5), Point(11, b'b', 4), Point(12, b'c', 3)]
+    assert type(instances[0]) is Point
+    assert points[:1].to_instances(validate=True) == [Point(10, b'a', 5)]
+
+    points.append(Point(20, b'z', 1))
+    assert len(points) == 6 and points[5].tag == b'z'
+
+    other = DataclassArray[Point].from_columns(x=[1, 2], y=[3, 4])
+    assert other.to_instances() == [Point(1, b'', 3), Point(2, b'', 4)]
+
+
+def test_array_empty():
+    from dataclass_property import dataclass, field_property, DataclassArray
+
+    @dataclass
+    class P:
+        x: int = 0
+
+        @field_property(default=0.0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self._y = float(value)
+
+    points = DataclassArray[P].from_columns(x=[], y=[])
+    assert len(points) == 0
+    assert points.to_instances() == []
+
+    points = DataclassArray[P]()
+    points.set_column('y', [])
+    points.set_column('x', [])
+    assert list(points) == []
+
+    Point = make_point_class()
+    points = DataclassArray[Point]()
+    points.set_column('tag', [])
+    points.set_column('y', [])
+    assert points.to_instances() == []
+
+
+def test_array_layouts():
+    import sys
+    from dataclass_property import DataclassArray, FrozenInstanceError
+
+    options = [{'frozen': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'storage': 'compact'}, {'storage': 'compact', 'frozen': True}]
+
+    for kwargs in options:
+        Point = make_point_class(**kwargs)
+        points = DataclassArray[Point](Point(i, str(i).encode(), i) for i in range(3))
+        assert points[1].y == 1.0
+        assert points.to_instances() == [Point(0, b'0', 0), Point(1, b'1', 1), Point(2, b'2', 2)]
+        if kwargs.get('frozen', False):
+            assert hash(points[1]) == hash(Point(1, b'1', 1))
+            try:
+                points[1].x = 5
+                raise AssertionError('Frozen views should not be settable')
+            except FrozenInstanceError:
+                pass
+
+
+def test_array_view_copies():
+    import sys
+    import copy
+    import pickle
+    import dataclasses
+    from dataclass_property import DataclassArray, replace
+
+    options = [{}, {'frozen': True}, {'replace': True, 'state': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'storage': 'compact'}, {'storage': 'compact', 'frozen': True}]
+
+    for kwargs in options:
+        Point = register(make_point_class(**kwargs))  # Pickle finds the class by name
+
+        points = DataclassArray[Point](Point(j, str(j).encode(), j) for j in range(3))
+        row = points[1]
+        assert type(row).__qualname__ != Point.__qualname__
+        assert row == Point(1, b'1', 1) and Point(1, b'1', 1) == row and row != Point(2, b'2', 2)
+        assert row == DataclassArray[Point](points.to_instances())[1] and row != points[2]
+
+        # Copies, pickles and replaced rows are plain instances that do not share the columns
+        for new in (copy.copy(row), copy.deepcopy(row), pickle.loads(pickle.dumps(row)),
+                    dataclasses.replace(row), replace(row), row.__replace__()):
+            assert type(new) is Point and new == Point(1, b'1', 1)
+        assert replace(row, x=5) == dataclasses.replace(row, x=5) == Point(5, b'1', 1)
+        new = copy.copy(row)
+        object.__setattr__(new, 'x', 7)
+        assert points[1].x == 1
+
+
+def test_array_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return  # numpy is optional
+
+    from dataclass_property import DataclassArray
+
+    Point = make_point_class()
+    points = DataclassArray[Point]((Point(i, str(i).encode(), i) for i in range(5)), backend='numpy')
+    assert points.columns['x'].dtype == numpy.int64
+    assert points.columns['_tag'].dtype == object
+    assert points.column('x').sum() == 10
+
+    big = points[points.column('x') > 2]
+    assert big.to_instances() == [Point(3, b'3', 3), Point(4, b'4', 4)]
+    points.set_column('y', numpy.arange(5.0))
+    assert points[4].y == 4.0
+
+
+if __name__ == '__main__':
+    test_array_columns_and_views()
+    test_array_bulk_operations()
+    test_array_empty()
+    test_array_layouts()
+    test_array_view_copies()
+    test_array_numpy()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,126 @@
+import sys
+
+
+def test_asdict_modes():
+    import dataclasses
+    from typing import NamedTuple
+    from dataclass_property import dataclass, field_property, field, asdict, astuple
+
+    class Pair(NamedTuple):
+        a: list
+        b: int
+
+    @dataclasses.dataclass
+    class Plain:
+        z: list
+
+    @dataclass(convert=True)
+    class Point:
+        x: int = 0
+        tags: list = field(default_factory=list)
+
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self._y = value
+
+        @field_property(default=1)
+        def z(self) -> int:  # Computed in the getter
+            return self._z * 10
+
+        @z.setter
+        def z(self, value):
+            self._z = value
+
+    @dataclass(convert=True)
+    class Line:
+        start: Point
+        end: Point
+        points: list = field(default_factory=list)
+        extra: dict = field(default_factory=dict)
+
+    p = Point(1, [[1]], 2, 3)
+    assert p._asdict() == {'x': 1, 'tags': [[1]], 'y': 2, 'z': 30}
+    assert p._asdict()['tags'] is p.tags
+    assert p._asdict('storage') == {'x': 1, 'tags': [[1]], 'y': 2, 'z': 30}
+    assert p._astuple() == (1, [[1]], 2, 30)
+    assert p._astuple('recursive') == astuple(p)
+    assert p._asdict('recursive')['tags'] is not p.tags
+
+    line = Line(p, Point(), [Point(5)], {'pair': Pair([1], 2), 'plain': Plain([3]), 'obj': {1, 2}})
+    d = line._asdict('recursive')
+    assert d == asdict(line)
+    assert d['start'] == p._asdict('recursive')
+    assert isinstance(d['extra']['pair'], Pair) and d['extra']['pair'].a is not line.extra['pair'].a
+    assert d['extra']['plain'] == {'z': [3]}
+    assert d['extra']['obj'] is not line.extra['obj']  # Unknown values are deep copied
+    assert line._astuple('recursive') == astuple(line)
+    assert line._asdict()['start'] is p
+
+    try:
+        p._asdict('deep')
+        raise AssertionError('Invalid mode should raise a ValueError')
+    except ValueError:
+        pass
+
+
+def test_asdict_option():
+    from dataclass_property import dataclass, field, asdict
+
+    @dataclass
+    class Point:
+        x: int = 0
+        tags: list = field(default_factory=list)
+
+    @dataclass(convert=True)
+    class Line:
+        start: Point
+        end: Point
+
+    @dataclass
+    class Child(Line):
+        name: str = ''
+
+    # Nested classes without the option are converted like dataclasses.asdict
+    line = Child(Point(1, [2]), Point(), 'a')
+    assert not hasattr(Point, '_asdict') and not hasattr(Point, '_astuple')
+    assert line._asdict('recursive') == asdict(line)
+    assert line._asdict('recursive')['start']['tags'] is not line.start.tags
+    assert line._astuple() == (line.start, line.end, 'a')
+
+
+def test_asdict_storage():
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    from dataclass_property import dataclass, field_property
+
+    for kwargs in ({'slots': True}, {'storage': 'compact'}):
+        @dataclass(convert=True, **kwargs)
+        class Point:
+            x: int = 0
+            w: float = field_property(default=0.0, passthrough=True)
+
+            @field_property(default=0)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                self._y = value
+
+        p = Point(1, 2.0, 3)
+        expected = {'x': 1, 'w': 2.0, 'y': 3}
+        assert p._asdict() == p._asdict('storage') == p._asdict('recursive') == expected
+        assert p._astuple() == p._astuple('storage') == (1, 2.0, 3)
+
+
+if __name__ == '__main__':
+    test_asdict_modes()
+    test_asdict_option()
+    test_asdict_storage()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,154 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+
+def test_bench_dataclass_smoke():
+    import bench_dataclass
+
+    data = bench_dataclass.run(sizes=[5], repeat=1, number=2)
+    assert data['meta']['dataclass_property']
+    names = {item['benchmark'] for item in data['results']}
+    assert {'decorate', 'init_args', 'getattr', 'asdict', 'replace', 'eq', 'repr'} <= names
+
+    # Same data should never report a regression
+    assert bench_dataclass.compare(data, data) == []
+
+
+def test_bench_passthrough_smoke():
+    import bench_passthrough
+
+    data = bench_passthrough.run(sizes=[5], number=10, repeat=1)
+    assert {item['benchmark'] for item in data['results']} == {'init', 'getattr', 'setattr'}
+    assert all(item['passthrough'] > 0 for item in data['results'])
+
+
+def test_bench_compact_smoke():
+    import bench_compact
+
+    data = bench_compact.run(sizes=[4], number=10, repeat=1)
+    assert {item['layout'] for item in data['results']} == set(bench_compact.LAYOUTS)
+    assert all(item['bytes'] > 0 for item in data['results'])
+
+
+def test_bench_array_smoke():
+    import bench_array
+
+    data = bench_array.run(sizes=[4], repeat=1)
+    item = data['results'][0]
+    assert item['size'] == 4
+    assert item['bytes']['array'] > 0
+
+
+def test_bench_bulk_smoke():
+    import bench_bulk
+
+    data = bench_bulk.run(sizes=[4], repeat=1)
+    item = data['results'][0]
+    assert item['size'] == 4
+    assert item['from_records_dicts'] > 0 and item['from_columns_vectorized'] > 0
+
+
+def test_bench_construct_smoke():
+    import bench_construct
+
+    data = bench_construct.run(sizes=[4], number=10, repeat=1)
+    assert {item['layout'] for item in data['results']} == set(bench_construct.LAYOUTS)
+    assert all(item['init'] > 0 and item['_construct'] > 0 for item in data['results'])
+
+
+def test_bench_defaults_smoke():
+    import bench_defaults
+
+    data = bench_defaults.run(sizes=[4], number=10, repeat=1)
+    assert {item['variant'] for item in data['results']} == set(bench_defaults.VARIANTS)
+    assert all(item['init'] > 0 for item in data['results'])
+
+
+def test_bench_asdict_smoke():
+    import bench_asdict
+
+    data = bench_asdict.run(number=10, repeat=1)
+    assert {item['object'] for item in data['results']} == {'flat', 'nested'}
+    assert all(item['_asdict_recursive'] > 0 for item in data['results'])
+
+
+def test_bench_from_dict_smoke():
+    import bench_from_dict
+
+    data = bench_from_dict.run(sizes=(10,), repeat=1)
+    assert [item['size'] for item in data['results']] == [10]
+    assert all(item['from_dict'] > 0 for item in data['results'])
+
+
+def test_bench_replace_smoke():
+    import bench_replace
+
+    data = bench_replace.run(sizes=(3,), number=10, repeat=1)
+    assert {item['storage'] for item in data['results']} == set(bench_replace.STORAGE)
+    assert all(item['replace'] > 0 for item in data['results'])
+
+
+def test_bench_state_smoke():
+    import bench_state
+
+    data = bench_state.run(sizes=(3,), number=10, repeat=1)
+    assert {item['operation'] for item in data['results']} == set(bench_state.OPERATIONS)
+    assert all(item['generated'] > 0 for item in data['results'])
+
+
+def test_bench_codec_smoke():
+    import bench_codec
+
+    data = bench_codec.run(sizes=(3,), n=10, number=1, repeat=1)
+    assert all(item['packed_bytes'] < item['json_bytes'] for item in data['results'])
+
+
+def test_bench_buffer_smoke():
+    import bench_buffer
+
+    data = bench_buffer.run(counts=(10,), number=1, repeat=1)
+    assert {item['method'] for item in data['results']} == set(bench_buffer.METHODS)
+
+
+def test_bench_record_file_smoke():
+    import bench_record_file
+
+    data = bench_record_file.run(counts=(10,), lookups=5)
+    assert {item['method'] for item in data['results']} == {'record_file', 'pickle'}
+
+
+def test_bench_shared_smoke():
+    import bench_shared
+
+    data = bench_shared.run(counts=(10,), workers=1, repeat=1)
+    assert all(item['shared_memory'] > 0 for item in data['results'])
+
+
+def test_bench_parallel_smoke():
+    import bench_parallel
+
+    data = bench_parallel.run(counts=(20,), workers=1, repeat=1)
+    assert all(item[name] > 0 for item in data['results'] for name in bench_parallel.METHODS)
+
+
+if __name__ == '__main__':
+    test_bench_dataclass_smoke()
+    test_bench_passthrough_smoke()
+    test_bench_compact_smoke()
+    test_bench_array_smoke()
+    test_bench_bulk_smoke()
+    test_bench_construct_smoke()
+    test_bench_defaults_smoke()
+    test_bench_asdict_smoke()
+    test_bench_from_dict_smoke()
+    test_bench_replace_smoke()
+    test_bench_state_smoke()
+    test_bench_codec_smoke()
+    test_bench_buffer_smoke()
+    test_bench_record_file_smoke()
+    test_bench_shared_smoke()
+    test_bench_parallel_smoke()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,121 @@
+import sys
+
+from samples import register, make_point_class
+
+
+def test_buffer_views():
+    from dataclass_property import DataclassBuffer
+
+    options = [{}, {'frozen': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'storage': 'compact'}]
+
+    for kwargs in options:
+        Point = make_point_class(codec=True, **kwargs)
+        points = DataclassBuffer[Point].from_records(Point(i, b'ab', i * 2) for i in range(6))
+        assert DataclassBuffer[Point] is type(points)
+        assert len(points) == 6 and points.record_size == 8 + 4 + 8
+
+        row = points[2]
+        assert isinstance(row, Point)
+        assert repr(row) == repr(Point(2, b'ab\0\0', 4.0))
+        assert (row.x, row.tag, row.y) == (2, b'ab\0\0', 4.0)
+        assert points[-1].x == 5
+        assert points.to_instances() == [Point(i, b'ab\0\0', i * 2) for i in range(6)]
+
+        # Slices share the buffer
+        assert [p.x for p in points[::2]] == [0, 2, 4]
+        assert [p.x for p in points[4:1:-2]] == [4, 2]
+        assert points[::-1][0].x == 5 and points[1:][0].x == 1
+        assert points[::3].buffer.obj is points.buffer.obj
+
+        points[0] = Point(9, b'z', 1.0)  # Packed without running the setters
+        assert (points[0].x, points[0].y) == (9, 1.0)
+        assert points[::3].tobytes() == Point.pack_many([Point(9, b'z', 1.0), Point(3, b'ab', 6)])
+
+        if kwargs.get('frozen'):
+            continue
+
+        # Setters run on the views and write to the buffer
+        evens = points[::2]
+        evens[1].y = 10
+        assert points[2].y == 10.0
+        assert Point.unpack(points.buffer, 2 * points.record_size).y == 10.0
+        try:
+            row.y = -1
+            raise AssertionError('The setter should validate the value')
+        except ValueError:
+            pass
+        row.x = 20
+        assert points.to_instances(validate=True)[2] == Point(20, b'ab\0\0', 10.0)
+
+
+def test_buffer_view_copies():
+    import copy
+    import pickle
+    import dataclasses
+    from dataclass_property import DataclassBuffer, replace
+
+    options = [{}, {'frozen': True}, {'replace': True, 'state': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'storage': 'compact'}]
+
+    for kwargs in options:
+        Point = register(make_point_class(codec=True, **kwargs))  # Pickle finds the class by name
+
+        points = DataclassBuffer[Point].from_records(Point(j, b'ab', j) for j in range(3))
+        row = points[1]
+        expected = Point(1, b'ab\0\0', 1)
+        assert type(row).__qualname__ != Point.__qualname__
+        assert row == expected and expected == row and row != points[2]
+
+        # Copies, pickles and replaced rows are plain instances that do not share the buffer
+        for new in (copy.copy(row), copy.deepcopy(row), pickle.loads(pickle.dumps(row)),
+                    dataclasses.replace(row), replace(row), row.__replace__()):
+            assert type(new) is Point and new == expected
+        assert replace(row, x=5) == dataclasses.replace(row, x=5) == Point(5, b'ab\0\0', 1)
+        new = copy.copy(row)
+        object.__setattr__(new, 'x', 7)
+        assert points[1].x == 1
+
+
+def test_buffer_errors():
+    from dataclass_property import dataclass, DataclassBuffer
+
+    Point = make_point_class(codec=True)
+    try:
+        DataclassBuffer[Point](bytes(21))
+        raise AssertionError('The buffer size must be a multiple of the record size')
+    except ValueError:
+        pass
+
+    points = DataclassBuffer[Point](Point.pack_many([Point(1)]))  # Read only buffer
+    assert points[0].x == 1
+    try:
+        points[0].x = 2
+        raise AssertionError('A read only buffer cannot be changed')
+    except TypeError:
+        pass
+    try:
+        points[1]
+        raise AssertionError('The index is out of range')
+    except IndexError:
+        pass
+
+    @dataclass
+    class Named:
+        name: str = ''
+
+    try:
+        DataclassBuffer[Named].layout()
+        raise AssertionError('str fields cannot be packed')
+    except TypeError:
+        pass
+
+
+if __name__ == '__main__':
+    test_buffer_views()
+    test_buffer_view_copies()
+    test_buffer_errors()
+
+    print('All tests finished successfully!')
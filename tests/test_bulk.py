@@ -0,0 +1,162 @@
+import sys
+
+
+def test_from_records():
+    from dataclass_property import dataclass, field_property, field, InitVar
+
+    calls = []
+
+    @dataclass(bulk=True)
+    class Point:
+        x: int
+        scale: InitVar[int] = 1
+        tags: list = field(default_factory=list)
+
+        @field_property(default=0.0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            if value < 0:
+                raise ValueError('y must be positive')
+            calls.append(value)
+            self._y = float(value)
+
+        def __post_init__(self, scale):
+            self.x *= scale
+
+    points = Point.from_records([{'x': 1}, (2, 3, [1], 4), {'x': 3, 'y': 2}, [4, 1, ['a'], 5]])
+    assert points == [Point(1), Point(2, 3, [1], 4), Point(3, y=2), Point(4, 1, ['a'], 5)]
+    assert points[1].x == 6
+    assert points[0].tags is not points[2].tags
+    assert calls[:4] == [0.0, 4, 2, 5]
+    assert Point.from_records([]) == []
+    assert Point.from_records.__qualname__.endswith('Point.from_records')
+
+    # Records the fast path does not handle are passed to the class
+    assert Point.from_records([(5,)]) == [Point(5)]
+    for records, error in (([{'z': 1}], TypeError), ([{}], TypeError), ([(1, 2, 3, 4, 5)], TypeError),
+                           ([{'x': 1, 'y': -1}], ValueError)):
+        try:
+            Point.from_records(records)
+            raise AssertionError('Invalid record should raise an error')
+        except error:
+            pass
+
+
+def test_from_columns():
+    from dataclass_property import dataclass, field_property, field
+
+    vectorized = []
+
+    @dataclass(frozen=True, bulk=True)
+    class Point:
+        x: int
+        tags: list = field(default_factory=list)
+
+        @field_property(default=0.0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            if value < 0:
+                raise ValueError('y must be positive')
+            object.__setattr__(self, '_y', float(value))
+
+        @y.vectorized
+        def y(self, values):
+            vectorized.append(len(values))
+            if min(values, default=0) < 0:
+                raise ValueError('y must be positive')
+            self._y = [float(value) for value in values]
+
+    points = Point.from_columns(x=[1, 2], y=[3, 4])
+    assert points == [Point(1, y=3.0), Point(2, y=4.0)]
+    assert vectorized == [2]
+    assert isinstance(points[0]._y, float)
+
+    points = Point.from_columns(x=range(3))
+    assert [p.y for p in points] == [0.0, 0.0, 0.0]
+    assert points[0].tags == [] and points[0].tags is not points[1].tags
+    assert Point.from_columns(x=[]) == []
+
+    for columns, error in (({'y': [1]}, TypeError), ({'x': [1], 'z': [1]}, TypeError),
+                           ({'x': [1, 2], 'y': [1]}, ValueError), ({'x': [1], 'y': [-1]}, ValueError)):
+        try:
+            Point.from_columns(**columns)
+            raise AssertionError('Invalid columns should raise an error')
+        except error:
+            pass
+
+
+def test_bulk_layouts():
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    from dataclass_property import dataclass, field_property
+    from dataclass_property.deferred import is_deferred
+
+    for kwargs in ({'slots': True}, {'storage': 'compact'}, {'kw_only': True}):
+        @dataclass(bulk=True, **kwargs)
+        class Point:
+            x: int = 0
+            z: float = field_property(default=0.0, passthrough=True)
+
+            @field_property(default=0)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                self._y = int(value)
+
+        expected = [Point(x=1, z=2.0, y=3), Point(x=4, z=5.0, y=6)]
+        assert Point.from_records([{'x': 1, 'z': 2.0, 'y': 3.5}, {'x': 4, 'z': 5.0, 'y': 6}]) == expected
+        assert Point.from_columns(x=[1, 4], z=[2.0, 5.0], y=[3.5, 6]) == expected
+        if not kwargs.get('kw_only'):
+            assert Point.from_records([(1, 2.0, 3.5), (4, 5.0, 6)]) == expected
+
+    # Accessing the bulk constructors builds a deferred class
+    @dataclass(defer=True, bulk=True)
+    class Deferred:
+        x: int = 0
+
+    assert is_deferred(Deferred)
+    assert Deferred.from_records([{'x': 1}]) == [Deferred(1)]
+    assert not is_deferred(Deferred)
+
+
+def test_bulk_option():
+    from dataclass_property import dataclass
+
+    @dataclass
+    class Plain:
+        x: int = 0
+
+    @dataclass(bulk=True)
+    class Base:
+        x: int = 0
+
+    @dataclass
+    class Child(Base):
+        y: int = 0
+
+    @dataclass(bulk=True, init=False)
+    class NoInit:
+        x: int = 0
+
+    # Only classes that ask for the bulk constructors (or inherit them) get them
+    assert not hasattr(Plain, 'from_records') and not hasattr(Plain, '__dataclass_methods__')
+    assert 'from_records' in Child.__dict__ and Child.from_records([(1, 2)]) == [Child(1, 2)]
+    assert not hasattr(NoInit, 'from_columns')
+
+
+if __name__ == '__main__':
+    test_from_records()
+    test_from_columns()
+    test_bulk_layouts()
+    test_bulk_option()
+
+    print('All tests finished successfully!')
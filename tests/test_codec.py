@@ -0,0 +1,149 @@
+import sys
+
+
+def test_pack_unpack():
+    from dataclass_property import dataclass, field_property, field
+
+    options = [{}, {'frozen': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'storage': 'compact'}, {'storage': 'compact', 'frozen': True}]
+
+    for kwargs in options:
+        calls = []
+
+        @dataclass(codec=True, **kwargs)
+        class Sample:
+            t: int = 0
+            ok: bool = False
+            tag: bytes = field(default=b'', metadata={'struct': '4s'})
+            count: int = field(default=0, metadata={'struct': 'H'})
+
+            @field_property(default=0.0)
+            def value(self) -> float:
+                return self._value
+
+            @value.setter
+            def value(self, value):
+                calls.append(value)
+                object.__setattr__(self, '_value', float(value))
+
+            @field_property(init=False)
+            def kind(self) -> str:  # Read only without storage: not packed
+                return 'sample'
+
+        assert Sample.__dataclass_struct__.format == '<q?4sHd'
+        s = Sample(1, True, b'ab', 3, 2.5)
+        data = s.pack()
+        assert data == Sample.pack(s) and len(data) == Sample.__dataclass_struct__.size
+
+        calls.clear()
+        u = Sample.unpack(data)
+        assert calls == [2.5]
+        assert (u.t, u.ok, u.tag, u.count, u.value, u.kind) == (1, True, b'ab\0\0', 3, 2.5, 'sample')
+        calls.clear()
+        assert Sample.unpack(data, validate=False) == u and calls == []
+
+        buffer = bytearray(len(data) + 2)
+        s.pack_into(buffer, 2)
+        assert Sample.unpack(buffer, 2, validate=False) == u
+
+        records = [Sample(i, tag=b'abcd', value=i / 2) for i in range(5)]  # Shorter bytes are padded with zeros
+        data = Sample.pack_many(records)
+        assert len(data) == 5 * Sample.__dataclass_struct__.size
+        calls.clear()
+        assert list(Sample.iter_unpack(data, validate=False)) == records and calls == []
+        assert list(Sample.iter_unpack(data)) == records and len(calls) == 5
+
+
+def test_codec_fields():
+    from dataclass_property import dataclass, field
+
+    @dataclass
+    class Plain:
+        x: int = 0
+
+    assert not hasattr(Plain, 'pack') and not hasattr(Plain, '__dataclass_struct__')
+
+    @dataclass(codec=True)
+    class Named:
+        x: int = 0
+        name: str = ''
+
+    try:
+        Named().pack()
+        raise AssertionError('str fields cannot be packed')
+    except TypeError:
+        pass
+
+    @dataclass(codec=True)
+    class Base:
+        x: int = 0
+
+    @dataclass
+    class Sub(Base):
+        name: str = ''
+
+    assert Base(1).pack() == (1).to_bytes(8, 'little')
+    try:
+        Sub(1).pack()  # The codec of the base class would lose the name
+        raise AssertionError('Sub.pack should raise TypeError')
+    except TypeError:
+        pass
+
+    try:
+        @dataclass(codec=True)
+        class Invalid:
+            x: int = field(default=0, metadata={'struct': '2i'})
+        raise AssertionError('A struct code must be a single value')
+    except ValueError:
+        pass
+
+
+def test_codec_deferred():
+    from dataclass_property import dataclass, field_property, DataclassBuffer
+    from dataclass_property.deferred import is_deferred
+
+    def make_class():
+        @dataclass(defer=True, codec=True)
+        class Q:
+            t: int = 0
+
+            @field_property(default=0.0)
+            def value(self) -> float:
+                return self._value
+
+            @value.setter
+            def value(self, value):
+                self._value = float(value)
+        return Q
+
+    Q = make_class()
+    data = Q.pack_many([Q(i, i / 2) for i in range(3)])
+
+    # The classmethods build the class
+    Q = make_class()
+    assert is_deferred(Q)
+    assert Q.unpack(data, 8 + 8).value == 0.5
+    assert not is_deferred(Q)
+    Q = make_class()
+    assert [q.t for q in Q.iter_unpack(data)] == [0, 1, 2]
+    Q = make_class()
+    assert DataclassBuffer[Q](data)[2].value == 1.0
+
+    @dataclass(defer=True, codec=True)
+    class NotPacked:
+        name: str = ''
+
+    try:
+        NotPacked.unpack(data)
+        raise AssertionError('NotPacked has no codec')
+    except TypeError:
+        pass
+
+
+if __name__ == '__main__':
+    test_pack_unpack()
+    test_codec_fields()
+    test_codec_deferred()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,206 @@
+
+def test_single_exec_per_class():
+    from dataclass_property import dataclass, field_property
+    from dataclass_property.codegen import FuncBuilder
+
+    compiled = []
+    create_fns = FuncBuilder.create_fns
+
+    def counting_create_fns(self):
+        compiled.append(list(self.names))
+        return create_fns(self)
+
+    FuncBuilder.create_fns = counting_create_fns
+    try:
+        @dataclass(order=True, frozen=True)
+        class Point:
+            x: int = 0
+
+            @field_property(default=1)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                object.__setattr__(self, '_y', value)
+    finally:
+        FuncBuilder.create_fns = create_fns
+
+    assert compiled == [['__init__', '__repr__', '__eq__', '__lt__', '__le__', '__gt__', '__ge__',
+                         '__setattr__', '__delattr__', '__hash__']]
+    assert Point.__init__.__qualname__ == 'test_single_exec_per_class.<locals>.Point.__init__'
+
+
+def test_generated_methods():
+    from dataclass_property import dataclass, field, FrozenInstanceError
+
+    @dataclass(order=True, frozen=True)
+    class Point:
+        x: int
+        y: int = 0
+        z: list = field(default_factory=list, compare=False, repr=False)
+
+    p = Point(1)
+    assert repr(p) == 'test_generated_methods.<locals>.Point(x=1, y=0)'
+    assert p == Point(1, 0, [1])
+    assert p < Point(1, 1)
+    assert hash(p) == hash((1, 0))
+    try:
+        p.x = 2
+        raise AssertionError('Frozen fields cannot be assigned')
+    except FrozenInstanceError:
+        pass
+    try:
+        del p.y
+        raise AssertionError('Frozen fields cannot be deleted')
+    except FrozenInstanceError:
+        pass
+
+    @dataclass
+    class Node:
+        child: object = None
+
+    n = Node()
+    n.child = n
+    assert repr(n) == 'test_generated_methods.<locals>.Node(child=...)'
+    assert Node.__hash__ is None
+
+    try:
+        @dataclass(order=True)
+        class Bad:
+            x: int = 0
+
+            def __lt__(self, other):
+                return True
+        raise AssertionError('order=True cannot overwrite __lt__')
+    except TypeError:
+        pass
+
+    try:
+        @dataclass
+        class BadDefault:
+            x: int = 0
+            y: int
+        raise AssertionError('A field without a default cannot follow a default')
+    except TypeError:
+        pass
+
+
+def test_code_cache_shares_layouts():
+    from dataclass_property import dataclass, DataclassInterface
+
+    cache = DataclassInterface.code_cache
+    cache.clear()
+
+    @dataclass
+    class A:
+        x: int = 1
+        y: str = 'a'
+
+    @dataclass
+    class B:
+        x: float = 2.0
+        y: bytes = b'b'
+
+    info = cache.info()
+    assert info.misses == 1 and info.hits == 1 and info.currsize == 1
+
+    # Same code object, but each class has its own defaults, types and qualified names
+    assert A.__init__.__code__ is B.__init__.__code__
+    assert A() == A(1, 'a') and B() == B(2.0, b'b')
+    assert A.__init__.__annotations__['x'] is int and B.__init__.__annotations__['x'] is float
+    assert repr(B()) == "test_code_cache_shares_layouts.<locals>.B(x=2.0, y=b'b')"
+
+    @dataclass(frozen=True)
+    class C:
+        x: int = 1
+        y: str = 'a'
+
+    assert cache.info().misses == 2
+
+
+def test_code_cache_size():
+    from dataclass_property.codegen import CodeCache
+
+    cache = CodeCache(maxsize=2)
+    for i in range(3):
+        cache.compile('x = {}'.format(i))
+    assert cache.info() == (0, 3, 2, 2)
+    cache.compile('x = 2')
+    assert cache.info().hits == 1
+
+    cache = CodeCache(maxsize=0)
+    cache.compile('x = 1')
+    cache.compile('x = 1')
+    assert cache.info() == (0, 2, 0, 0)
+
+
+def test_disk_code_cache(tmp_path):
+    import os
+    from dataclass_property.codegen import CodeCache, FuncBuilder
+
+    source = 'def __create_fn__():\n def f(self):\n  return 1\n return (f,)'
+    cache = CodeCache(directory=str(tmp_path))
+    code = cache.compile(source)
+    assert cache.disk.writes == 1 and cache.disk.misses == 1
+    files = os.listdir(str(tmp_path))
+    assert len(files) == 1 and files[0].endswith('.dcp')
+
+    # A new process (new in memory cache) loads the code from disk
+    cache = CodeCache(directory=str(tmp_path))
+    loaded = cache.compile(source)
+    assert cache.disk.hits == 1 and cache.disk.writes == 0
+    assert loaded.co_code == code.co_code
+    ns = {}
+    exec(loaded, {}, ns)
+    assert ns['__create_fn__']()[0](None) == 1
+
+    # Invalid files are ignored and replaced
+    filename = os.path.join(str(tmp_path), files[0])
+    with open(filename, 'wb') as f:
+        f.write(b'garbage')
+    cache = CodeCache(directory=str(tmp_path))
+    cache.compile(source)
+    assert cache.disk.misses == 1 and cache.disk.writes == 1
+    assert CodeCache(directory=str(tmp_path)).disk.load(source) is not None
+
+    cache.disk.clear()
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_disk_code_cache_environment(tmp_path):
+    import os
+    import sys
+    import subprocess
+
+    script = (
+        'from dataclass_property import dataclass, DataclassInterface\n'
+        '@dataclass\n'
+        'class Point:\n'
+        '    x: int = 1\n'
+        '    y: int = 2\n'
+        'assert Point() == Point(1, 2)\n'
+        'print(DataclassInterface.code_cache.disk.hits)\n'
+        )
+    env = dict(os.environ, DATACLASS_PROPERTY_CACHE_DIR=str(tmp_path))
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    run = [sys.executable, '-c', script]
+    first = subprocess.check_output(run, env=env, cwd=root).decode().strip()
+    second = subprocess.check_output(run, env=env, cwd=root).decode().strip()
+    assert (first, second) == ('0', '1')
+
+
+if __name__ == '__main__':
+    test_single_exec_per_class()
+    test_generated_methods()
+    test_code_cache_shares_layouts()
+    test_code_cache_size()
+
+    import tempfile
+    import pathlib
+    with tempfile.TemporaryDirectory() as tmp:
+        test_disk_code_cache(pathlib.Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_disk_code_cache_environment(pathlib.Path(tmp))
+
+    print('All tests finished successfully!')
@@ -0,0 +1,123 @@
+import sys
+
+
+def test_compact_storage():
+    if sys.version_info < (3, 10):
+        return  # compact storage requires Python 3.10
+
+    import copy
+    from dataclass_property import dataclass, field_property, astuple, asdict, replace
+    from dataclass_property.compact import CompactAttribute
+
+    @dataclass(storage='compact', order=True, unsafe_hash=True, convert=True, replace=True)
+    class Point:
+        a: int = 0
+        x: float = field_property(default=0.0, passthrough=True)
+        b: str = 'b'
+
+        @field_property(default=1)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self._y = int(value)
+
+    assert Point.__slots__ == ('__dataclass_values__',)
+    assert Point.__dataclass_storage__ == ('a', '_x', 'b', '_y')
+    assert isinstance(Point.__dict__['a'], CompactAttribute)
+    assert isinstance(Point.__dict__['_y'], CompactAttribute)
+
+    p = Point(1, 2.0, 'c', 3.5)
+    assert not hasattr(p, '__dict__')
+    assert p.__dataclass_values__ == [1, 2.0, 'c', 3]
+    assert (p.a, p.x, p.b, p.y, p._x, p._y) == (1, 2.0, 'c', 3, 2.0, 3)
+    p.y = 4.5
+    p.x = 5.0
+    assert p.__dataclass_values__ == [1, 5.0, 'c', 4]
+
+    assert p._astuple() == astuple(p) == (1, 5.0, 'c', 4)
+    assert asdict(p) == {'a': 1, 'x': 5.0, 'b': 'c', 'y': 4}
+    assert p == Point(1, 5.0, 'c', 4) and p != Point(1, 5.0, 'c', 5)
+    assert p < Point(2)
+    assert hash(p) == hash((1, 5.0, 'c', 4))
+    assert replace(p, a=2).__dataclass_values__ == [2, 5.0, 'c', 4]
+
+    c = copy.copy(p)
+    c.a = 10
+    assert p.a == 1 and c.a == 10
+    assert copy.deepcopy(p) == p
+
+    del p.a
+    try:
+        p.a
+        raise AssertionError('Deleted value should raise AttributeError')
+    except AttributeError:
+        pass
+
+
+def test_compact_setter_order():
+    if sys.version_info < (3, 10):
+        return  # compact storage requires Python 3.10
+
+    from dataclass_property import dataclass, field_property
+
+    @dataclass(storage='compact')
+    class TimeDelta:
+        seconds: float = field_property(default=0.0)
+
+        @seconds.getter
+        def seconds(self) -> float:
+            return self._seconds
+
+        @seconds.setter
+        def seconds(self, value):
+            self.milliseconds = int((value % 1) * 1000)
+            self._seconds = int(value)
+
+        milliseconds: int = 0  # Assigned after the setter like normal attributes
+
+    td = TimeDelta(1.5)
+    assert (td.seconds, td.milliseconds) == (1, 0)
+    td.seconds = 2.25
+    assert (td.seconds, td.milliseconds) == (2, 250)
+
+
+def test_compact_frozen_and_inheritance():
+    if sys.version_info < (3, 10):
+        return  # compact storage requires Python 3.10
+
+    import copy
+    from dataclass_property import dataclass, field_property, FrozenInstanceError
+
+    @dataclass(storage='compact', frozen=True)
+    class Base:
+        a: int = 0
+        x: float = field_property(default=0.0, passthrough=True)
+
+    b = Base(1, 2.0)
+    assert hash(b) == hash((1, 2.0))
+    assert copy.deepcopy(b) == b
+    for name in ('a', 'x', '_x'):
+        try:
+            setattr(b, name, 5)
+            raise AssertionError('Frozen instance should not be settable')
+        except FrozenInstanceError:
+            pass
+
+    @dataclass(frozen=True)  # Subclasses of a compact class are compact
+    class Child(Base):
+        c: int = 3
+
+    c = Child(1, 2.0)
+    assert Child.__dataclass_storage__ == ('a', '_x', 'c')
+    assert c.__dataclass_values__ == [1, 2.0, 3]
+    assert not hasattr(c, '__dict__')
+
+
+if __name__ == '__main__':
+    test_compact_storage()
+    test_compact_setter_order()
+    test_compact_frozen_and_inheritance()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,126 @@
+import sys
+
+
+def test_construct():
+    from dataclass_property import dataclass, field_property, field, InitVar
+
+    calls = []
+
+    @dataclass(construct=True)
+    class Point:
+        x: int
+        scale: InitVar[int] = 1
+        tags: list = field(default_factory=list)
+        total: float = field(init=False)
+
+        @field_property(default=0.0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            calls.append(value)
+            self._y = float(value)
+
+        @field_property(default=1)
+        def z(self) -> int:  # Not a single storage attribute. The setter always runs.
+            return self._z * 2
+
+        @z.setter
+        def z(self, value):
+            calls.append(value)
+            self._z = value
+
+        def __post_init__(self, scale):
+            self.x *= scale
+            self.total = self.x + self.y
+
+    p = Point._construct(x=2, y=3, z=4)
+    assert (p.x, p._y, p._z, p.tags) == (2, 3, 4, [])
+    assert calls == [4]
+    assert not hasattr(p, 'total')  # __post_init__ does not run
+
+    p = Point._construct(x=1, tags=[1], total=5.0)
+    assert (p.x, p.y, p.tags, p.total) == (1, 0.0, [1], 5.0)
+    assert Point._construct(x=1).tags is not Point._construct(x=1).tags
+
+    for kwargs in ({}, {'x': 1, 'scale': 2}, {'x': 1, 'w': 2}):
+        try:
+            Point._construct(**kwargs)
+            raise AssertionError('Invalid values should raise a TypeError')
+        except TypeError:
+            pass
+    try:
+        Point._construct(1)
+        raise AssertionError('_construct only takes keyword arguments')
+    except TypeError:
+        pass
+
+    @dataclass(frozen=True, construct_post_init=True)
+    class Frozen:
+        x: int
+        scale: InitVar[int] = 1
+        total: int = field(init=False)
+
+        def __post_init__(self, scale):
+            object.__setattr__(self, 'total', self.x * scale)
+
+    f = Frozen._construct(x=2, scale=3)
+    assert (f.x, f.total) == (2, 6)
+    assert f == Frozen(2, 3)
+
+
+def test_construct_layouts():
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    from dataclass_property import dataclass, field_property, field
+
+    for kwargs in ({'slots': True}, {'storage': 'compact'}, {'storage': 'compact', 'frozen': True}):
+        @dataclass(construct=True, **kwargs)
+        class Point:
+            x: int = 0
+            z: float = field_property(default=0.0, passthrough=True)
+            total: int = field(init=False)
+
+            @field_property(default=0)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                object.__setattr__(self, '_y', int(value))
+
+        p = Point._construct(x=1, z=2.0, y=3.5)
+        assert (p.x, p.z, p.y) == (1, 2.0, 3.5)  # The setter does not run
+        assert not hasattr(p, '__dict__')
+        assert not hasattr(p, 'total')
+        assert Point._construct(x=1, total=2).total == 2
+        assert (Point._construct(total=0).x, Point._construct(total=0).y) == (0, 0)
+
+
+def test_construct_option():
+    from dataclass_property import dataclass
+
+    @dataclass
+    class Plain:
+        x: int = 0
+
+    @dataclass(construct=True)
+    class Base:
+        x: int = 0
+
+    @dataclass
+    class Child(Base):
+        y: int = 0
+
+    assert not hasattr(Plain, '_construct')
+    assert Child._construct(x=1, y=2) == Child(1, 2)
+
+
+if __name__ == '__main__':
+    test_construct()
+    test_construct_layouts()
+    test_construct_option()
+
+    print('All tests finished successfully!')
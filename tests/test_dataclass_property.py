@@ -263,10 +263,99 @@ def test_field_property():
     assert 'p' in d and d['p'] == 0
 
 
+def test_get_return_type_never_calls_factory():
+    import functools
+    from dataclass_property import dataclass, field_property, get_return_type, MISSING
+
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return 1
+
+    def annotated() -> float:
+        calls.append(1)
+        return 1.0
+
+    @functools.wraps(annotated)
+    def wrapper():
+        return annotated()
+
+    assert get_return_type(default_factory=factory) is MISSING
+    assert get_return_type(default_factory=annotated) is float
+    assert get_return_type(default_factory=wrapper) is float
+    assert get_return_type(default_factory=list) is list
+    assert get_return_type(default=5) is int
+    assert not calls
+
+    @dataclass
+    class Props:
+        @field_property(default_factory=factory)
+        def x(self) -> int:
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    assert not calls, 'The default_factory must not run during decoration'
+    assert Props().x == 1
+    assert len(calls) == 1
+
+
+def test_string_return_annotation():
+    from dataclass_property import dataclass
+
+    @dataclass
+    class Props:
+        @property
+        def x(self) -> 'int':
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    assert Props().x == 0
+
+
+def test_subclass_without_annotations():
+    from dataclass_property import dataclass, field_property, fields
+
+    @dataclass
+    class Base:
+        @field_property(default=0)
+        def x(self) -> int:
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+    @dataclass
+    class Child(Base):
+        @field_property(default=1)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self._y = value
+
+    # The annotations of the subclass must not be added to the base class
+    assert [f.name for f in fields(Base)] == ['x']
+    assert [f.name for f in fields(Child)] == ['x', 'y']
+    c = Child(5, 6)
+    assert (c.x, c.y) == (5, 6)
+
+
 if __name__ == '__main__':
     test_normal_property()
     test_dataclass_property_normal_property()
     test_dataclass_property_field_property()
     test_field_property()
+    test_get_return_type_never_calls_factory()
+    test_string_return_annotation()
+    test_subclass_without_annotations()
 
     print('All tests finished successfully!')
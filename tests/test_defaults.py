@@ -0,0 +1,108 @@
+import sys
+
+
+def test_constant_default_factories():
+    from dataclass_property import dataclass, field_property, fields, MISSING
+
+    @dataclass
+    class Point:
+        @field_property
+        def x(self) -> int:
+            return self._x
+
+        @x.setter
+        def x(self, value):
+            self._x = value
+
+        @field_property
+        def tags(self) -> list:
+            return self._tags
+
+        @tags.setter
+        def tags(self, value):
+            self._tags = value
+
+        name: str = field_property(default_factory=str)
+
+        @name.getter
+        def name(self) -> str:
+            return self._name
+
+        @name.setter
+        def name(self, value):
+            self._name = value
+
+    flds = {f.name: f for f in fields(Point)}
+    x, tags, name = flds['x'], flds['tags'], flds['name']
+    assert x.default == 0 and x.default_factory is MISSING
+    assert name.default == '' and name.default_factory is MISSING
+    assert tags.default is MISSING and tags.default_factory is list  # Mutable defaults still use the factory
+
+    p = Point()
+    assert (p.x, p.tags, p.name) == (0, [], '')
+    assert p.tags is not Point().tags
+
+
+def test_validate_defaults():
+    from dataclass_property import dataclass, field_property
+
+    calls = []
+
+    @dataclass(validate_defaults=False, bulk=True)
+    class Point:
+        x: int = 0
+
+        @field_property(default=0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            calls.append(value)
+            self._y = float(value)
+
+        @field_property(default=1)
+        def z(self) -> int:  # Does not read a single storage attribute. The setter always runs.
+            return self._z + 0
+
+        @z.setter
+        def z(self, value):
+            calls.append(value)
+            self._z = value
+
+    p = Point()
+    assert (p.x, p.y, p.z) == (0, 0, 1)
+    assert calls == [1]
+
+    p = Point(1, 2)
+    assert (p.y, calls[-2:]) == (2.0, [2, 1])
+    assert [p.y for p in Point.from_records([{'x': 1}, {'x': 1, 'y': 3}])] == [0, 3.0]
+
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    for kwargs in ({'slots': True}, {'storage': 'compact'}, {'storage': 'compact', 'frozen': True}):
+        calls.clear()
+
+        @dataclass(validate_defaults=False, **kwargs)
+        class Point:
+            x: int = 0
+
+            @field_property(default=0)
+            def y(self) -> float:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                calls.append(value)
+                object.__setattr__(self, '_y', float(value))
+
+        assert (Point().x, Point().y, calls) == (0, 0, [])
+        assert (Point(1, 2).y, calls) == (2.0, [2])
+
+
+if __name__ == '__main__':
+    test_constant_default_factories()
+    test_validate_defaults()
+
+    print('All tests finished successfully!')
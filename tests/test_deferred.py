@@ -0,0 +1,242 @@
+
+def test_defer_on_first_instance():
+    from dataclass_property import dataclass, field_property
+    from dataclass_property.deferred import is_deferred
+
+    calls = []
+
+    @dataclass(defer=True)
+    class Point:
+        x: int = 0
+
+        @field_property
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            calls.append(value)
+            self._y = value
+
+    assert is_deferred(Point)
+    assert 'y' not in Point.__annotations__, 'annotate_properties must be deferred'
+
+    p = Point(1, 2)
+    assert not is_deferred(Point)
+    assert p.x == 1 and p.y == 2 and calls == [2]
+    assert p == Point(1, 2)
+    assert repr(p) == 'test_defer_on_first_instance.<locals>.Point(x=1, y=2)'
+    assert Point.__doc__ == 'Point(x: int = 0, y: int = 0)'
+
+
+def test_defer_on_fields():
+    from dataclass_property import dataclass, fields, is_dataclass
+    from dataclass_property.deferred import is_deferred
+
+    @dataclass(defer=True)
+    class A:
+        x: int = 0
+
+    @dataclass(defer=True)
+    class B:
+        x: int = 0
+
+    assert is_deferred(A) and is_deferred(B)
+    assert [f.name for f in fields(A)] == ['x']
+    assert not is_deferred(A)
+    assert is_dataclass(B)
+    assert not is_deferred(B)
+
+
+def test_defer_inheritance():
+    from dataclass_property import dataclass, fields
+    from dataclass_property.deferred import is_deferred
+
+    @dataclass(defer=True)
+    class Base:
+        x: int = 0
+
+    @dataclass(defer=True)
+    class Child(Base):
+        y: int = 1
+
+    assert is_deferred(Base) and is_deferred(Child)
+    c = Child(2, 3)
+    assert not is_deferred(Base), 'Building the subclass must build its bases'
+    assert (c.x, c.y) == (2, 3)
+    assert [f.name for f in fields(Child)] == ['x', 'y']
+
+    @dataclass(defer=True)
+    class Base2:
+        x: int = 0
+
+    @dataclass
+    class Child2(Base2):
+        y: int = 1
+
+    assert not is_deferred(Base2)
+    assert Child2(4).x == 4
+
+    # Plain subclass creates the first instance
+    @dataclass(defer=True)
+    class Base3:
+        x: int = 0
+
+    class Child3(Base3):
+        def __init__(self, x):
+            super().__init__(x * 2)
+
+    assert Child3(2).x == 4
+    assert not is_deferred(Base3)
+
+
+def test_defer_keeps_user_init():
+    from dataclass_property import dataclass, fields
+
+    @dataclass(defer=True)
+    class Point:
+        x: int = 0
+
+        def __init__(self, value):
+            self.x = value * 2
+
+    assert Point(2).x == 4
+    assert [f.name for f in fields(Point)] == ['x']
+    assert Point(3) == Point(3)
+
+    @dataclass(defer=True, init=False)
+    class NoInit:
+        x: int = 0
+
+    assert NoInit().x == 0
+    assert '__init__' not in NoInit.__dict__
+
+
+def test_defer_threads():
+    import threading
+    from dataclass_property import dataclass, field_property, DataclassInterface
+
+    builds = []
+    process_class = DataclassInterface.__dict__['_process_class']
+
+    def counting_process_class(mcs, cls, *args, **kwargs):
+        builds.append(cls)
+        return process_class.__func__(mcs, cls, *args, **kwargs)
+
+    DataclassInterface._process_class = classmethod(counting_process_class)
+    try:
+        @dataclass(defer=True)
+        class Point:
+            @field_property(default=1)
+            def x(self) -> int:
+                return self._x
+
+            @x.setter
+            def x(self, value):
+                self._x = value
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def create():
+            barrier.wait()
+            results.append(Point(5).x)
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+    finally:
+        DataclassInterface._process_class = process_class
+
+    assert results == [5] * 8
+    assert builds == [Point]
+
+
+def test_defer_slots_error():
+    from dataclass_property import dataclass
+
+    try:
+        @dataclass(defer=True, slots=True)
+        class Point:
+            x: int = 0
+        raise AssertionError('defer=True cannot be used with slots=True')
+    except TypeError:
+        pass  # Should hit here
+
+
+DEFERRED_MODULE = '''
+from dataclass_property import dataclass, field_property
+
+
+@dataclass(defer=True, state=True)
+class Reading:
+    t: int = 0
+
+    @field_property(default=0.0)
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = float(value)
+
+
+class Custom:
+    def __reduce__(self):
+        return Custom, ()
+
+
+@dataclass(defer=True, state=True)
+class CustomChild(Custom):
+    x: int = 0
+'''
+
+
+def test_defer_unpickle_in_new_process():
+    import os
+    import sys
+    import copy
+    import pickle
+    import tempfile
+    import subprocess
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'deferred_models.py'), 'w') as f:
+            f.write(DEFERRED_MODULE)
+        sys.path.insert(0, directory)
+        try:
+            import deferred_models
+            data = pickle.dumps([deferred_models.Reading(1, 2.5), deferred_models.Reading(2)])
+
+            # The class is not built in the new process when the instances are unpickled
+            code = ('import sys, pickle; import deferred_models; '
+                    'from dataclass_property.deferred import is_deferred; '
+                    'assert is_deferred(deferred_models.Reading); '
+                    'r = pickle.loads(sys.stdin.buffer.read()); '
+                    'print(r[0].t, r[0].value, r[1].value, r[0] == deferred_models.Reading(1, 2.5))')
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, root]))
+            out = subprocess.run([sys.executable, '-c', code], input=data, stdout=subprocess.PIPE, env=env,
+                                 check=True)
+            assert out.stdout.decode().split() == ['1', '2.5', '0.0', 'True']
+
+            # Methods that are not generated are removed, so the base class method is used
+            assert copy.copy(deferred_models.CustomChild(1)).__class__ is deferred_models.Custom
+            assert '__reduce_ex__' not in deferred_models.CustomChild.__dict__
+        finally:
+            sys.path.remove(directory)
+            sys.modules.pop('deferred_models', None)
+
+
+if __name__ == '__main__':
+    test_defer_on_first_instance()
+    test_defer_on_fields()
+    test_defer_inheritance()
+    test_defer_keeps_user_init()
+    test_defer_threads()
+    test_defer_slots_error()
+    test_defer_unpickle_in_new_process()
+
+    print('All tests finished successfully!')
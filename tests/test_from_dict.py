@@ -0,0 +1,152 @@
+import sys
+
+
+def test_from_dict_nested():
+    from typing import List, Dict, Optional, Tuple
+    from dataclass_property import dataclass, field_property, field, asdict, from_dict
+
+    @dataclass(construct=True)
+    class Point:
+        x: int = 0
+
+        @field_property(default=0.0)
+        def y(self) -> float:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self._y = float(value)
+
+    @dataclass(decode=True)
+    class Shape:
+        name: str
+        points: List[Point] = field(default_factory=list)
+        named: Dict[str, Point] = field(default_factory=dict)
+        center: Optional[Point] = None
+        bounds: Tuple[Point, Point] = None
+        tags: frozenset = frozenset()
+        area: float = field(default=0.0, init=False)
+
+    shape = Shape('a', [Point(1, 2), Point(3)], {'p': Point(4, 5)}, None, (Point(), Point(1, 1)), frozenset({'x'}))
+    data = asdict(shape)
+    data['tags'] = ['x']  # JSON arrays are lists
+    new = Shape.from_dict(data)
+    assert new == shape
+    assert type(new.points[0]) is Point and type(new.named['p']) is Point and type(new.bounds) is tuple
+    assert new.tags == frozenset({'x'})
+    assert from_dict(Shape, data) == shape
+    assert Shape.from_dict({'name': 'b', 'center': {'x': 1}}) == Shape('b', center=Point(1))
+    assert Shape.from_dict(shape) is shape
+
+    # Skip the setters
+    new = Shape.from_dict({'name': 'a', 'points': [{'x': 1, 'y': 2}]}, validate=False)
+    assert new.points[0].y == 2 and type(new.points[0].y) is int
+
+    # A class that contains itself
+    @dataclass(decode=True)
+    class Tree:
+        value: int = 0
+        children: List['Tree'] = field(default_factory=list)
+
+    tree = Tree(1, [Tree(2, [Tree(3)]), Tree(4)])
+    assert Tree.from_dict(asdict(tree)) == tree
+
+
+def test_from_dict_option():
+    from typing import List
+    from dataclass_property import dataclass, field, from_dict
+
+    @dataclass
+    class Point:
+        x: int = 0
+
+    @dataclass(decode=True)
+    class Shape:
+        points: List[Point] = field(default_factory=list)
+
+    @dataclass
+    class Child(Shape):
+        name: str = ''
+
+    # Classes without the option are decoded with the from_dict function
+    assert not hasattr(Point, 'from_dict')
+    assert from_dict(Point, {'x': 1}) == Point(1)
+    assert Child.from_dict({'points': [{'x': 1}], 'name': 'a'}) == Child([Point(1)], 'a')
+
+
+def test_from_dict_errors():
+    from typing import List, Dict
+    from dataclass_property import dataclass, field_property, field, FromDictError
+
+    @dataclass
+    class Point:
+        x: int = 0
+
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            if value < 0:
+                raise ValueError('y must be positive')
+            self._y = value
+
+    @dataclass(decode=True)
+    class Shape:
+        points: List[Point] = field(default_factory=list)
+        named: Dict[str, Point] = field(default_factory=dict)
+
+    def error(data):
+        try:
+            Shape.from_dict(data)
+        except FromDictError as err:
+            return err
+        raise AssertionError('FromDictError was not raised')
+
+    err = error({'points': [{'y': 1}, {'y': -1}]})
+    assert err.path == 'points[1].y' and isinstance(err.error, ValueError) and err.__cause__ is err.error
+    assert str(err) == 'points[1].y: ValueError: y must be positive'
+    assert error({'named': {'a': {'z': 1}}}).path == "named['a']"
+    assert isinstance(error({'points': [{'y': 1}, 2]}).error, TypeError)
+    assert error({'points': [{'y': 1}, 2]}).path == 'points[1]'
+    assert error({'other': 1}).path == ''
+    assert isinstance(error([1, 2]).error, TypeError)
+
+
+def test_from_dict_storage():
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    from typing import List
+    from dataclass_property import dataclass, field_property, field
+
+    for kwargs in ({'slots': True}, {'storage': 'compact'}, {'defer': True}):
+        @dataclass(construct=True, **kwargs)
+        class Point:
+            x: int = 0
+
+            @field_property(default=0)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                self._y = int(value)
+
+        @dataclass(decode=True, **kwargs)
+        class Line:
+            points: List[Point] = field(default_factory=list)
+
+        line = Line.from_dict({'points': [{'x': 1, 'y': '2'}, {}]})
+        assert line == Line([Point(1, 2), Point()])
+        assert Line.from_dict({'points': [{'y': '2'}]}, validate=False).points[0].y == '2'
+
+
+if __name__ == '__main__':
+    test_from_dict_nested()
+    test_from_dict_option()
+    test_from_dict_errors()
+    test_from_dict_storage()
+
+    print('All tests finished successfully!')
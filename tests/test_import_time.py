@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+
+def test_import_modules():
+    import bench_import
+
+    modules = bench_import.imported_modules()
+    assert 'dataclass_property.interface' in modules
+    forbidden = bench_import.forbidden_modules(modules)
+    assert not forbidden, forbidden
+
+
+def test_import_budget():
+    import bench_import
+
+    # The number of imported modules is a stable proxy for the import time
+    modules = bench_import.package_modules()
+    assert 'dataclasses' not in modules and 'dataclass_property' in modules
+    assert len(modules) <= bench_import.MODULE_BUDGET, modules
+
+
+def test_lazy_imports_on_first_class():
+    import bench_import
+
+    modules = bench_import.imported_modules(statement='dataclass_property.dataclass(type("A", (), {}))')
+    assert 'dataclass_property.state' not in modules
+    modules = bench_import.imported_modules(statement='dataclass_property.dataclass(state=True)(type("A", (), {}))')
+    assert 'dataclass_property.state' in modules
+    assert 'dataclass_property.profiler' not in modules
+
+
+def test_lazy_profiler_import():
+    import dataclass_property
+
+    assert dataclass_property.profile_decoration is dataclass_property.profiler.profile_decoration
+    assert dataclass_property.DecorationProfiler is dataclass_property.profiler.DecorationProfiler
+
+
+if __name__ == '__main__':
+    test_import_modules()
+    test_import_budget()
+    test_lazy_imports_on_first_class()
+    test_lazy_profiler_import()
+
+    print('All tests finished successfully!')
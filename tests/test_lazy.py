@@ -0,0 +1,85 @@
+
+def test_lazy_methods():
+    from dataclass_property import dataclass, field_property
+    from dataclass_property.codegen import LazyMethod, LazyDoc
+
+    @dataclass(order=True, frozen=True, lazy_methods=True)
+    class Point:
+        x: int = 0
+
+        @field_property(default=1)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            object.__setattr__(self, '_y', value)
+
+    for name in ('__repr__', '__eq__', '__lt__', '__le__', '__gt__', '__ge__', '__hash__'):
+        assert isinstance(Point.__dict__[name], LazyMethod), name
+    assert isinstance(Point.__dict__['__doc__'], LazyDoc)
+    assert not isinstance(Point.__dict__['__init__'], LazyMethod)
+
+    p = Point(1, 2)
+    assert p == Point(1, 2)
+    for name in ('__repr__', '__eq__', '__lt__', '__hash__'):
+        assert not isinstance(Point.__dict__[name], LazyMethod), name
+    assert p < Point(2, 2)
+    assert hash(p) == hash((1, 2))
+    assert repr(p) == 'test_lazy_methods.<locals>.Point(x=1, y=2)'
+
+    assert Point.__doc__ == 'Point(x: int = 0, y: int = 1)'
+    assert Point.__dict__['__doc__'] == 'Point(x: int = 0, y: int = 1)'
+
+
+def test_lazy_methods_subclass_and_slots():
+    import sys
+    from dataclass_property import dataclass
+
+    @dataclass(lazy_methods=True)
+    class Base:
+        x: int = 0
+
+    class Child(Base):
+        pass
+
+    # Using the method through the subclass compiles it on the base class
+    assert repr(Child(1)) == 'test_lazy_methods_subclass_and_slots.<locals>.Child(x=1)'
+    assert Base.__dict__['__repr__'].__qualname__.endswith('Base.__repr__')
+    assert '__repr__' not in Child.__dict__
+
+    if sys.version_info < (3, 10):
+        return  # slots=True requires Python 3.10
+
+    @dataclass(slots=True, lazy_methods=True)
+    class Slotted:
+        x: int = 0
+        y: int = 0
+
+    s = Slotted(1, 2)
+    assert not hasattr(s, '__dict__')
+    assert s == Slotted(1, 2) and s != Slotted(1, 3)
+    assert Slotted.__doc__ == 'Slotted(x: int = 0, y: int = 0)'
+
+
+def test_lazy_methods_overwrite_error():
+    from dataclass_property import dataclass
+
+    try:
+        @dataclass(order=True, lazy_methods=True)
+        class Bad:
+            x: int = 0
+
+            def __lt__(self, other):
+                return True
+        raise AssertionError('order=True should not overwrite __lt__')
+    except TypeError:
+        pass  # Should hit here
+
+
+if __name__ == '__main__':
+    test_lazy_methods()
+    test_lazy_methods_subclass_and_slots()
+    test_lazy_methods_overwrite_error()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,63 @@
+from samples import make_user_class
+
+
+def test_build_many():
+    import multiprocessing
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from dataclass_property import build_many
+
+    User = make_user_class(bulk=True, state=True)
+    records = [{'id': i, 'email': 'User{}@Example.com'.format(i)} for i in range(50)] + [(50, 'a@b')]
+    expected = [User(i, 'user{}@example.com'.format(i)) for i in range(50)] + [User(50, 'a@b')]
+
+    assert build_many(User, records, executor=None) == expected
+    assert build_many(User, records, executor='thread', chunksize=7, max_workers=3) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert build_many(User, records, executor=executor) == expected
+
+    if 'fork' in multiprocessing.get_all_start_methods():  # The test class is created at runtime
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('fork')) as executor:
+            users = build_many(User, records, executor=executor, chunksize=8)
+        assert users == expected and users[0].__dict__ == expected[0].__dict__
+
+
+def test_build_many_errors():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from dataclass_property import build_many, BuildError
+
+    User = make_user_class(bulk=True, state=True)
+    records = [{'id': i, 'email': 'invalid' if i in (3, 12) else 'u{}@x'.format(i)} for i in range(20)]
+    records.append({'id': 20, 'other': 1})
+
+    executors = [None, 'thread']
+    if 'fork' in multiprocessing.get_all_start_methods():
+        executors.append(ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('fork')))
+
+    for executor in executors:
+        try:
+            build_many(User, records, executor=executor, chunksize=5)
+            raise AssertionError('BuildError should be raised')
+        except BuildError as err:
+            assert [i for i, _ in err.errors] == [3, 12, 20]
+            assert isinstance(err.errors[0][1], ValueError) and isinstance(err.errors[2][1], TypeError)
+            assert err.results[4] == User(4, 'u4@x') and err.results[3] is None and len(err.results) == 21
+
+        results = build_many(User, records, executor=executor, chunksize=5, errors='return')
+        assert isinstance(results[12], ValueError) and results[13] == User(13, 'u13@x')
+
+        if executor not in (None, 'thread'):
+            executor.shutdown()
+
+    try:
+        build_many(User, records, executor='fibers')
+        raise AssertionError('The executor is not valid')
+    except ValueError:
+        pass
+
+
+if __name__ == '__main__':
+    test_build_many()
+    test_build_many_errors()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,104 @@
+
+def test_passthrough_storage():
+    import operator
+    from dataclass_property import dataclass, field_property, fields
+
+    @dataclass
+    class Point:
+        x: int = field_property(default=1, storage='_x', passthrough=True)
+        z: str = field_property(default='a', passthrough=True)
+
+        @field_property(passthrough=True)
+        def y(self) -> float:
+            return self._y_value
+
+    assert isinstance(Point.x.fget, operator.attrgetter)
+    assert isinstance(Point.y.fget, operator.attrgetter)
+    assert [f.storage for f in fields(Point)] == ['_x', '_z', '_y_value']
+
+    p = Point(2, y=1.5)
+    assert p._x == 2 and p._y_value == 1.5 and p._z == 'a'
+    assert p.x == 2 and p.y == 1.5 and p.z == 'a'
+    p.x = 3
+    assert p._x == 3
+    assert p == Point(3, y=1.5)
+    assert Point().y == 0.0  # default_factory from the getter annotation
+
+    # __init__ writes the storage directly
+    assert '_x' in Point.__init__.__code__.co_names
+    assert 'x' not in Point.__init__.__code__.co_names
+
+
+def test_passthrough_custom_setter():
+    import sys
+    from dataclass_property import dataclass, field_property, fields
+
+    options = [{}, {'frozen': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'storage': 'compact'}]
+
+    for kwargs in options:
+        calls = []
+
+        @dataclass(bulk=True, **kwargs)
+        class Point:
+            @field_property(default=0, passthrough=True)
+            def x(self) -> int:
+                return self._x
+
+            @x.setter
+            def x(self, value):
+                calls.append(value)
+                object.__setattr__(self, '_x', int(value))
+
+        # The custom setter validates the value in __init__ (only the generated setter is bypassed)
+        assert fields(Point)[0].storage is None
+        p = Point(1.5)
+        assert p.x == 1 and calls == [1.5]
+        assert Point.from_records([(2.5,)])[0].x == 2 and calls == [1.5, 2.5]
+        if not kwargs.get('frozen'):
+            p.x = 2
+            assert p.x == 2 and calls == [1.5, 2.5, 2]
+
+
+def test_passthrough_frozen():
+    from dataclass_property import dataclass, field_property, FrozenInstanceError
+
+    @dataclass(frozen=True)
+    class Point:
+        x: int = field_property(default=0, passthrough=True)
+
+    p = Point(1)
+    assert p.x == 1 and hash(p) == hash((1,))
+    try:
+        p.x = 2
+        raise AssertionError('Frozen field should not be settable')
+    except FrozenInstanceError:
+        pass
+
+
+def test_getter_storage():
+    from dataclass_property.field_prop import getter_storage
+
+    def passthrough(self):
+        return self._x
+
+    def computed(self):
+        return self._x + 1
+
+    def other(self):
+        return other._x
+
+    assert getter_storage(passthrough) == '_x'
+    assert getter_storage(computed) is None
+    assert getter_storage(other) is None
+    assert getter_storage(len) is None
+
+
+if __name__ == '__main__':
+    test_passthrough_storage()
+    test_passthrough_custom_setter()
+    test_passthrough_frozen()
+    test_getter_storage()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,82 @@
+
+def test_profile_decoration():
+    from dataclass_property import dataclass, field_property, DataclassInterface, profile_decoration
+
+    original = dict(DataclassInterface.__dict__)
+
+    with profile_decoration() as prof:
+        @dataclass(order=True, replace=True, state=True, codec=True)
+        class Point:
+            x: int = 0
+
+            @field_property(default=1)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                self._y = value
+
+        @dataclass
+        class Other:
+            @property
+            def z(self) -> int:
+                return self._z
+
+            @z.setter
+            def z(self, value):
+                self._z = value
+
+    # Profiling must not change the results
+    p = Point(1, 2)
+    assert p.x == 1 and p.y == 2
+    assert Other().z == 0
+
+    report = prof.report()
+    assert set(report['classes']) == {Point.__qualname__, Other.__qualname__}
+    phases = report['classes'][Point.__qualname__]
+    assert phases['_get_field']['calls'] == 2
+    assert phases['make_field']['calls'] == 2
+    assert phases['_cmp_fn']['calls'] == 5  # __eq__ and 4 ordering methods
+    assert phases['_init_fn']['calls'] == 1
+    assert phases['_replace_fn']['calls'] == 1
+    assert phases['_hash_action']['calls'] == 1
+    assert phases['_state_fns']['calls'] == 1
+    assert phases['_codec_fns']['calls'] == 1
+    assert phases['make_doc']['calls'] == 1
+    assert report['classes'][Other.__qualname__]['get_return_type']['calls'] == 1
+    assert report['aggregate']['_process_class']['calls'] == 2
+    assert report['total'] > 0
+    assert 'total:' in prof.format()
+
+    # The interface is restored when the profiler is disabled
+    assert dict(DataclassInterface.__dict__) == original
+
+    # Phases that the interface does not define are skipped
+    with profile_decoration(phases=['_init_fn', '_not_a_phase']) as prof:
+        @dataclass
+        class Single:
+            x: int = 0
+    assert set(prof.report()['aggregate']) == {'_process_class', 'annotate_properties', '_init_fn'}
+    assert dict(DataclassInterface.__dict__) == original
+
+
+def test_profiler_disabled():
+    from dataclass_property import dataclass, DecorationProfiler
+
+    prof = DecorationProfiler()
+    prof.enable()
+    prof.disable()
+
+    @dataclass
+    class Point:
+        x: int = 0
+
+    assert prof.report()['classes'] == {}
+
+
+if __name__ == '__main__':
+    test_profile_decoration()
+    test_profiler_disabled()
+
+    print('All tests finished successfully!')
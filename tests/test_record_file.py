@@ -0,0 +1,102 @@
+import sys
+
+from samples import make_reading_class
+
+
+def test_record_file():
+    import os
+    import tempfile
+    from dataclass_property import RecordFile
+
+    Reading, calls = make_reading_class()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'readings.rec')
+        with RecordFile(Reading, path) as f:
+            assert len(f) == 0 and list(f) == []
+            f.append(Reading(0, b'abcd', 0.0))
+            f.extend(Reading(i, b'abcd', i / 2) for i in range(1, 10))
+            assert len(f) == 10
+            assert f[3] == Reading(3, b'abcd', 1.5) and f[-1].t == 9
+            f.append(Reading(10, b'abcd', 5.0))  # The file is mapped again
+            assert [s.t for s in f] == list(range(11))
+            assert [s.t for s in f[8:2:-3]] == [8, 5]
+        assert (os.path.getsize(path) - f.header_size) == 11 * Reading.__dataclass_struct__.size
+        assert f.header_size % 8 == 0
+
+        # Append to the existing file
+        with RecordFile(Reading, path) as f:
+            f.append(Reading(11, b'abcd', 5.5))
+            assert len(f) == 12
+
+        with RecordFile(Reading, path, mode='r') as f:
+            calls.clear()
+            assert f[11].value == 5.5 and calls == [5.5]  # Setters run when the records are decoded
+            assert sum(s.value for s in f) == sum(i / 2 for i in range(12))
+            try:
+                f.append(Reading())
+                raise AssertionError('The file is read only')
+            except OSError:
+                pass
+            try:
+                f[12]
+                raise AssertionError('The index is out of range')
+            except IndexError:
+                pass
+
+        with RecordFile(Reading, path, validate=False) as f:
+            calls.clear()
+            assert list(f)[5].value == 2.5 and calls == []
+
+            # Row views change the records in the file
+            records = f.records()
+            records[2].value = 7
+            assert f[2].value == 7.0
+            del records
+
+        with RecordFile(Reading, path, mode='w') as f:
+            assert len(f) == 0
+
+
+def test_record_file_schema():
+    import os
+    import tempfile
+    from dataclass_property import dataclass, field, RecordFile, RecordSchemaError
+
+    Reading, calls = make_reading_class()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'readings.rec')
+        with RecordFile(Reading, path) as f:
+            f.append(Reading(1))
+
+        @dataclass(codec=True)
+        class Other:
+            t: int = 0
+            sensor: bytes = field(default=b'', metadata={'struct': '8s'})
+            value: float = 0.0
+
+        try:
+            RecordFile(Other, path)
+            raise AssertionError('The schema does not match')
+        except RecordSchemaError as err:
+            assert err.found['format'] == '<q4sd' and err.expected['format'] == '<q8sd'
+
+        # The same fields in another class can be read
+        same = make_reading_class(**({'slots': True} if sys.version_info >= (3, 10) else {}))[0]
+        with RecordFile(same, path, mode='r') as f:
+            assert f[0].t == 1
+
+        other_path = os.path.join(tmp, 'other.rec')
+        with open(other_path, 'wb') as f:
+            f.write(b'not a record file')
+        try:
+            RecordFile(Reading, other_path)
+            raise AssertionError('The file has no header')
+        except ValueError:
+            pass
+
+
+if __name__ == '__main__':
+    test_record_file()
+    test_record_file_schema()
+
+    print('All tests finished successfully!')
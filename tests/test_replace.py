@@ -0,0 +1,151 @@
+import sys
+
+
+def test_replace():
+    from dataclass_property import dataclass, field_property, field, replace, InitVar
+
+    calls = []
+
+    @dataclass(replace=True)
+    class Point:
+        x: int = 0
+
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            calls.append(value)
+            self._y = value
+
+        cache: list = field(default_factory=list, init=False)
+
+        @field_property(init=False)
+        def kind(self) -> str:  # Read only
+            return 'point'
+
+    p = Point(1, 2)
+    p.cache.append(1)
+    calls.clear()
+
+    q = replace(p, x=5)
+    assert (q.x, q.y, q.cache, q.kind) == (5, 2, [], 'point')
+    assert calls == []  # The setter of y did not run
+    q = replace(p, y=3)
+    assert calls == [3] and q == Point(1, 3)
+    assert (p.x, p.y, p.cache) == (1, 2, [1])
+
+    # Errors are the same as dataclasses.replace
+    for changes, error in (({'cache': []}, ValueError), ({'kind': 'a'}, ValueError), ({'z': 1}, TypeError)):
+        try:
+            replace(p, **changes)
+            raise AssertionError('replace({}) should raise {}'.format(changes, error.__name__))
+        except error:
+            pass
+
+    # __post_init__ runs with the InitVars
+    @dataclass(replace=True)
+    class Scaled:
+        x: int = 0
+        scale: InitVar[int] = 1
+        offset: InitVar[int] = field(default=0, kw_only=True) if sys.version_info >= (3, 10) else 0
+        scaled: int = field(default=0, init=False)
+
+        def __post_init__(self, scale, offset):
+            self.scaled = self.x * scale + offset
+
+    assert replace(Scaled(2, 3), x=4, scale=2).scaled == 8
+    assert replace(Scaled(2, 3), x=4).scaled == 4  # The default of the InitVar
+
+    @dataclass(replace=True)
+    class Required:
+        x: int
+        scale: InitVar[int]
+
+        def __post_init__(self, scale):
+            pass
+
+    try:
+        replace(Required(1, 2), x=2)
+        raise AssertionError('InitVars without a default must be given')
+    except ValueError:
+        pass
+
+    # Subclasses that are not dataclasses use __init__
+    class Sub(Point):
+        def __init__(self, x=0, y=0):
+            super().__init__(x, y)
+            self.extra = x + y
+
+    assert replace(Sub(1, 2), x=3).extra == 5
+
+
+def test_replace_option():
+    from dataclass_property import dataclass, field_property, replace
+
+    calls = []
+
+    @dataclass
+    class Plain:
+        x: int = 0
+
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            calls.append(value)
+            self._y = value
+
+    @dataclass(replace=True, init=False)
+    class NoInit:
+        x: int = 0
+
+    # Classes without the option use dataclasses.replace, which runs every setter
+    assert '__replace__' not in Plain.__dict__ and '__replace__' not in NoInit.__dict__
+    assert replace(Plain(1, 2), x=3) == Plain(3, 2)
+    assert calls == [2, 2, 2]
+
+
+def test_replace_storage():
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    import copy
+    from dataclass_property import dataclass, field_property, field, replace
+
+    calls = []
+    for kwargs in ({'slots': True}, {'storage': 'compact'}, {'frozen': True}, {'storage': 'compact', 'frozen': True}):
+        @dataclass(replace=True, **kwargs)
+        class Point:
+            x: int = 0
+            w: float = field_property(default=0.0, passthrough=True)
+
+            @field_property(default=0)
+            def y(self) -> int:
+                return self._y
+
+            @y.setter
+            def y(self, value):
+                calls.append(value)
+                object.__setattr__(self, '_y', value)
+
+            n: int = field(default=1, init=False)
+
+        p = Point(1, 2.0, 3)
+        calls.clear()
+        q = replace(p, x=4, w=5.0)
+        assert (q.x, q.w, q.y, q.n, calls) == (4, 5.0, 3, 1, [])
+        assert replace(p, y=6).y == 6 and calls == [6]
+        if sys.version_info >= (3, 13):
+            assert copy.replace(p, x=4) == q
+
+
+if __name__ == '__main__':
+    test_replace()
+    test_replace_option()
+    test_replace_storage()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,66 @@
+from samples import register, make_reading_class
+
+
+def _double_values(readings):
+    # Runs in a worker process
+    with readings:
+        for r in readings:
+            r.value = r.value * 2
+        return len(readings)
+
+
+def test_shared_buffer():
+    import pickle
+    from dataclass_property import SharedDataclassBuffer
+
+    Reading = register(make_reading_class()[0])  # Workers find the class by name
+    with SharedDataclassBuffer[Reading].from_records(Reading(i, b'abcd', i / 2) for i in range(10)) as readings:
+        assert len(readings) == 10 and readings[3].value == 1.5
+
+        # Attach by name
+        other = SharedDataclassBuffer[Reading].attach(readings.name)
+        other[3].value = 4
+        assert readings[3].value == 4.0
+        try:
+            other[3].value = -1
+            raise AssertionError('The setter should validate the value')
+        except ValueError:
+            pass
+        other.close()
+
+        # Pickles only have the name and the range of the slice
+        part = readings[2:8:2]
+        data = pickle.dumps(part)
+        assert len(data) < 200
+        copy = pickle.loads(data)
+        assert [r.t for r in copy] == [2, 4, 6] and copy.name == readings.name
+        copy.close()
+        part.close()  # Does not release the buffer of readings
+        assert readings.to_instances()[9] == Reading(9, b'abcd', 4.5)
+
+    # Created empty
+    with SharedDataclassBuffer[Reading].create(3) as readings:
+        assert readings.to_instances() == [Reading(sensor=bytes(4))] * 3  # Zero filled
+
+
+def test_shared_buffer_workers():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from dataclass_property import SharedDataclassBuffer
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return  # The test class is created at runtime, which requires fork
+
+    Reading = register(make_reading_class()[0])  # Workers find the class by name
+    with SharedDataclassBuffer[Reading].from_records(Reading(i, b'abcd', i) for i in range(100)) as readings:
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('fork')) as executor:
+            sizes = list(executor.map(_double_values, [readings[i:i + 30] for i in range(0, 100, 30)]))
+        assert sizes == [30, 30, 30, 10]
+        assert [r.value for r in readings] == [i * 2.0 for i in range(100)]
+
+
+if __name__ == '__main__':
+    test_shared_buffer()
+    test_shared_buffer_workers()
+
+    print('All tests finished successfully!')
@@ -0,0 +1,134 @@
+import sys
+
+
+def test_slots_backing_attributes():
+    if sys.version_info < (3, 10):
+        return  # slots requires Python 3.10
+
+    import copy
+    import weakref
+    from typing import Union
+    from dataclass_property import dataclass
+
+    @dataclass(slots=True, weakref_slot=True)
+    class TimeDelta:
+        hours: int = 0
+        minutes: int = 0
+        milliseconds: int = 0
+
+        @property
+        def seconds(self) -> int:
+            return self._seconds
+
+        @seconds.setter
+        def seconds(self, value: Union[int, float]):
+            if isinstance(value, float):
+                mill = int((value % 1) * 1000)
+                if mill:
+                    self.milliseconds = mill
+            self._seconds = int(value)
+
+    assert TimeDelta.__slots__ == ('hours', 'minutes', 'milliseconds', '_seconds', '__weakref__')
+    assert isinstance(TimeDelta.seconds, property)
+
+    td = TimeDelta(seconds=1.5)
+    assert not hasattr(td, '__dict__')
+    assert td.seconds == 1 and td.milliseconds == 500
+    assert weakref.ref(td)() is td
+    assert copy.deepcopy(td) == td
+
+
+def test_slots_declared_storage():
+    if sys.version_info < (3, 10):
+        return  # slots requires Python 3.10
+
+    import copy
+    from dataclass_property import dataclass, field_property, FrozenInstanceError
+
+    @dataclass(slots=True, frozen=True)
+    class Point:
+        x: int = field_property(default=0, passthrough=True)
+
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            object.__setattr__(self, '_y', int(value))
+
+        @field_property(default=0, storage=('_z', '_z_str'))
+        def z(self) -> int:
+            return self._z
+
+        @z.setter
+        def z(self, value):
+            object.__setattr__(self, '_z', value)
+            object.__setattr__(self, '_z_str', str(value))
+
+    assert Point.__slots__ == ('_x', '_y', '_z', '_z_str')
+
+    p = Point(1, 2.0, 3)
+    assert not hasattr(p, '__dict__')
+    assert (p.x, p.y, p.z, p._z_str) == (1, 2, 3, '3')
+    assert copy.deepcopy(p) == p
+    for name in ('x', '_x'):
+        try:
+            setattr(p, name, 5)
+            raise AssertionError('Frozen instance should not be settable')
+        except FrozenInstanceError:
+            pass
+
+
+def test_slots_inheritance():
+    if sys.version_info < (3, 10):
+        return  # slots requires Python 3.10
+
+    from dataclass_property import dataclass, field_property
+
+    @dataclass(slots=True)
+    class Base:
+        x: int = field_property(default=0, passthrough=True)
+
+    @dataclass(slots=True)
+    class Child(Base):
+        @field_property(default=0)
+        def y(self) -> int:
+            return self._y
+
+        @y.setter
+        def y(self, value):
+            self._y = value
+            self.x = value  # Inherited property. Must not get a slot.
+
+    assert Child.__slots__ == ('_y',)
+    c = Child(1, 2)
+    assert not hasattr(c, '__dict__')
+    assert (c.x, c.y) == (2, 2)
+
+
+def test_setter_storage():
+    from dataclass_property.field_prop import setter_storage
+
+    def setter(self, value):
+        object.__setattr__(self, '_a', value)
+        self._b = int(value)
+        del self._c
+        other._d = value
+        if value:
+            self.e = value
+
+    def other():
+        pass
+
+    assert setter_storage(setter) == ('_a', '_b', '_c', 'e')
+    assert setter_storage(other) == ()
+
+
+if __name__ == '__main__':
+    test_slots_backing_attributes()
+    test_slots_declared_storage()
+    test_slots_inheritance()
+    test_setter_storage()
+
+    print('All tests finished successfully!')
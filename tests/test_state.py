@@ -0,0 +1,112 @@
+import sys
+
+from samples import register, make_record_class
+
+
+def test_copy_and_pickle():
+    import copy
+    import array
+    import pickle
+
+    options = [{}, {'frozen': True}, {'validate_state': True}]
+    if sys.version_info >= (3, 10):
+        options += [{'slots': True}, {'slots': True, 'frozen': True}, {'storage': 'compact'},
+                    {'storage': 'compact', 'frozen': True}, {'storage': 'compact', 'validate_state': True}]
+
+    for kwargs in options:
+        Record, calls = make_record_class(state=True, **kwargs)
+        r = Record(x=1, data=array.array('d', [1.0, 2.0]), items=[[1]], y=2)
+        calls.clear()
+
+        c = copy.copy(r)
+        assert c == r and c.items is r.items
+        d = copy.deepcopy(r)
+        assert d == r and d.items is not r.items and d.items[0] is not r.items[0] and d.data is not r.data
+        assert calls == []  # Copies do not run the setters
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(r, protocol)) == r
+        assert calls == ([2] * (pickle.HIGHEST_PROTOCOL + 1) if kwargs.get('validate_state') else [])
+
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            buffers = []
+            data = pickle.dumps(r, 5, buffer_callback=buffers.append)
+            assert len(buffers) == 1  # The array data is out-of-band
+            assert pickle.loads(data, buffers=buffers) == r
+
+
+def test_copy_other_attributes():
+    import copy
+    import pickle
+
+    Record, calls = make_record_class(state=True)
+    r = Record(x=1)
+    r.extra = [1]  # Not a field: the state of object.__reduce_ex__ is used
+    assert copy.copy(r).extra is r.extra
+    assert copy.deepcopy(r).extra == [1] and copy.deepcopy(r).extra is not r.extra
+    assert pickle.loads(pickle.dumps(r)).extra == [1]
+
+    class Sub(Record):
+        pass
+
+    register(Sub)  # Pickle finds the class by name
+    s = Sub(x=2)
+    s.extra = 1
+    assert copy.copy(s).extra == 1 and pickle.loads(pickle.dumps(s)).extra == 1
+
+    # Recursive values
+    r.items.append(r)
+    d = copy.deepcopy(r)
+    assert d.items[0] is d
+
+
+def test_state_option():
+    import copy
+    import pickle
+    from dataclass_property import dataclass
+
+    @dataclass
+    class Plain:
+        x: list = None
+
+    # Classes without the option keep the copy and pickle behavior of dataclasses
+    assert not any(name in Plain.__dict__ for name in ('__getstate__', '__setstate__', '__reduce_ex__', '__copy__'))
+    p = Plain([1])
+    assert copy.copy(p).x is p.x and copy.deepcopy(p).x is not p.x
+
+    Record, calls = make_record_class(state=True)
+    assert '__reduce_ex__' in Record.__dict__
+
+    @dataclass
+    class Child(Record):
+        z: int = 0
+
+    register(Child)
+    assert '__reduce_ex__' in Child.__dict__  # Dataclass subclasses inherit the option
+    assert pickle.loads(pickle.dumps(Child(y=2, z=3))) == Child(y=2, z=3)
+
+    if sys.version_info < (3, 10):
+        return  # slots and compact storage require Python 3.10
+
+    # Compact classes and frozen classes with slots always get the methods
+    for kwargs in ({'storage': 'compact'}, {'slots': True, 'frozen': True}):
+        @dataclass(**kwargs)
+        class Point:
+            x: int = 0
+            items: list = None
+
+        register(Point)
+        p = Point(1, [2])
+        assert '__reduce_ex__' in Point.__dict__
+        assert pickle.loads(pickle.dumps(p)) == p
+        if kwargs.get('storage'):
+            c = copy.copy(p)
+            assert c.__dataclass_values__ is not p.__dataclass_values__ and c.items is p.items
+
+
+if __name__ == '__main__':
+    test_copy_and_pickle()
+    test_copy_other_attributes()
+    test_state_option()
+
+    print('All tests finished successfully!')